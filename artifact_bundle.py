@@ -0,0 +1,228 @@
+"""Versioned single-file bundle of the model artifacts.
+
+One file (career_artifacts.bundle, built by build_artifacts.py) replaces the
+loose pickles, JSON files, career vectors and tokenizer files:
+
+    8 bytes   magic b"CAREERAB"
+    u32       format version
+    u64       manifest length
+    manifest  JSON: bundle version, build info and one entry per section
+              (kind, offset, size, sha256, and dtype/shape for arrays)
+    sections  each starting on a 64-byte boundary
+
+Sections are "array" (raw C-order data, memory-mapped without copying),
+"json" or "bytes". Opening a bundle maps the file once and walks the
+sections in file order, checking every checksum, so a torn or edited
+bundle is rejected before anything uses it.
+
+A model directory's bundle is <model dir>/career_artifacts.bundle; the app
+reads the one in CAREER_MODEL_DIR (default: model/ next to the code). Set
+CAREER_BUNDLE_VERIFY=0 to skip the checksum pass.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+
+BUNDLE_FILE = "career_artifacts.bundle"
+BUNDLE_MAGIC = b"CAREERAB"
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_HEADER = struct.Struct("<8sIQ")
+SECTION_ALIGNMENT = 64
+SECTION_KINDS = ("array", "json", "bytes")
+
+_bundles = {}
+_bundles_lock = threading.Lock()
+
+
+class BundleError(ValueError):
+    """The file is not a readable bundle of a supported version."""
+
+
+def align(offset):
+    return -(-offset // SECTION_ALIGNMENT) * SECTION_ALIGNMENT
+
+
+def get_verify_checksums():
+    return os.environ.get("CAREER_BUNDLE_VERIFY", "1").strip().lower() not in ("0", "false", "no")
+
+
+def get_bundle_path(model_dir):
+    return os.path.join(model_dir, BUNDLE_FILE)
+
+
+class BundleWriter:
+    """Collects sections in memory and writes them as one bundle."""
+
+    def __init__(self, build_info=None):
+        self.build_info = dict(build_info or {})
+        self.sections = []
+
+    def add_array(self, name, array, meta=None):
+        array = np.ascontiguousarray(array)
+        if array.dtype.hasobject:
+            raise ValueError(f"Section {name}: object arrays cannot be memory-mapped")
+        entry = {"kind": "array", "dtype": array.dtype.str, "shape": list(array.shape)}
+        self.add(name, entry, memoryview(array).cast("B"), meta)
+
+    def add_json(self, name, value, meta=None):
+        self.add(name, {"kind": "json"}, json.dumps(value, ensure_ascii=False).encode("utf-8"), meta)
+
+    def add_bytes(self, name, data, meta=None):
+        self.add(name, {"kind": "bytes"}, bytes(data), meta)
+
+    def add(self, name, entry, data, meta=None):
+        if any(existing == name for existing, _, _ in self.sections):
+            raise ValueError(f"Duplicate bundle section: {name}")
+        entry = {**entry, "size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+        if meta:
+            entry["meta"] = meta
+        self.sections.append((name, entry, data))
+
+    def manifest(self, data_start):
+        """Manifest with section offsets counted from data_start."""
+        digest = hashlib.sha256()
+        sections = {}
+        offset = data_start
+        for name, entry, data in self.sections:
+            sections[name] = {**entry, "offset": offset}
+            digest.update(f"{name}\0{entry['sha256']}\0".encode("utf-8"))
+            offset = align(offset + len(data))
+        created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        return {
+            "format_version": BUNDLE_FORMAT_VERSION,
+            "version": f"{created[:10].replace('-', '')}-{digest.hexdigest()[:12]}",
+            "created": created,
+            "build": self.build_info,
+            "sections": sections,
+        }
+
+    def write(self, path):
+        """Write the bundle under a temporary name and rename it into place.
+        Returns the manifest."""
+        # Offsets depend on the manifest length, which depends on the offsets
+        data_start = 0
+        while True:
+            manifest = self.manifest(data_start)
+            encoded = json.dumps(manifest, ensure_ascii=False, sort_keys=True).encode("utf-8")
+            needed = align(BUNDLE_HEADER.size + len(encoded))
+            if needed == data_start:
+                break
+            data_start = needed
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, len(encoded)))
+            f.write(encoded)
+            for name, _, data in self.sections:
+                f.write(b"\0" * (manifest["sections"][name]["offset"] - f.tell()))
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return manifest
+
+
+class ArtifactBundle:
+    """A bundle opened read-only: arrays are views of one memory map, JSON
+    sections are decoded once."""
+
+    def __init__(self, path, verify=None):
+        self.path = os.path.abspath(path)
+        verify = get_verify_checksums() if verify is None else verify
+        with open(self.path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.manifest = self.read_manifest()
+            self.values = {}
+            for name, entry in sorted(self.manifest["sections"].items(), key=lambda item: item[1]["offset"]):
+                self.values[name] = self.read_section(name, entry, verify)
+        except Exception:
+            self.close()
+            raise
+
+    def read_manifest(self):
+        if len(self.map) < BUNDLE_HEADER.size:
+            raise BundleError(f"{self.path} is too short to be a bundle")
+        magic, version, length = BUNDLE_HEADER.unpack_from(self.map, 0)
+        if magic != BUNDLE_MAGIC:
+            raise BundleError(f"{self.path} is not an artifact bundle")
+        if version != BUNDLE_FORMAT_VERSION:
+            raise BundleError(f"{self.path} has bundle format {version}, expected {BUNDLE_FORMAT_VERSION}")
+        try:
+            return json.loads(self.map[BUNDLE_HEADER.size:BUNDLE_HEADER.size + length].decode("utf-8"))
+        except ValueError as e:
+            raise BundleError(f"{self.path} has an unreadable manifest: {e}")
+
+    def read_section(self, name, entry, verify):
+        offset, size = entry["offset"], entry["size"]
+        if entry.get("kind") not in SECTION_KINDS:
+            raise BundleError(f"Section {name} has unknown kind {entry.get('kind')}")
+        if offset + size > len(self.map):
+            raise BundleError(f"Section {name} runs past the end of {self.path}")
+        view = memoryview(self.map)[offset:offset + size]
+        if verify and hashlib.sha256(view).hexdigest() != entry["sha256"]:
+            raise BundleError(f"Checksum mismatch in section {name} of {self.path}")
+        if entry["kind"] == "array":
+            return np.frombuffer(view, dtype=np.dtype(entry["dtype"])).reshape(entry["shape"])
+        if entry["kind"] == "json":
+            return json.loads(bytes(view).decode("utf-8"))
+        return view
+
+    @property
+    def version(self):
+        return self.manifest["version"]
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def meta(self, name):
+        return self.manifest["sections"][name].get("meta", {})
+
+    def array(self, name):
+        """Read-only array backed by the memory map."""
+        return self.values[name]
+
+    def json(self, name):
+        return self.values[name]
+
+    def bytes(self, name):
+        return bytes(self.values[name])
+
+    def get(self, name, default=None):
+        return self.values.get(name, default)
+
+    def close(self):
+        # Views handed out keep the map alive until they are released
+        try:
+            self.map.close()
+        except BufferError:
+            pass
+
+
+def load_bundle(model_dir):
+    """The bundle for model_dir, opened once per file version and shared, or
+    None if there is none or it cannot be read (loose files are used then)."""
+    path = os.path.abspath(get_bundle_path(model_dir))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _bundles_lock:
+        cached = _bundles.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            bundle = ArtifactBundle(path)
+        except (OSError, BundleError) as e:
+            print(f"Ignoring artifact bundle {path}: {e}")
+            bundle = None
+        _bundles[path] = (key, bundle)
+        return bundle
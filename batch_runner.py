@@ -0,0 +1,247 @@
+"""Batch runner for JSONL queues of student profiles.
+
+Tails a JSONL file, or every *.jsonl file in a directory (new files are
+picked up as they appear), and runs complete lines through the
+recommendation engine in micro-batches. Each input line is one profile,
+either a selections dict as produced by the input form or
+{"id": ..., "tenant": ..., "selections": {...}}. One result line is
+appended to the output JSONL per input line:
+
+    {"id": "...", "source": "intake.jsonl", "offset": 1234, "recommendations": [["Doctor", 0.91], ...]}
+    {"id": "intake.jsonl:1300", "source": "intake.jsonl", "offset": 1300, "error": "..."}
+
+Records without an "id" are identified by source and offset. A record that
+is not a profile, or that the engine fails on, gets an "error" line; the
+rest of its batch is still served.
+
+After each batch the output is flushed and the checkpoint (byte offset per
+input file, plus the output length) is replaced atomically. On restart the
+output is cut back to the checkpointed length and reading resumes at the
+checkpointed offsets, so every line is processed exactly once. A line is
+only read once its newline has been written; a file that shrinks or is
+replaced is read again from the start.
+
+    python batch_runner.py intake/ results.jsonl
+    python batch_runner.py intake.jsonl results.jsonl --once --batch-size 64
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from recommender import RecommendationEngine, normalize_selections
+
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_POLL_INTERVAL = 1.0
+CHECKPOINT_VERSION = 1
+
+
+def read_checkpoint(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return None
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}")
+    return checkpoint
+
+
+def write_checkpoint(path, checkpoint):
+    """Replace the checkpoint in one rename, so a crash leaves the old or the new one."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def parse_record(line):
+    """(id, tenant, selections) for one input line; raises ValueError if it is not a profile."""
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("record is not a JSON object")
+    selections = normalize_selections(record.get("selections", record))
+    return record.get("id") or record.get("request_id"), record.get("tenant"), selections
+
+
+class JsonlBatchRunner:
+    """Tails source (a JSONL file or a directory of them) into output.
+
+    recommend_batch(tenant, [selections]) returns one recommendation list per
+    profile; tenant is None unless records name one.
+    """
+
+    def __init__(self, source, output, recommend_batch, checkpoint=None, batch_size=DEFAULT_BATCH_SIZE,
+                 poll_interval=DEFAULT_POLL_INTERVAL):
+        self.source = os.path.abspath(source)
+        self.output = os.path.abspath(output)
+        self.checkpoint_path = os.path.abspath(checkpoint or f"{output}.checkpoint.json")
+        self.recommend_batch = recommend_batch
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.files = {}
+        self.output_offset = 0
+        self.processed = 0
+        self.errors = 0
+        self.restore()
+
+    def restore(self):
+        """Resume from the checkpoint, dropping output written after it."""
+        checkpoint = read_checkpoint(self.checkpoint_path)
+        if checkpoint is None:
+            return
+        self.files = checkpoint.get("files", {})
+        self.output_offset = checkpoint.get("output_offset", 0)
+        if os.path.exists(self.output) and os.path.getsize(self.output) > self.output_offset:
+            with open(self.output, "r+b") as f:
+                f.truncate(self.output_offset)
+        print(f"👉 Resuming {len(self.files)} input file(s) from {self.checkpoint_path}")
+
+    def input_files(self):
+        if not os.path.isdir(self.source):
+            return [self.source] if os.path.exists(self.source) else []
+        ignored = {self.output, self.checkpoint_path}
+        return [path for path in sorted(glob.glob(os.path.join(self.source, "*.jsonl"))) if path not in ignored]
+
+    def read_lines(self, limit):
+        """Up to limit complete new lines as (path, offset, line bytes), across input files in order."""
+        lines = []
+        for path in self.input_files():
+            if len(lines) >= limit:
+                break
+            stat = os.stat(path)
+            state = self.files.get(path)
+            if state is None or state["inode"] != stat.st_ino or stat.st_size < state["offset"]:
+                # New, replaced or truncated file: read it from the start
+                state = self.files[path] = {"inode": stat.st_ino, "offset": 0}
+            if stat.st_size == state["offset"]:
+                continue
+            with open(path, "rb") as f:
+                f.seek(state["offset"])
+                offset = state["offset"]
+                while len(lines) < limit:
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        break  # end of file, or a line still being written
+                    lines.append((path, offset, line))
+                    offset += len(line)
+        return lines
+
+    def process(self, lines):
+        """Run one micro-batch; returns one result record per line."""
+        results = [None] * len(lines)
+        groups = {}
+        for idx, (path, offset, line) in enumerate(lines):
+            source = os.path.relpath(path, os.path.dirname(self.source))
+            base = {"id": f"{source}:{offset}", "source": source, "offset": offset}
+            try:
+                record_id, tenant, selections = parse_record(line.decode("utf-8"))
+            except ValueError as e:
+                results[idx] = {**base, "error": f"invalid record: {e}"}
+                continue
+            results[idx] = {**base, "id": record_id} if record_id is not None else base
+            groups.setdefault(tenant, []).append((idx, selections))
+
+        for tenant, items in groups.items():
+            try:
+                self.recommend_items(tenant, items, results)
+            except Exception:
+                # One bad profile must not fail the batch, nor stall the queue on
+                # every restart: retry one by one so only the bad ones error
+                for item in items:
+                    try:
+                        self.recommend_items(tenant, [item], results)
+                    except Exception as e:
+                        results[item[0]]["error"] = f"{type(e).__name__}: {e}"
+        return results
+
+    def recommend_items(self, tenant, items, results):
+        """Fill in results for (index, selections) items of one tenant."""
+        start = time.perf_counter()
+        recommendations = self.recommend_batch(tenant, [selections for _, selections in items])
+        per_profile_ms = (time.perf_counter() - start) * 1000.0 / len(items)
+        for (idx, _), recommended in zip(items, recommendations):
+            results[idx]["recommendations"] = [[career, round(float(score), 6)] for career, score in recommended]
+            results[idx]["ms"] = round(per_profile_ms, 3)
+
+    def commit(self, lines, results):
+        """Append results, then move the checkpoint past the lines they came from."""
+        data = "".join(json.dumps(result, ensure_ascii=False) + "\n" for result in results).encode("utf-8")
+        with open(self.output, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.output_offset += len(data)
+        for path, offset, line in lines:
+            self.files[path]["offset"] = offset + len(line)
+        write_checkpoint(self.checkpoint_path, {
+            "version": CHECKPOINT_VERSION,
+            "output": self.output,
+            "output_offset": self.output_offset,
+            "files": self.files,
+        })
+        self.processed += len(results)
+        self.errors += sum(1 for result in results if "error" in result)
+
+    def run_once(self):
+        """Process every complete line available now. Returns the number processed."""
+        total = 0
+        while True:
+            lines = self.read_lines(self.batch_size)
+            if not lines:
+                return total
+            self.commit(lines, self.process(lines))
+            total += len(lines)
+
+    def run(self, once=False):
+        """Process new lines until interrupted (or, with once, until caught up)."""
+        try:
+            while True:
+                if self.run_once():
+                    print(f"  {self.processed} profiles processed ({self.errors} errors)")
+                elif once:
+                    break
+                else:
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            print("Stopped; the checkpoint is up to date")
+        return self.processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run JSONL profile queues through the recommendation engine.")
+    parser.add_argument("source", help="JSONL file, or directory of *.jsonl files, to tail")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL)
+    parser.add_argument("--once", action="store_true", help="exit once all current lines are processed")
+    parser.add_argument("--tenants", action="store_true",
+                        help="serve records' \"tenant\" from the catalog registry (CAREER_CATALOG_DIR)")
+    args = parser.parse_args()
+
+    if args.tenants:
+        from catalog_registry import DEFAULT_TENANT, CatalogRegistry
+
+        registry = CatalogRegistry()
+
+        def recommend_batch(tenant, selections_list):
+            return registry.recommend_batch(tenant or DEFAULT_TENANT, selections_list)
+    else:
+        engine = RecommendationEngine.load()
+
+        def recommend_batch(tenant, selections_list):
+            return engine.recommend_batch(selections_list)
+
+    runner = JsonlBatchRunner(args.source, args.output, recommend_batch, args.checkpoint,
+                              args.batch_size, args.poll_interval)
+    processed = runner.run(once=args.once)
+    print(f"✅ {processed} profiles processed, results in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Artifact loading: loose files versus the single artifact bundle.
+
+Packs the checked-in artifacts (career_model.pkl, career_vectors.npy, the
+encoders and tokenizer files) into a temporary bundle with build_artifacts.pack_bundle, then times loading everything the
+app needs at startup both ways: the catalog JSON (a loose file in both),
+the classifier (unpickled sklearn pipeline versus exported arrays), the
+career vectors and the fast tokenizer. The bundle is timed with and
+without the checksum pass, and the classifier on its own.
+
+    python benchmarks/bench_artifacts.py --repeat 20 --output artifacts.json
+"""
+import argparse
+import json
+import os
+import tempfile
+
+import joblib
+import numpy as np
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, timed, write_results,
+)
+
+from artifact_bundle import ArtifactBundle
+from build_artifacts import CLASSIFIER_FILE, pack_bundle
+from career_data import BASE_DIR
+from embedding_store import read_manifest
+from text_classifier import load_text_classifier
+from text_preprocessing import ProfileTokenizer
+
+
+def load_details(model_dir):
+    with open(os.path.join(model_dir, "career_details.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_loose(model_dir):
+    details = load_details(model_dir)
+    model = joblib.load(os.path.join(model_dir, CLASSIFIER_FILE))
+    vectors = np.load(os.path.join(model_dir, "career_vectors.npy"), mmap_mode="r")
+    return details, model, vectors, ProfileTokenizer.from_dir(model_dir)
+
+
+def load_bundled(path, verify):
+    bundle = ArtifactBundle(path, verify=verify)
+    model = load_text_classifier(bundle)
+    # The catalog JSON is read from the loose file either way
+    details = load_details(BASE_DIR)
+    return details, model, bundle.array("career_vectors"), ProfileTokenizer.from_bundle(bundle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    stages = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "career_artifacts.bundle")
+        vectors_path = os.path.join(BASE_DIR, "career_vectors.npy")
+        manifest = pack_bundle(path, BASE_DIR, os.path.join(BASE_DIR, CLASSIFIER_FILE),
+                               vectors_path, read_manifest(vectors_path))
+        print(f"👉 Bundle {manifest['version']}: {len(manifest['sections'])} sections, "
+              f"{os.path.getsize(path) / 1024:.1f} KB")
+
+        # Warm the page cache and the imports the loaders pull in
+        load_loose(BASE_DIR)
+        load_bundled(path, True)
+        for name, load in [
+            ("loose_files", lambda: load_loose(BASE_DIR)),
+            ("bundle/verified", lambda: load_bundled(path, True)),
+            ("bundle/unverified", lambda: load_bundled(path, False)),
+        ]:
+            stages[name] = summarize([timed(load)[1] for _ in range(args.repeat)])
+        stages["bundle/open_only"] = summarize(
+            [timed(ArtifactBundle, path, verify=True)[1] for _ in range(args.repeat)]
+        )
+        bundle = ArtifactBundle(path)
+        stages["classifier/joblib"] = summarize(
+            [timed(joblib.load, os.path.join(BASE_DIR, CLASSIFIER_FILE))[1] for _ in range(args.repeat)]
+        )
+        stages["classifier/arrays"] = summarize(
+            [timed(load_text_classifier, bundle)[1] for _ in range(args.repeat)]
+        )
+
+    print_stage_table(stages)
+    results = {
+        "metadata": run_metadata(repeat=args.repeat, bundle_sections=len(manifest["sections"])),
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Batch runner throughput (profiles per second) by micro-batch size.
+
+Writes the synthetic corpus to a temporary JSONL queue and drains it with
+batch_runner.JsonlBatchRunner once per batch size, checkpointing after every
+batch as in production.
+
+    python benchmarks/bench_batch_runner.py --batch-sizes 1,8,32,128 --output batch.json
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from batch_runner import JsonlBatchRunner
+from profile_corpus import generate_profile_corpus
+from recommender import RecommendationEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-sizes", default="1,8,32,128")
+    parser.add_argument("--profiles", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    engine = RecommendationEngine.load()
+    corpus = generate_profile_corpus(args.profiles, args.seed)
+    engine.recommend_batch(corpus[:8])
+
+    stages = {}
+    throughput = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "intake.jsonl")
+        with open(source, "w", encoding="utf-8") as f:
+            for idx, selections in enumerate(corpus):
+                f.write(json.dumps({"id": idx, "selections": selections}) + "\n")
+
+        for batch_size in [int(value) for value in args.batch_sizes.split(",") if value.strip()]:
+            output = os.path.join(tmp, f"results_{batch_size}.jsonl")
+            batch_ms = []
+
+            def recommend_batch(tenant, selections_list):
+                start = time.perf_counter()
+                results = engine.recommend_batch(selections_list)
+                batch_ms.append((time.perf_counter() - start) * 1000.0 / len(selections_list))
+                return results
+
+            runner = JsonlBatchRunner(source, output, recommend_batch, batch_size=batch_size)
+            start = time.perf_counter()
+            processed = runner.run_once()
+            seconds = time.perf_counter() - start
+            throughput[str(batch_size)] = processed / seconds if seconds else 0.0
+            stages[f"batch_{batch_size}/per_profile"] = summarize(batch_ms)
+            print(f"  batch {batch_size}: {throughput[str(batch_size)]:.1f} profiles/s")
+
+    print_stage_table(stages)
+    results = {
+        "metadata": run_metadata(profiles=len(corpus), seed=args.seed, batch_sizes=args.batch_sizes),
+        "throughput_per_s": throughput,
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Score calibration: reliability of raw versus calibrated match scores.
+
+Ranks a labeled profile corpus (synthetic, labeled with each profile's
+field careers, unless --corpus is given) once, fits the isotonic curves on
+--fit-share of the profiles and reports expected calibration error, Brier
+score and a reliability table on the held-out rest, plus the cost of
+calibrating one recommendation list.
+
+    python benchmarks/bench_calibration.py --profiles 2000 --output calibration.json
+"""
+import argparse
+import random
+
+import numpy as np
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, timed, write_results,
+)
+
+from calibration import (
+    RELIABILITY_BINS, Calibration, brier_score, expected_calibration_error, fit_isotonic,
+    load_labeled_corpus, synthetic_labeled_corpus,
+)
+from recommender import RecommendationEngine
+
+
+def flatten(ranked, labels):
+    """(scores, hits, sources) over every recommendation."""
+    scores, hits, sources = [], [], []
+    for (recommendations, source), fitting in zip(ranked, labels):
+        for career, score in recommendations:
+            scores.append(score)
+            hits.append(1.0 if career in fitting else 0.0)
+            sources.append(source)
+    return np.asarray(scores), np.asarray(hits), np.asarray(sources)
+
+
+def reliability_table(probabilities, hits, bins=RELIABILITY_BINS):
+    index = np.minimum((np.clip(probabilities, 0.0, 1.0) * bins).astype(np.intp), bins - 1)
+    rows = []
+    for b in range(bins):
+        mask = index == b
+        if mask.any():
+            rows.append({"bin": f"{b / bins:.1f}-{(b + 1) / bins:.1f}", "count": int(mask.sum()),
+                         "mean_score": float(probabilities[mask].mean()), "fitting": float(hits[mask].mean())})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="labeled JSONL corpus")
+    parser.add_argument("--profiles", type=int, default=2000)
+    parser.add_argument("--fit-share", type=float, default=0.7)
+    parser.add_argument("--seed", type=int, default=42)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    corpus, labels = load_labeled_corpus(args.corpus) if args.corpus else synthetic_labeled_corpus(args.profiles)
+    engine = RecommendationEngine.load()
+    ranked = engine.rank_batch(corpus)
+
+    order = list(range(len(corpus)))
+    random.Random(args.seed).shuffle(order)
+    cut = int(len(order) * args.fit_share)
+    fit_rows, test_rows = order[:cut], order[cut:]
+    fit_scores, fit_hits, fit_sources = flatten([ranked[i] for i in fit_rows], [labels[i] for i in fit_rows])
+    scores, hits, sources = flatten([ranked[i] for i in test_rows], [labels[i] for i in test_rows])
+
+    curves = {}
+    for source in np.unique(fit_sources):
+        mask = fit_sources == source
+        curves[str(source)] = fit_isotonic(fit_scores[mask], fit_hits[mask])
+    calibration = Calibration(curves)
+    calibrated = np.empty_like(scores)
+    for source in np.unique(sources):
+        mask = sources == source
+        calibrated[mask] = calibration.transform(scores[mask], str(source))
+
+    metrics = {
+        "held_out_scores": int(len(scores)),
+        "knots": {source: int(len(x)) for source, (x, _) in curves.items()},
+        "ece_raw": expected_calibration_error(scores, hits),
+        "ece_calibrated": expected_calibration_error(calibrated, hits),
+        "brier_raw": brier_score(scores, hits),
+        "brier_calibrated": brier_score(calibrated, hits),
+    }
+    print(f"👉 Held out: {len(scores)} scores from {len(test_rows)} profiles, {hits.mean():.0%} fitting")
+    print(f"  ECE   {metrics['ece_raw']:.3f} raw -> {metrics['ece_calibrated']:.3f} calibrated")
+    print(f"  Brier {metrics['brier_raw']:.3f} raw -> {metrics['brier_calibrated']:.3f} calibrated")
+    table = {"raw": reliability_table(scores, hits), "calibrated": reliability_table(calibrated, hits)}
+    for name, rows in table.items():
+        print(f"  {name}: " + ", ".join(f"{row['bin']} n={row['count']} fit={row['fitting']:.0%}" for row in rows))
+
+    lists = [recommendations for recommendations, _ in ranked[:500]]
+    stages = {"calibrate_list": summarize([timed(calibration.apply, recommendations)[1] for recommendations in lists])}
+    print_stage_table(stages)
+
+    results = {
+        "metadata": run_metadata(profiles=len(corpus), seed=args.seed, fit_share=args.fit_share,
+                                 corpus=args.corpus or "synthetic"),
+        "calibration": metrics,
+        "reliability": table,
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
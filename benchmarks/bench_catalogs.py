@@ -0,0 +1,130 @@
+"""Multi-tenant catalog registry benchmark.
+
+Creates N synthetic school catalogs (the curated catalog plus a few regional
+careers each) and measures, with one shared encoder: the cold load that
+encodes and caches the vectors, the reload from the memory-mapped cache after
+eviction, warm lookups, a hot reload after editing one description,
+recommendation latency round-robin across tenants, and the resident set
+size of the process.
+
+    python benchmarks/bench_catalogs.py --tenants 24 --output catalogs.json
+"""
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from catalog_registry import CatalogRegistry
+from profile_corpus import generate_profile_corpus
+from recommender import load_embedding_model
+
+
+REGIONAL_CAREERS = ("Agritech Specialist", "Heritage Conservator", "Port Logistics Manager", "Handloom Designer")
+
+
+def write_tenant(root, idx):
+    """A catalog directory with a few extra careers and a college override."""
+    path = os.path.join(root, f"school_{idx:03d}")
+    os.makedirs(path)
+    extra = {
+        f"{career} ({idx})": {"description": f"{career} role offered through the school {idx} partner network."}
+        for career in REGIONAL_CAREERS[:1 + idx % len(REGIONAL_CAREERS)]
+    }
+    with open(os.path.join(path, "career_details.json"), "w", encoding="utf-8") as f:
+        json.dump(extra, f)
+    config = {
+        "roles": {"Engineering & Technology": list(extra)},
+        "colleges": {"General": [{"name": f"School {idx} College", "exam": "Merit", "highlights": "Local partner."}]},
+    }
+    with open(os.path.join(path, "catalog.json"), "w", encoding="utf-8") as f:
+        json.dump(config, f)
+    return os.path.basename(path)
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=24)
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    embed_model = load_embedding_model()
+    corpus = generate_profile_corpus(args.profiles, args.seed)[:args.profiles]
+    rss_start = rss_mb()
+
+    with tempfile.TemporaryDirectory() as root:
+        tenants = [write_tenant(root, idx) for idx in range(args.tenants)]
+        registry = CatalogRegistry(root, embed_model=embed_model, max_catalogs=args.tenants)
+        print(f"👉 {len(tenants)} catalogs, {len(corpus)} profiles")
+
+        samples = {"cold_load": [], "mmap_reload": [], "warm_get": [], "hot_reload": [], "recommend": []}
+        for tenant in tenants:
+            start = time.perf_counter()
+            registry.get(tenant)
+            samples["cold_load"].append((time.perf_counter() - start) * 1000.0)
+        rss_loaded = rss_mb()
+
+        for tenant in tenants:
+            registry.evict(tenant)
+            start = time.perf_counter()
+            registry.get(tenant)
+            samples["mmap_reload"].append((time.perf_counter() - start) * 1000.0)
+            start = time.perf_counter()
+            registry.get(tenant)
+            samples["warm_get"].append((time.perf_counter() - start) * 1000.0)
+
+        for idx, tenant in enumerate(tenants):
+            details_path = os.path.join(root, tenant, "career_details.json")
+            with open(details_path, encoding="utf-8") as f:
+                details = json.load(f)
+            for career in details:
+                details[career]["description"] += f" Revision {idx}."
+                break
+            with open(details_path, "w", encoding="utf-8") as f:
+                json.dump(details, f)
+            start = time.perf_counter()
+            registry.get(tenant).reload()
+            samples["hot_reload"].append((time.perf_counter() - start) * 1000.0)
+
+        for idx, selections in enumerate(corpus):
+            start = time.perf_counter()
+            registry.recommend(tenants[idx % len(tenants)], selections)
+            samples["recommend"].append((time.perf_counter() - start) * 1000.0)
+
+        # Everything is idle relative to a clock far in the future
+        evicted = registry.evict_idle(now=time.monotonic() + registry.idle_seconds + 1)
+        stats = registry.stats()
+
+    stages = {name: summarize(values) for name, values in samples.items()}
+    print_stage_table(stages)
+    print(f"RSS: {rss_start:.0f} MB before, {rss_loaded:.0f} MB with {len(tenants)} catalogs resident; "
+          f"{len(evicted)} evicted when idle")
+
+    results = {
+        "metadata": run_metadata(tenants=len(tenants), profiles=len(corpus), seed=args.seed),
+        "rss_mb": {"start": rss_start, "loaded": rss_loaded,
+                   "peak": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0},
+        "registry": {"loads": stats["loads"], "evictions": stats["evictions"]},
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""TF-IDF classifier inference: sklearn pipeline versus text_classifier.
+
+Fits train_model.py's Pipeline(TfidfVectorizer, LinearSVC), exports it with
+text_classifier.export_pipeline and scores profile texts from the synthetic
+corpus both ways. Checks parity first with text_classifier.check_parity
+(decision_function to --tolerance, same predictions), which raises
+AssertionError on a mismatch. Then times batches of each size and reports
+the cost per text, with the share of it spent tokenizing (the regex word
+analyzer, which sklearn runs as well).
+
+    python benchmarks/bench_classifier.py --batch-sizes 1,100,1000,5000 --output classifier.json
+"""
+import argparse
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, timed, write_results,
+)
+
+from profile_corpus import generate_profile_corpus
+from recommender import build_profile_text
+from text_classifier import TextClassifier, check_parity
+from train_model import build_dataset
+
+
+def batch_ms(score, texts, batch_size, rounds):
+    """Milliseconds per call for scoring texts in full batches of batch_size."""
+    samples = []
+    for _ in range(rounds):
+        for start in range(0, len(texts) - batch_size + 1, batch_size):
+            samples.append(timed(score, texts[start:start + batch_size])[1])
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-sizes", default="1,100,1000,5000")
+    parser.add_argument("--profiles", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    X, y = build_dataset()
+    model = Pipeline([("tfidf", TfidfVectorizer()), ("clf", LinearSVC())]).fit(X, y)
+    classifier = TextClassifier.from_pipeline(model)
+    corpus = generate_profile_corpus(args.profiles, args.seed)
+    texts = [build_profile_text(selections) for selections in corpus] + X + ["", "zzz unknown words"]
+
+    error = check_parity(model, texts, args.tolerance)
+    print(f"✅ Parity on {len(texts)} texts: max |Δ| {error:.2e}, same predictions")
+
+    stages = {}
+    per_text_us = {}
+    for batch_size in [int(value) for value in args.batch_sizes.split(",") if value.strip()]:
+        # Single texts on a slice only: sklearn's per-call overhead makes a full pass slow
+        sample = texts[:200] if batch_size == 1 else texts
+        for name, score in [("sklearn", model.decision_function), ("arrays", classifier.decision_function),
+                            ("tokenize", lambda batch: [classifier.analyze(text) for text in batch])]:
+            stage = f"{name}/batch_{batch_size}"
+            stages[stage] = summarize(batch_ms(score, sample, batch_size, args.rounds))
+            per_text_us[stage] = stages[stage]["p50_ms"] * 1000.0 / batch_size
+
+    print_stage_table(stages)
+    for stage, cost in per_text_us.items():
+        print(f"  {stage}: {cost:.1f} µs per text")
+    results = {
+        "metadata": run_metadata(profiles=args.profiles, seed=args.seed, batch_sizes=args.batch_sizes),
+        "parity": {"max_abs_error": error, "texts": len(texts)},
+        "per_text_us": per_text_us,
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Long free-text benchmark: preprocessing, chunked encode and full recommend latency.
+
+Corpus profiles get essays of --words words as free text, built from a pool
+of sentences with a share of them pasted twice (--duplicate). For each length
+it times the raw profile text encoded as one (silently truncated) sequence,
+the preprocessing (normalise, de-duplicate, chunk with the fast tokenizer),
+the batched encode of the chunks, and a full recommend().
+
+    python benchmarks/bench_long_text.py --words 100,300,1000,3000 --output long_text.json
+"""
+import argparse
+import random
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from profile_corpus import generate_profile_corpus
+from recommender import RecommendationEngine, build_profile_chunks
+from text_preprocessing import clean_free_text, get_profile_tokenizer
+
+
+SENTENCES = [
+    "I enjoy taking apart old radios to see how the circuits work.",
+    "Last summer I volunteered at a community clinic and helped with patient records.",
+    "My favourite subject is biology because I like understanding how living things work.",
+    "I run a small blog where I review books and write short stories.",
+    "I helped my uncle balance the accounts of his grocery shop during the holidays.",
+    "In school I led the debate team and organised an inter-school competition.",
+    "I spend weekends sketching buildings and designing floor plans for fun.",
+    "Coding simple games in Python taught me to break problems into small steps.",
+    "I like explaining maths problems to my younger cousins.",
+    "Photography and editing videos for my friends is how I relax.",
+    "I am curious about how the stock market reacts to news.",
+    "Working in the school garden made me interested in agriculture and soil science.",
+]
+
+
+def build_essay(words, duplicate, rng):
+    """An essay of about words words; a duplicate share of its sentences is repeated."""
+    sentences = []
+    while sum(len(sentence.split()) for sentence in sentences) < words:
+        sentence = rng.choice(SENTENCES)
+        sentences.append(f"{sentence[:-1]} (note {len(sentences)}).")
+        if rng.random() < duplicate:
+            sentences.append(sentences[-1])
+    return "\n".join(" ".join(sentences[i:i + 5]) for i in range(0, len(sentences), 5))
+
+
+def raw_profile_text(selections):
+    """The profile text as built before preprocessing: free text appended as is."""
+    parts = [f"{label}: {selections.get(key, '')}" for label, key in (
+        ("Stream", "stream"), ("Field", "field"), ("Role", "role"), ("Hobby", "hobby"),
+        ("Free time", "free_time"), ("Interest", "interested_subject"),
+    )]
+    return " ".join(parts + [selections["free_text"]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", default="100,300,1000,3000", help="essay lengths in words")
+    parser.add_argument("--duplicate", type=float, default=0.2, help="share of sentences pasted twice")
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=2)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    engine = RecommendationEngine.load()
+    tokenizer = get_profile_tokenizer()
+    print(f"👉 Engine ready in {time.perf_counter() - start:.1f}s, max_seq_length "
+          f"{tokenizer.max_seq_length if tokenizer else 'unknown (no fast tokenizer)'}")
+
+    rng = random.Random(args.seed)
+    corpus = generate_profile_corpus(args.profiles, args.seed)
+    stages = {}
+    inputs = {}
+    for words in [int(value) for value in args.words.split(",") if value.strip()]:
+        profiles = [{**selections, "free_text": build_essay(words, args.duplicate, rng)} for selections in corpus]
+        samples = {name: [] for name in ("raw_encode", "preprocess", "chunked_encode", "recommend")}
+        chunk_counts, raw_tokens, clean_tokens, embedded_tokens = [], [], [], []
+        for _ in range(args.repeat):
+            for selections in profiles:
+                raw = raw_profile_text(selections)
+                start = time.perf_counter()
+                engine.embed_model.encode(raw, convert_to_numpy=True, normalize_embeddings=True)
+                samples["raw_encode"].append((time.perf_counter() - start) * 1000.0)
+
+                start = time.perf_counter()
+                chunks, weights = build_profile_chunks(selections)
+                samples["preprocess"].append((time.perf_counter() - start) * 1000.0)
+
+                start = time.perf_counter()
+                engine.encode_query(chunks, weights)
+                samples["chunked_encode"].append((time.perf_counter() - start) * 1000.0)
+
+                start = time.perf_counter()
+                engine.recommend(selections)
+                samples["recommend"].append((time.perf_counter() - start) * 1000.0)
+
+                chunk_counts.append(len(chunks))
+                if tokenizer:
+                    raw_tokens.append(tokenizer.count_tokens(selections["free_text"]))
+                    clean_tokens.append(tokenizer.count_tokens(clean_free_text(selections["free_text"])))
+                    embedded_tokens.append(sum(weights) if len(chunks) > 1 else clean_tokens[-1])
+
+        for name, values in samples.items():
+            stages[f"{words}w/{name}"] = summarize(values)
+        inputs[f"{words}w"] = {
+            "mean_chunks": sum(chunk_counts) / len(chunk_counts),
+            "mean_free_text_tokens": sum(raw_tokens) / len(raw_tokens) if raw_tokens else None,
+            "mean_tokens_after_dedupe": sum(clean_tokens) / len(clean_tokens) if clean_tokens else None,
+            "mean_tokens_embedded": sum(embedded_tokens) / len(embedded_tokens) if embedded_tokens else None,
+        }
+        print(f"  {words} words: {inputs[f'{words}w']['mean_chunks']:.1f} chunks, "
+              f"{inputs[f'{words}w']['mean_free_text_tokens'] or 0:.0f} -> "
+              f"{inputs[f'{words}w']['mean_tokens_embedded'] or 0:.0f} free-text tokens embedded")
+
+    print_stage_table(stages)
+    results = {
+        "metadata": run_metadata(words=args.words, duplicate=args.duplicate, profiles=args.profiles,
+                                 seed=args.seed, repeat=args.repeat),
+        "inputs": inputs,
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
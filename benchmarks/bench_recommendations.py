@@ -0,0 +1,86 @@
+"""Recommendation latency benchmark over a reproducible synthetic profile corpus.
+
+Times every pipeline stage (profile text, filter, encode, similarity, fuse,
+fallback, final filter) without the GUI and reports p50/p95/p99 plus
+throughput.
+
+    python benchmarks/bench_recommendations.py --profiles 500 --output before.json
+    python benchmarks/bench_recommendations.py --profiles 500 --compare before.json
+"""
+import argparse
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from career_data import MODEL_DIR
+from profile_corpus import CORPUS_VERSION, generate_profile_corpus, load_corpus
+from recommender import RecommendationEngine, profile_cache_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--profiles", type=int, default=500, help="synthetic corpus size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--corpus", help="JSONL corpus to use instead of generating one")
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the corpus")
+    parser.add_argument("--warmup", type=int, default=10)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else generate_profile_corpus(args.profiles, args.seed)
+
+    start = time.perf_counter()
+    engine = RecommendationEngine.load(args.model_dir)
+    startup_ms = (time.perf_counter() - start) * 1000.0
+    print(f"👉 Engine ready in {startup_ms:.0f} ms, {len(engine.career_names)} careers, "
+          f"{len(corpus)} profiles x {args.repeat}")
+
+    for selections in corpus[:args.warmup]:
+        engine.recommend(selections)
+
+    stage_samples = {}
+    total_samples = []
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for selections in corpus:
+            timings = {}
+            request_start = time.perf_counter()
+            engine.recommend(selections, timings=timings)
+            total_samples.append((time.perf_counter() - request_start) * 1000.0)
+            for stage, elapsed in timings.items():
+                stage_samples.setdefault(stage, []).append(elapsed)
+    wall_seconds = time.perf_counter() - start
+
+    stages = {stage: summarize(samples) for stage, samples in stage_samples.items()}
+    stages["total"] = summarize(total_samples)
+    results = {
+        "metadata": run_metadata(
+            corpus_version=CORPUS_VERSION,
+            corpus_size=len(corpus),
+            seed=None if args.corpus else args.seed,
+            repeat=args.repeat,
+            retrieval=engine.retrieval_config,
+            embedding_dtype=engine.career_matrix.dtype,
+        ),
+        "startup_ms": startup_ms,
+        "throughput_per_s": len(total_samples) / wall_seconds if wall_seconds else 0.0,
+        "profile_cache": profile_cache_stats(),
+        "stages": stages,
+    }
+
+    print_stage_table(stages)
+    print(f"Throughput: {results['throughput_per_s']:.1f} recommendations/s")
+    print(f"Profile contexts: {results['profile_cache']['hits']} hits, {results['profile_cache']['misses']} misses")
+
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Related-career expansion: precomputed career graph versus per-request similarity.
+
+Builds synthetic catalogs of each size (clustered, normalised 384-d vectors,
+like career embeddings of related fields) and times, per size: building the
+k-NN graph offline, expanding TOP_K seed careers with a graph lookup
+(CareerGraph.spread), and the same expansion computed per request from the
+seeds' similarity to the whole catalog. Also reports the graph's size and
+checks that both expansions reach the same careers, and that careers
+related to a profile stay in the running when the shortlist left them
+unscored and no seed reaches them (the engine over the curated catalog,
+with synthetic vectors and every other eligible career at one low score).
+Then ranks the profile corpus on the real engine in hybrid mode with and
+without its graph and checks that the graph only ever raises the scores of
+related careers.
+
+    python benchmarks/bench_related_graph.py --sizes 100,1000,10000 --output related_graph.json
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, timed, write_results,
+)
+
+from career_data import build_career_details
+from career_graph import DEFAULT_GRAPH_NEIGHBORS, GRAPH_MIN_SIMILARITY, CareerGraph
+from embedding_store import CompactEmbeddings
+from profile_corpus import generate_profile_corpus
+from recommender import TOP_K, RecommendationEngine, resolve_profile
+from retrieval import get_retrieval_config
+
+
+def synthetic_catalog(size, dim, seed):
+    """size normalised vectors scattered around size // 20 cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(max(1, size // 20), dim))
+    vectors = centres[rng.integers(len(centres), size=size)] + rng.normal(scale=1.2, size=(size, dim))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def pairwise_expansion(vectors, seeds, scores, k):
+    """What expansion costs without a graph: each seed's k nearest careers
+    found from its similarity to the whole catalog, on every request."""
+    similarity = vectors[seeds] @ vectors.T
+    similarity[np.arange(len(seeds)), seeds] = -np.inf
+    top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+    weights = np.take_along_axis(similarity, top, axis=1)
+    out = np.zeros(len(vectors), dtype=np.float32)
+    keep = weights >= GRAPH_MIN_SIMILARITY
+    np.maximum.at(out, top[keep], (weights * scores[:, None])[keep])
+    return out
+
+
+def unscored_related_kept(profiles, dim, seed):
+    """(profiles checked, profiles whose top careers include a related one)
+    when the related careers are left out of the scored rows."""
+    details = build_career_details({})
+    names = list(details.keys())
+    vectors = synthetic_catalog(len(names), dim, seed)
+    # The catalog is already encoded, so the engine needs no encoder
+    engine = RecommendationEngine(details, None, career_matrix=CompactEmbeddings(vectors))
+    checked = kept = 0
+    for selections in generate_profile_corpus(profiles, seed):
+        profile = resolve_profile(selections)
+        candidates = engine.get_candidates(profile)
+        related = set(profile.related_targets) & set(candidates)
+        if not related:
+            continue
+        rows = np.array([row for row, name in enumerate(names) if name in candidates and name not in related])
+        top = engine.fuse_scores(rows, np.full(len(rows), 0.2, dtype=np.float32), profile, candidates)
+        checked += 1
+        kept += bool(related & {career for career, _ in top})
+    return checked, kept
+
+
+def graph_lifts_related_only(profiles, seed):
+    """(profiles checked, profiles where the graph raised a related career,
+    profiles where it changed anything else) on the hybrid ranking path."""
+    engine = RecommendationEngine.load(retrieval_config={**get_retrieval_config(), "mode": "hybrid"})
+    corpus = generate_profile_corpus(profiles, seed)
+    graph = engine.graph
+    with_graph = engine.rank_batch(corpus)
+    engine.graph = None
+    without_graph = engine.rank_batch(corpus)
+    engine.graph = graph
+
+    checked = lifted = changed = 0
+    for selections, (ranked, source), (plain, _) in zip(corpus, with_graph, without_graph):
+        if source != "similarity":
+            continue
+        related = set(resolve_profile(selections).related_targets)
+        plain = dict(plain)
+        checked += 1
+        lifted += any(career in related and score > plain.get(career, score) for career, score in ranked)
+        changed += any(
+            (career not in related and career in plain and not np.isclose(score, plain[career]))
+            or (career in related and score < plain.get(career, score) - 1e-6)
+            for career, score in ranked
+        )
+    return checked, lifted, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--neighbors", type=int, default=DEFAULT_GRAPH_NEIGHBORS)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--build-repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    stages, graphs = {}, {}
+    for size in [int(value) for value in args.sizes.split(",")]:
+        vectors = synthetic_catalog(size, args.dim, args.seed)
+        samples = []
+        for _ in range(args.build_repeat):
+            graph, elapsed = timed(CareerGraph.build, vectors, args.neighbors)
+            samples.append(elapsed)
+        stages[f"build/{size}"] = summarize(samples)
+        graphs[size] = {"edges": graph.edges, "bytes": graph.nbytes}
+        print(f"👉 {size} careers: {graph.edges} edges, {graph.nbytes / 1024:.1f} KB graph, "
+              f"{vectors.nbytes / 1024:.1f} KB vectors")
+
+        rng = np.random.default_rng(args.seed)
+        queries = [
+            (rng.choice(size, size=min(TOP_K, size), replace=False), rng.uniform(0.3, 0.9, min(TOP_K, size)))
+            for _ in range(args.queries)
+        ]
+        mismatches = sum(
+            not np.allclose(graph.spread(seeds, scores), pairwise_expansion(vectors, seeds, scores, args.neighbors),
+                            atol=1e-5)
+            for seeds, scores in queries[:20]
+        )
+        print(f"{'✅' if not mismatches else '❌'} Graph and per-request expansion agree on "
+              f"{20 - mismatches}/20 queries")
+        stages[f"graph_lookup/{size}"] = summarize(
+            [timed(graph.spread, seeds, scores)[1] for seeds, scores in queries]
+        )
+        stages[f"pairwise/{size}"] = summarize(
+            [timed(pairwise_expansion, vectors, seeds, scores, args.neighbors)[1] for seeds, scores in queries]
+        )
+
+    checked, kept = unscored_related_kept(args.queries, args.dim, args.seed)
+    print(f"{'✅' if kept == checked else '❌'} Unscored related careers ranked for {kept}/{checked} profiles")
+    ranked, lifted, changed = graph_lifts_related_only(args.queries, args.seed)
+    print(f"{'✅' if not changed else '❌'} Hybrid ranking: the graph raised related careers for {lifted}/{ranked} "
+          f"profiles and changed other scores for {changed}")
+
+    print_stage_table(stages)
+    results = {
+        "metadata": run_metadata(dim=args.dim, neighbors=args.neighbors, queries=args.queries, graphs=graphs),
+        "related_kept": {"profiles": checked, "kept": kept},
+        "hybrid_graph": {"profiles": ranked, "lifted": lifted, "changed": changed},
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+    if kept != checked or changed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Results-page construction benchmark.
+
+Times display_summary / display_details / display_analytics /
+display_resume_builder plus the style polish of the built widgets for a set of
+corpus profiles, and compares per-widget inline setStyleSheet against registry
+classes resolved from the single application sheet.
+
+    python benchmarks/bench_results_page.py --profiles 30 --output page.json
+    python benchmarks/bench_results_page.py --profiles 30 --compare page.json
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+import matplotlib.pyplot as plt
+from PySide6.QtWidgets import QApplication, QFrame, QLabel, QVBoxLayout, QWidget
+
+import app
+from profile_corpus import generate_profile_corpus
+from styles import WIDGET_STYLES, set_style_class, style_class
+
+
+BUILDERS = ("display_summary", "display_details", "display_analytics", "display_resume_builder")
+
+
+def build_results(window, recommendations, timings):
+    """Build every results tab and polish it, recording ms per builder."""
+    for layout in (window.summary_layout, window.details_layout, window.analytics_layout, window.resume_layout):
+        window.clear_layout(layout)
+    QApplication.processEvents()
+
+    for name in BUILDERS:
+        start = time.perf_counter()
+        if name == "display_resume_builder":
+            getattr(window, name)()
+        else:
+            getattr(window, name)(recommendations)
+        timings.setdefault(name, []).append((time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    for content in (window.summary_content, window.details_content, window.analytics_content, window.resume_content):
+        for widget in content.findChildren(QWidget):
+            widget.ensurePolished()
+    timings.setdefault("polish", []).append((time.perf_counter() - start) * 1000.0)
+
+
+def badge_panel(count, inline):
+    """count stat badges styled inline or through the registry class."""
+    declarations = WIDGET_STYLES[style_class("QLabel", "statBadge")]
+    panel = QFrame()
+    panel.setStyleSheet(app.APP_STYLE)
+    layout = QVBoxLayout(panel)
+    for idx in range(count):
+        badge = QLabel(f"💰 badge {idx}")
+        if inline:
+            badge.setStyleSheet(declarations)
+        else:
+            set_style_class(badge, "statBadge")
+        layout.addWidget(badge)
+    for widget in panel.findChildren(QWidget):
+        widget.ensurePolished()
+    return panel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--badges", type=int, default=300, help="widgets in the inline vs registry comparison")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    qt_app = QApplication.instance() or QApplication([])
+    window = app.CareerApp()
+    window.resize(1200, 800)
+
+    corpus = generate_profile_corpus(args.profiles, args.seed)[:args.profiles]
+    recommendations = [window.engine.recommend(selections) for selections in corpus]
+    print(f"👉 Building the results page for {len(recommendations)} profiles x {args.repeat}")
+
+    build_results(window, recommendations[0], {})  # warm-up
+    timings = {}
+    totals = []
+    for _ in range(args.repeat):
+        for recs in recommendations:
+            start = time.perf_counter()
+            build_results(window, recs, timings)
+            totals.append((time.perf_counter() - start) * 1000.0)
+
+    stages = {name: summarize(samples) for name, samples in timings.items()}
+    stages["total"] = summarize(totals)
+
+    for inline in (True, False, True, False):  # second pass of each is measured
+        start = time.perf_counter()
+        panel = badge_panel(args.badges, inline)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        panel.deleteLater()
+        qt_app.processEvents()
+        stages["badges_inline" if inline else "badges_registry"] = summarize([elapsed])
+
+    print_stage_table(stages)
+    results = {
+        "metadata": run_metadata(profiles=len(recommendations), repeat=args.repeat, badges=args.badges,
+                                 registered_styles=len(WIDGET_STYLES)),
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+    # Release the figures and the window before interpreter shutdown
+    plt.close("all")
+    window.close()
+    del window
+
+
+if __name__ == "__main__":
+    main()
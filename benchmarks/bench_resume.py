@@ -0,0 +1,112 @@
+"""Resume PDF throughput benchmark (resumes per second), no GUI needed.
+
+Renders a resume for each profile of the synthetic corpus as in-memory bytes,
+into files, streamed into one ZIP archive, and once more with a fresh template
+per resume to show what the cached static flowables save.
+
+    python benchmarks/bench_resume.py --profiles 200 --output resume.json
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from career_data import CAREER_MAPPINGS
+from profile_corpus import generate_profile_corpus
+from resume_pdf import ResumeBuilder, ResumeTemplate, write_resume_zip
+
+
+def build_user_data(selections, idx):
+    """Resume form data for a corpus profile, as generate_resume_pdf collects it."""
+    user_data = {key: selections.get(key, "") for key in ("stream", "field", "role", "hobby", "free_time", "interested_subject")}
+    user_data.update({
+        "interests": selections.get("free_text", ""),
+        "name": f"Student {idx}",
+        "email": f"student{idx}@example.com",
+        "phone": "+91 9876543210",
+        "location": "Pune, Maharashtra",
+        "linkedin": f"linkedin.com/in/student{idx}",
+    })
+    return user_data
+
+
+def build_career_data(selections):
+    """Stand-in recommendations: the profile's field roles (no embedding model needed)."""
+    roles = CAREER_MAPPINGS["roles"].get(selections.get("field"), []) or ["Software Engineer"]
+    return [(role, 0.9 - 0.1 * rank) for rank, role in enumerate(roles[:6])]
+
+
+def run(jobs, render):
+    samples = []
+    start = time.perf_counter()
+    for idx, (user_data, career_data) in enumerate(jobs):
+        job_start = time.perf_counter()
+        render(idx, user_data, career_data)
+        samples.append((time.perf_counter() - job_start) * 1000.0)
+    return samples, len(jobs) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    corpus = generate_profile_corpus(args.profiles, args.seed)[:args.profiles]
+    jobs = [(build_user_data(selections, idx), build_career_data(selections)) for idx, selections in enumerate(corpus)]
+    builder = ResumeBuilder()
+    builder.create_resume(*jobs[0], io.BytesIO())  # warm up fonts and styles
+    print(f"👉 Rendering {len(jobs)} resumes")
+
+    sizes = []
+
+    def to_bytes(idx, user_data, career_data):
+        sizes.append(len(builder.create_resume(user_data, career_data)))
+
+    def uncached(idx, user_data, career_data):
+        ResumeBuilder(ResumeTemplate()).create_resume(user_data, career_data, io.BytesIO())
+
+    stages, throughput = {}, {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        def to_file(idx, user_data, career_data):
+            builder.create_resume(user_data, career_data, os.path.join(tmp_dir, f"resume_{idx}.pdf"))
+
+        for name, render in (("bytes", to_bytes), ("file", to_file), ("uncached_template", uncached)):
+            samples, per_second = run(jobs, render)
+            stages[name] = summarize(samples)
+            throughput[name] = per_second
+
+    archive = io.BytesIO()
+    start = time.perf_counter()
+    write_resume_zip(jobs, archive, builder)
+    elapsed = time.perf_counter() - start
+    stages["zip_archive"] = summarize([elapsed * 1000.0])
+    throughput["zip_archive"] = len(jobs) / elapsed
+
+    print_stage_table(stages)
+    for name, per_second in throughput.items():
+        print(f"{name:>17}: {per_second:.1f} resumes/s")
+    print(f"Average PDF size: {sum(sizes) / len(sizes) / 1024:.1f} KB, archive {archive.tell() / 1024:.1f} KB")
+
+    results = {
+        "metadata": run_metadata(profiles=len(jobs), seed=args.seed),
+        "throughput_per_s": throughput,
+        "average_pdf_bytes": sum(sizes) / len(sizes),
+        "archive_bytes": archive.tell(),
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare hybrid (TF-IDF shortlist + MiniLM re-rank) retrieval against the
+pure-embedding path on recall@k and latency.
+
+    python benchmarks/bench_retrieval.py --k 8 --output retrieval.json
+"""
+import argparse
+
+import numpy as np
+
+from harness import add_output_arguments, print_stage_table, run_metadata, summarize, timed, write_results
+
+from career_data import MODEL_DIR, load_career_details
+from embedding_text import build_career_texts
+from profile_corpus import generate_profile_corpus
+from recommender import build_profile_text, load_embedding_model
+from retrieval import HybridRetriever, build_lexical_text, get_retrieval_config
+from train_model import build_dataset
+
+
+def build_queries(profiles):
+    """Free-text queries from the classifier dataset plus synthetic form profiles."""
+    queries, _ = build_dataset()
+    return list(queries) + [build_profile_text(selections) for selections in generate_profile_corpus(profiles)]
+
+
+def top_k(scores, k):
+    return [name for name, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]]
+
+
+def main():
+    config = get_retrieval_config()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lexical-weight", type=float, default=config["lexical_weight"])
+    parser.add_argument("--semantic-weight", type=float, default=config["semantic_weight"])
+    parser.add_argument("--shortlist-size", type=int, default=config["shortlist_size"])
+    parser.add_argument("--profiles", type=int, default=100, help="synthetic profiles added to the queries")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    career_details = load_career_details(args.model_dir)
+    names = list(career_details.keys())
+    model = load_embedding_model()
+    matrix = model.encode(
+        build_career_texts(career_details, names),
+        convert_to_numpy=True, normalize_embeddings=True,
+    ).astype(np.float32)
+
+    retriever = HybridRetriever(
+        names,
+        [build_lexical_text(job, career_details[job]) for job in names],
+        matrix,
+        lexical_weight=args.lexical_weight,
+        semantic_weight=args.semantic_weight,
+        shortlist_size=args.shortlist_size,
+    )
+
+    queries = build_queries(args.profiles)
+    print(f"👉 {len(queries)} queries over {len(names)} careers, k={args.k}, shortlist={args.shortlist_size}")
+
+    encode_ms, dense_ms, shortlist_ms, hybrid_ms = [], [], [], []
+    recalls, shortlist_recalls = [], []
+    for query in queries:
+        query_emb, elapsed = timed(
+            lambda text: model.encode(text, convert_to_numpy=True, normalize_embeddings=True), query
+        )
+        encode_ms.append(elapsed)
+
+        for _ in range(args.repeat):
+            dense_scores, elapsed = timed(retriever.dense_search, query_emb)
+            dense_ms.append(elapsed)
+            shortlist_rows, elapsed = timed(retriever.shortlist, query)
+            shortlist_ms.append(elapsed)
+            hybrid_scores, elapsed = timed(retriever.search, query, lambda _text: query_emb)
+            hybrid_ms.append(elapsed)
+
+        reference = set(top_k(dense_scores, args.k))
+        recalls.append(len(reference & set(top_k(hybrid_scores, args.k))) / len(reference))
+        shortlisted = {retriever.names[row] for row in shortlist_rows}
+        shortlist_recalls.append(len(reference & shortlisted) / len(reference))
+
+    results = {
+        "metadata": run_metadata(),
+        "queries": len(queries),
+        "careers": len(names),
+        "k": args.k,
+        "config": {
+            "lexical_weight": args.lexical_weight,
+            "semantic_weight": args.semantic_weight,
+            "shortlist_size": args.shortlist_size,
+        },
+        "encode": summarize(encode_ms),
+        "dense_scoring": summarize(dense_ms),
+        "lexical_shortlist": summarize(shortlist_ms),
+        "hybrid_scoring": summarize(hybrid_ms),
+        "recall_at_k": float(np.mean(recalls)),
+        "shortlist_recall_at_k": float(np.mean(shortlist_recalls)),
+    }
+
+    print_stage_table({stage: results[stage] for stage in ("encode", "dense_scoring", "lexical_shortlist", "hybrid_scoring")})
+    print(f"Recall@{args.k} (hybrid vs dense): {results['recall_at_k']:.3f}")
+    print(f"Shortlist recall@{args.k}: {results['shortlist_recall_at_k']:.3f}")
+
+    if args.output:
+        write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
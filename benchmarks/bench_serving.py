@@ -0,0 +1,114 @@
+"""Serving layer under load: recommendation latency with and without a PDF burst.
+
+Starts serving.RecommendationServer in-process on a free port and measures
+POST /recommend latency for corpus profiles (cache misses, then hits), then
+again while --burst resume and chart requests are fired at once. Reports
+the 429s the burst gets and the per-queue metrics.
+
+    python benchmarks/bench_serving.py --profiles 100 --burst 40 --output serving.json
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from profile_corpus import generate_profile_corpus
+from serving import RecommendationServer, build_recommend, get_queue_config
+
+
+async def post(port, path, payload):
+    """(status, body bytes, ms) for one request on a fresh connection."""
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), content, (time.perf_counter() - start) * 1000.0
+
+
+async def recommend_all(port, corpus):
+    samples = []
+    for selections in corpus:
+        status, _, ms = await post(port, "/recommend", {"selections": selections})
+        if status == 200:
+            samples.append(ms)
+    return samples
+
+
+async def burst(port, corpus, size):
+    """size resume and chart requests at once; returns (statuses, ms per 200)."""
+    recommendations = [["Software Engineer", 0.82], ["Data Scientist", 0.77], ["Doctor", 0.61]]
+    jobs = []
+    for idx in range(size):
+        selections = corpus[idx % len(corpus)]
+        user_data = {**selections, "name": f"Student {idx}", "email": "student@example.com", "interests": ""}
+        jobs.append(post(port, "/resume", {"user_data": user_data, "recommendations": recommendations}))
+        jobs.append(post(port, "/chart", {"recommendations": recommendations}))
+    results = await asyncio.gather(*jobs)
+    return [status for status, _, _ in results], [ms for status, _, ms in results if status == 200]
+
+
+async def run(args):
+    server = RecommendationServer(build_recommend(), get_queue_config())
+    await server.start("127.0.0.1", 0)
+    port = server.server.sockets[0].getsockname()[1]
+    corpus = generate_profile_corpus(args.profiles, args.seed)[:args.profiles]
+    stages = {}
+    try:
+        # Warm the engine and spawn the worker processes
+        await post(port, "/recommend", {"selections": corpus[0]})
+        await burst(port, corpus, 2)
+        server.cache.entries.clear()
+
+        stages["recommend/miss"] = summarize(await recommend_all(port, corpus))
+        stages["recommend/hit"] = summarize(await recommend_all(port, corpus))
+        server.cache.entries.clear()
+
+        burst_task = asyncio.ensure_future(burst(port, corpus, args.burst))
+        stages["recommend/miss_during_burst"] = summarize(await recommend_all(port, corpus))
+        statuses, burst_ms = await burst_task
+        stages["burst/accepted"] = summarize(burst_ms)
+        rejected = statuses.count(429)
+        print(f"👉 Burst of {len(statuses)} PDF/chart requests: {len(statuses) - rejected} served, {rejected} rejected (429)")
+        metrics = server.metrics()
+    finally:
+        server.close()
+    return stages, metrics, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--burst", type=int, default=40, help="resume + chart request pairs fired at once")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    stages, metrics, rejected = asyncio.run(run(args))
+    print_stage_table(stages)
+    for name, queue in metrics["queues"].items():
+        print(f"  {name}: {queue['completed']} done, {queue['rejected']} rejected, "
+              f"run p50 {queue['run']['p50_ms'] or 0:.1f} ms, wait p95 {queue['wait']['p95_ms'] or 0:.1f} ms")
+    results = {
+        "metadata": run_metadata(profiles=args.profiles, seed=args.seed, burst=args.burst),
+        "burst_rejected": rejected,
+        "server_metrics": metrics,
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
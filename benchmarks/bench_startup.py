@@ -0,0 +1,209 @@
+"""Startup profiler for CareerApp.
+
+Breaks launch into phases (dependency imports, module-level taxonomy in
+career_data, the rest of app.py, initialize_data, ResumeBuilder style setup,
+build_input_page / build_results_page, first show) and prints them sorted by
+cost with CPU time, RSS and peak RSS per phase.
+
+    python benchmarks/bench_startup.py --offscreen --output startup.json
+    python benchmarks/bench_startup.py --cprofile startup.prof --budget-ms 8000
+"""
+import argparse
+import cProfile
+import functools
+import importlib
+import os
+import pstats
+import sys
+import time
+
+from harness import add_output_arguments, compare_results, run_metadata, write_results
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Heavy third-party imports, timed one by one before the app modules
+DEPENDENCY_IMPORTS = [
+    ("import numpy", "numpy"),
+    ("import joblib", "joblib"),
+    ("import scikit-learn", "sklearn.feature_extraction.text"),
+    ("import sentence_transformers", "sentence_transformers"),
+    ("import PySide6", "PySide6.QtWidgets"),
+    ("import matplotlib", "matplotlib.pyplot"),
+    ("import reportlab", "reportlab.platypus"),
+]
+
+# Methods wrapped as their own phases while CareerApp() is constructed
+WRAPPED_PHASES = [
+    ("CareerApp", "initialize_data"),
+    ("ResumeBuilder", "__init__"),
+    ("CareerApp", "build_input_page"),
+    ("CareerApp", "build_results_page"),
+]
+
+
+def current_rss_mb():
+    """Resident set size right now, in MB (None if unknown)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def peak_rss_mb():
+    """Process peak RSS so far, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class StartupProfiler:
+    """Records wall time, CPU time and memory for named startup phases."""
+
+    def __init__(self):
+        self.phases = []
+        self.depth = 0
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def wrap(self, owner, attr, name=None):
+        """Replace owner.attr with a version that records a phase per call."""
+        original = getattr(owner, attr)
+        label = name or f"{owner.__name__}.{attr}"
+        profiler = self
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            with profiler.phase(label):
+                return original(*args, **kwargs)
+
+        setattr(owner, attr, wrapper)
+
+    def report(self):
+        return sorted(self.phases, key=lambda p: p["wall_ms"], reverse=True)
+
+    def print_report(self, total_ms):
+        print(f"\n{'phase':<36} {'wall ms':>10} {'cpu ms':>10} {'share':>7} {'rss MB':>9} {'peak MB':>9} {'+peak':>8}")
+        for entry in self.report():
+            share = entry["wall_ms"] / total_ms * 100.0 if total_ms else 0.0
+            name = "  " * entry["depth"] + entry["name"]
+            print(f"{name:<36} {entry['wall_ms']:>10.1f} {entry['cpu_ms']:>10.1f} {share:>6.1f}% "
+                  f"{_fmt_mb(entry['rss_mb']):>9} {_fmt_mb(entry['peak_rss_mb']):>9} "
+                  f"{_fmt_mb(entry['peak_delta_mb']):>8}")
+        print(f"{'total':<36} {total_ms:>10.1f}")
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.depth = self.profiler.depth
+        self.profiler.depth += 1
+        self.peak_before = peak_rss_mb()
+        self.cpu_start = time.process_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        wall_ms = (time.perf_counter() - self.start) * 1000.0
+        cpu_ms = (time.process_time() - self.cpu_start) * 1000.0
+        self.profiler.depth -= 1
+        peak = peak_rss_mb()
+        self.profiler.phases.append({
+            "name": self.name,
+            "depth": self.depth,
+            "wall_ms": wall_ms,
+            "cpu_ms": cpu_ms,
+            "rss_mb": current_rss_mb(),
+            "peak_rss_mb": peak,
+            "peak_delta_mb": peak - self.peak_before if peak is not None else None,
+        })
+        return False
+
+
+def _fmt_mb(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--offscreen", action="store_true", help="use the Qt offscreen platform (no display needed)")
+    parser.add_argument("--no-show", action="store_true", help="skip window.show() and the first event loop pass")
+    parser.add_argument("--cprofile", help="dump cProfile stats for the whole startup to this path")
+    parser.add_argument("--top", type=int, default=25, help="cProfile rows to print")
+    parser.add_argument("--budget-ms", type=float, help="exit non-zero if total startup exceeds this")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    profiler = StartupProfiler()
+    cprofile = cProfile.Profile() if args.cprofile else None
+    if cprofile:
+        cprofile.enable()
+
+    start = time.perf_counter()
+    for name, module in DEPENDENCY_IMPORTS:
+        with profiler.phase(name):
+            importlib.import_module(module)
+    with profiler.phase("career_data taxonomy (module level)"):
+        importlib.import_module("career_data")
+    with profiler.phase("import app"):
+        app_module = importlib.import_module("app")
+
+    for owner, attr in WRAPPED_PHASES:
+        profiler.wrap(getattr(app_module, owner), attr)
+
+    with profiler.phase("QApplication"):
+        qt_app = app_module.QApplication.instance() or app_module.QApplication(sys.argv[:1])
+    with profiler.phase("CareerApp()"):
+        window = app_module.CareerApp()
+    if not args.no_show:
+        with profiler.phase("show + first event loop pass"):
+            window.show()
+            qt_app.processEvents()
+    total_ms = (time.perf_counter() - start) * 1000.0
+
+    if cprofile:
+        cprofile.disable()
+        cprofile.dump_stats(args.cprofile)
+
+    profiler.print_report(total_ms)
+    if cprofile:
+        print(f"\n📄 cProfile stats written to {args.cprofile} (top {args.top} by cumulative time):")
+        pstats.Stats(cprofile).sort_stats("cumulative").print_stats(args.top)
+
+    results = {
+        "metadata": run_metadata(careers=len(window.career_details)),
+        "total_ms": total_ms,
+        "peak_rss_mb": peak_rss_mb(),
+        "phases": {entry["name"]: entry for entry in profiler.phases},
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare, key="phases", metrics=("wall_ms", "cpu_ms"))
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"❌ Startup took {total_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Torch runtime sweep: encode latency per thread / grad-mode / compile setting.
+
+Each setting runs in a fresh interpreter (inter-op threads can only be set
+once per process) and encodes profile texts from the synthetic corpus,
+bucketed by length, one query at a time as the app does. A "long" bucket
+pads the free text to --long-words words.
+
+    python benchmarks/bench_torch_runtime.py --threads 1,2,4 --output torch.json
+    python benchmarks/bench_torch_runtime.py --compile none,trace --inference-mode 1
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+
+from harness import (
+    add_output_arguments, compare_results, print_stage_table, run_metadata,
+    summarize, write_results,
+)
+
+from profile_corpus import generate_profile_corpus
+from recommender import build_profile_text
+
+
+LENGTH_BUCKETS = (("short", 0, 30), ("typical", 31, 40), ("long_selections", 41, 10**6))
+
+
+def bucket_texts(profiles, seed, per_bucket, long_words):
+    """Profile texts grouped by word count, plus padded long free text."""
+    buckets = {name: [] for name, _, _ in LENGTH_BUCKETS}
+    for selections in generate_profile_corpus(profiles, seed):
+        text = build_profile_text(selections)
+        words = len(text.split())
+        for name, low, high in LENGTH_BUCKETS:
+            if low <= words <= high and len(buckets[name]) < per_bucket:
+                buckets[name].append(text)
+    filler = "I like building things, helping people and learning how systems work. "
+    buckets["long_free_text"] = [
+        " ".join((text + " " + filler * long_words).split()[:long_words]) for text in buckets["typical"]
+    ]
+    return {name: texts for name, texts in buckets.items() if texts}
+
+
+def run_setting(args):
+    """Child process: apply one setting and time encode for each bucket."""
+    setting = json.loads(args.worker)
+    os.environ.update({
+        "CAREER_TORCH_THREADS": str(setting["intra_op_threads"]),
+        "CAREER_TORCH_INTEROP_THREADS": str(setting["inter_op_threads"]),
+        "CAREER_TORCH_INFERENCE_MODE": "1" if setting["inference_mode"] else "0",
+        "CAREER_TORCH_COMPILE": setting["compile"],
+    })
+    from recommender import load_embedding_model
+
+    start = time.perf_counter()
+    model = load_embedding_model()
+    setup_ms = (time.perf_counter() - start) * 1000.0
+
+    buckets = bucket_texts(args.profiles, args.seed, args.per_bucket, args.long_words)
+    for text in buckets["typical"][:args.warmup]:
+        model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+
+    stages = {}
+    for name, texts in buckets.items():
+        samples = []
+        for _ in range(args.repeat):
+            for text in texts:
+                start = time.perf_counter()
+                model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+                samples.append((time.perf_counter() - start) * 1000.0)
+        stages[name] = summarize(samples)
+    print(json.dumps({"setup_ms": setup_ms, "compile_mode": model.compile_mode, "stages": stages}))
+
+
+def parse_list(value, cast=str):
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default=",".join(str(n) for n in sorted({1, 2, os.cpu_count() or 1})),
+                        help="intra-op thread counts to sweep")
+    parser.add_argument("--interop", default="1", help="inter-op thread counts to sweep")
+    parser.add_argument("--inference-mode", default="1,0", help="1: inference_mode, 0: no_grad")
+    parser.add_argument("--compile", default="none", help="compile modes to sweep: none,compile,trace")
+    parser.add_argument("--profiles", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--per-bucket", type=int, default=30)
+    parser.add_argument("--long-words", type=int, default=180)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_setting(args)
+        return
+
+    settings = [
+        {"intra_op_threads": intra, "inter_op_threads": inter, "inference_mode": bool(mode), "compile": compile_mode}
+        for intra, inter, mode, compile_mode in itertools.product(
+            parse_list(args.threads, int), parse_list(args.interop, int),
+            parse_list(args.inference_mode, int), parse_list(args.compile),
+        )
+    ]
+    print(f"👉 Sweeping {len(settings)} torch runtime settings")
+
+    child_args = list(sys.argv[1:])
+    for flag in ("--output", "--compare"):
+        if flag in child_args:
+            del child_args[child_args.index(flag):child_args.index(flag) + 2]
+
+    runs = {}
+    stages = {}
+    for setting in settings:
+        label = (f"t{setting['intra_op_threads']}_i{setting['inter_op_threads']}_"
+                 f"{'inference' if setting['inference_mode'] else 'no_grad'}_{setting['compile']}")
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), *child_args, "--worker", json.dumps(setting)],
+            capture_output=True, text=True,
+        )
+        lines = [line for line in completed.stdout.splitlines() if line.startswith("{")]
+        if completed.returncode != 0 or not lines:
+            print(f"⚠️ {label} failed:\n{completed.stderr[-2000:]}")
+            continue
+        result = json.loads(lines[-1])
+        runs[label] = {"setting": setting, "setup_ms": result["setup_ms"], "compile_mode": result["compile_mode"]}
+        for bucket, summary in result["stages"].items():
+            stages[f"{label}/{bucket}"] = summary
+        typical = result["stages"].get("typical", {}).get("p50_ms")
+        if typical is not None:
+            print(f"  {label}: typical p50 {typical:.2f} ms (setup {result['setup_ms']:.0f} ms)")
+
+    print_stage_table(stages)
+    results = {
+        "metadata": run_metadata(profiles=args.profiles, seed=args.seed, per_bucket=args.per_bucket,
+                                 long_words=args.long_words, repeat=args.repeat),
+        "runs": runs,
+        "stages": stages,
+    }
+    if args.output:
+        write_results(results, args.output)
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Shared helpers for the benchmark scripts: latency summaries, run metadata
+and JSON results that can be diffed across commits.
+
+With CAREER_BENCH_STAND_IN_ENCODER=1 the sentence model is replaced by the
+hash encoder in stand_in_encoder.py (import harness before repo modules)."""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+STAND_IN_ENCODER = os.environ.get("CAREER_BENCH_STAND_IN_ENCODER", "").strip().lower() in ("1", "true", "yes")
+if STAND_IN_ENCODER:
+    from stand_in_encoder import install
+    install()
+
+
+def summarize(samples_ms):
+    """Latency summary in milliseconds."""
+    samples = np.asarray(samples_ms, dtype=np.float64)
+    if not samples.size:
+        return {"count": 0}
+    return {
+        "count": int(samples.size),
+        "mean_ms": float(samples.mean()),
+        "min_ms": float(samples.min()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "max_ms": float(samples.max()),
+    }
+
+
+def timed(fn, *args, **kwargs):
+    """Call fn and return (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_metadata(**extra):
+    """Commit, machine and timestamp recorded with every result file."""
+    metadata = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "encoder": "stand-in" if STAND_IN_ENCODER else "model",
+    }
+    metadata.update(extra)
+    return metadata
+
+
+def print_stage_table(stages):
+    """Print p50/p95/p99 for a {stage: summary} mapping."""
+    width = max((len(name) for name in stages), default=10)
+    for name, stats in stages.items():
+        if not stats.get("count"):
+            continue
+        print(f"{name:>{width}}: p50 {stats['p50_ms']:8.3f} ms | p95 {stats['p95_ms']:8.3f} ms | "
+              f"p99 {stats['p99_ms']:8.3f} ms | n={stats['count']}")
+
+
+def write_results(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Results written to {path}")
+
+
+def compare_results(current, baseline_path, key="stages", metrics=("p50_ms", "p95_ms")):
+    """Print deltas of current[key] against a previous result file."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = baseline.get(key, {})
+    commit = baseline.get("metadata", {}).get("commit", "baseline")
+    print(f"\n📊 Compared with {commit}:")
+    for name, stats in current.get(key, {}).items():
+        old = previous.get(name)
+        if not old:
+            continue
+        deltas = []
+        for metric in metrics:
+            if old.get(metric) is None or stats.get(metric) is None:
+                continue
+            change = (stats[metric] - old[metric]) / old[metric] * 100.0 if old[metric] else 0.0
+            deltas.append(f"{metric[:-3]} {old[metric]:.3f} -> {stats[metric]:.3f} ms ({change:+.1f}%)")
+        if deltas:
+            print(f"  {name}: " + " | ".join(deltas))
+
+
+def add_output_arguments(parser):
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="previous JSON result to diff against")
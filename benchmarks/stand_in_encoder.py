@@ -0,0 +1,49 @@
+"""Stand-in for SentenceTransformer, for benchmarks on machines without the model.
+
+HashEncoder maps each text to a deterministic random unit vector seeded by
+the MD5 of the text (384 dims, like all-MiniLM-L6-v2). Encoding costs
+almost nothing and needs no download, so timings isolate everything around
+the encoder; similarity between texts is meaningless, so quality numbers
+measured with it (overlap, calibration error) only check the plumbing.
+
+Set CAREER_BENCH_STAND_IN_ENCODER=1 when running a benchmark; harness.py
+installs the stand-in before the repo modules import sentence_transformers.
+"""
+import hashlib
+import sys
+import types
+
+import numpy as np
+
+
+STAND_IN_DIM = 384
+
+
+class HashEncoder:
+    """The subset of the SentenceTransformer API the app and benchmarks use."""
+
+    def __init__(self, *args, **kwargs):
+        self.max_seq_length = 256
+
+    def vector(self, text):
+        rng = np.random.default_rng(int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16))
+        vector = rng.standard_normal(STAND_IN_DIM).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return self.vector(texts)
+        if not len(texts):
+            return np.zeros((0, STAND_IN_DIM), dtype=np.float32)
+        return np.stack([self.vector(text) for text in texts])
+
+    def get_sentence_embedding_dimension(self):
+        return STAND_IN_DIM
+
+
+def install():
+    """Register a sentence_transformers module whose SentenceTransformer is HashEncoder."""
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = HashEncoder
+    module.util = types.SimpleNamespace()
+    sys.modules["sentence_transformers"] = module
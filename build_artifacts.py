@@ -0,0 +1,216 @@
+"""Build the model artifact bundle (career_artifacts.bundle).
+
+Runs train_model.py (the TF-IDF + LinearSVC classifier), the embedding
+step of career_embeddings.py (career vectors for the merged catalog) and
+fits score calibration on a labeled profile corpus (see calibration.py),
+then packs their output with the career similarity graph
+(see career_graph.py; the app and the calibration step read the same
+CAREER_GRAPH_NEIGHBORS), the legacy label encoders and the tokenizer files
+into one versioned bundle (see artifact_bundle.py). The classifier is
+exported to arrays (see text_classifier.py) and checked against the
+pipeline on the training texts; no pickle goes into the bundle. The
+bundle is written under a temporary name and renamed, so a running app
+never sees a half-written one. The catalog is not bundled:
+career_details.json stays its one source, and engines reuse the bundled
+vectors only for careers whose text still matches.
+
+    python build_artifacts.py
+    python build_artifacts.py --skip-train --workers 2 --output /srv/career/career_artifacts.bundle
+    python build_artifacts.py --calibration-corpus labeled_profiles.jsonl
+    CAREER_GRAPH_NEIGHBORS=20 python build_artifacts.py --skip-train --skip-embed
+"""
+import argparse
+import os
+import tempfile
+
+import joblib
+
+from artifact_bundle import ArtifactBundle, BundleWriter, get_bundle_path
+from calibration import (
+    DEFAULT_CALIBRATION_PROFILES, fit_calibration, load_labeled_corpus, print_calibration,
+    synthetic_labeled_corpus,
+)
+from career_data import BASE_DIR, MODEL_DIR, build_career_details, model_file, safe_load_json
+from career_graph import CareerGraph, catalog_digest, get_graph_neighbors
+from embedding_store import CompactEmbeddings, read_manifest
+from embedding_text import EMBEDDING_TEXT_VERSION, build_career_texts, vector_manifest
+from text_classifier import add_to_bundle, check_parity
+
+
+CLASSIFIER_FILE = "career_model.pkl"
+CLASSIFIER_DETAILS_FILE = "career_details.pkl"
+ENCODER_FILES = {"encoders": "encoders.pkl", "target_encoder": "target_encoder.pkl"}
+TOKENIZER_FILES = [
+    "tokenizer.json", "tokenizer_config.json", "special_tokens_map.json", "vocab.txt",
+    "sentence_bert_config.json", "config.json", "modules.json",
+]
+
+
+def train_classifier(build_dir):
+    """Run train_model.py into build_dir. Returns the classifier path."""
+    from train_model import train_and_save_model
+
+    print("👉 Training classifier...")
+    train_and_save_model(build_dir)
+    return os.path.join(build_dir, CLASSIFIER_FILE)
+
+
+def embed_catalog(model_dir, build_dir, workers=1, threads_per_worker=0, batch_size=None):
+    """Embed the merged catalog into build_dir, with its shards in model_dir
+    so an interrupted build resumes. Returns (vectors path, vector manifest)."""
+    from career_embeddings import DEFAULT_BATCH_SIZE, MODEL_NAME, SHARD_DIR_NAME, embed_texts_sharded
+
+    careers = build_career_details(safe_load_json(model_file("career_details.json", model_dir), {}))
+    names = list(careers.keys())
+    texts = build_career_texts(careers, names)
+    path = os.path.join(build_dir, "career_vectors.npy")
+    print(f"👉 Embedding {len(texts)} careers (text template v{EMBEDDING_TEXT_VERSION})...")
+    embed_texts_sharded(texts, path, workers=workers, threads_per_worker=threads_per_worker,
+                        batch_size=batch_size or DEFAULT_BATCH_SIZE,
+                        shard_dir=os.path.join(model_dir, SHARD_DIR_NAME))
+    return path, vector_manifest(names, texts, MODEL_NAME, "float32")
+
+
+def fit_score_calibration(model_dir, vectors_path, corpus_path=None, profiles=DEFAULT_CALIBRATION_PROFILES):
+    """Run the engine over the calibration corpus with the new vectors and
+    fit the score calibration."""
+    from recommender import RecommendationEngine, load_embedding_model
+
+    corpus, labels = load_labeled_corpus(corpus_path) if corpus_path else synthetic_labeled_corpus(profiles)
+    print(f"👉 Fitting score calibration on {len(corpus)} profiles...")
+    careers = build_career_details(safe_load_json(model_file("career_details.json", model_dir), {}))
+    engine = RecommendationEngine(careers, load_embedding_model(),
+                                  career_matrix=CompactEmbeddings.load(vectors_path))
+    calibration = fit_calibration(engine, corpus, labels)
+    calibration.info["corpus"] = os.path.basename(corpus_path) if corpus_path else "synthetic"
+    print_calibration(calibration)
+    return calibration
+
+
+def label_classes(path):
+    """Classes of a pickled LabelEncoder, or {name: classes} for a dict of them."""
+    encoder = joblib.load(path)
+    if isinstance(encoder, dict):
+        return {name: [str(value) for value in item.classes_] for name, item in encoder.items()}
+    return [str(value) for value in encoder.classes_]
+
+
+def check_classifier_export(model):
+    """Fail the build if the exported classifier scores the training texts
+    differently from the sklearn pipeline."""
+    from train_model import build_dataset
+
+    texts, _ = build_dataset()
+    error = check_parity(model, texts)
+    print(f"👉 Classifier exported: {len(model.classes_)} classes, max score difference {error:.1e}")
+
+
+def build_career_graph(vectors, vectors_manifest, k):
+    """k-NN graph over the career vectors, tagged with the catalog they
+    came from so engines on another catalog build their own."""
+    digest = catalog_digest(vectors_manifest.get("names", []), vectors_manifest.get("row_digests", []),
+                            vectors_manifest.get("model", ""))
+    graph = CareerGraph.build(vectors, k, info={"catalog": digest})
+    print(f"👉 Career graph: {len(graph)} careers, {graph.edges} edges (k={graph.info['k']})")
+    return graph
+
+
+def pack_bundle(output, model_dir, classifier_path, vectors_path, vectors_manifest, calibration=None,
+                tokenizer_dir=BASE_DIR, graph_neighbors=None):
+    """Write the bundle from built and checked-in artifacts. Returns its manifest."""
+    writer = BundleWriter({"model_dir": os.path.abspath(model_dir), "text_template": EMBEDDING_TEXT_VERSION})
+
+    # Stored as float32 whatever the embedding step kept (int8 rows are rescaled)
+    vectors = CompactEmbeddings.load(vectors_path, mmap_mode="r").to_float()
+    writer.add_array("career_vectors", vectors, meta={**vectors_manifest, "dtype": "float32"})
+    writer.add_json("career_names", vectors_manifest.get("names", []))
+    graph_neighbors = get_graph_neighbors() if graph_neighbors is None else graph_neighbors
+    if graph_neighbors:
+        build_career_graph(vectors, vectors_manifest, graph_neighbors).add_to_bundle(writer)
+
+    if classifier_path and os.path.exists(classifier_path):
+        # Unpickled here, at build time only; the bundle holds plain arrays
+        model = joblib.load(classifier_path)
+        check_classifier_export(model)
+        add_to_bundle(writer, model)
+        details_path = os.path.join(os.path.dirname(classifier_path), CLASSIFIER_DETAILS_FILE)
+        if os.path.exists(details_path):
+            writer.add_json("classifier_details", joblib.load(details_path))
+
+    if calibration is not None:
+        calibration.add_to_bundle(writer)
+
+    # The label encoders are only lists of classes, kept as JSON
+    for name, filename in ENCODER_FILES.items():
+        path = model_file(filename, model_dir)
+        if os.path.exists(path):
+            writer.add_json(name, label_classes(path))
+
+    for filename in TOKENIZER_FILES:
+        path = os.path.join(tokenizer_dir, filename)
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as f:
+                writer.add_bytes(f"tokenizer/{filename}", f.read())
+
+    return writer.write(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build career_artifacts.bundle from training and embedding.")
+    parser.add_argument("--model-dir", default=MODEL_DIR, help="model dir (its career_details.json and encoders, else the checked-in ones)")
+    parser.add_argument("--output", help="bundle path (default: <model dir>/career_artifacts.bundle)")
+    parser.add_argument("--skip-train", action="store_true", help=f"use the existing {CLASSIFIER_FILE}")
+    parser.add_argument("--skip-embed", action="store_true",
+                        help="use the existing career_vectors.npy (it must have a manifest)")
+    parser.add_argument("--skip-calibration", action="store_true", help="bundle without score calibration")
+    parser.add_argument("--calibration-corpus", help="labeled JSONL profiles (default: synthetic corpus)")
+    parser.add_argument("--calibration-profiles", type=int, default=DEFAULT_CALIBRATION_PROFILES,
+                        help="size of the synthetic calibration corpus")
+    parser.add_argument("--workers", type=int, default=1, help="embedding processes")
+    parser.add_argument("--threads-per-worker", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=0)
+    args = parser.parse_args()
+
+    output = args.output or get_bundle_path(args.model_dir)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="career_build_") as build_dir:
+        if args.skip_train:
+            classifier_path = model_file(CLASSIFIER_FILE, args.model_dir)
+        else:
+            classifier_path = train_classifier(build_dir)
+
+        if args.skip_embed:
+            vectors_path = os.path.join(args.model_dir, "career_vectors.npy")
+            vectors_manifest = read_manifest(vectors_path)
+            if not vectors_manifest:
+                parser.error(f"{vectors_path} has no manifest; run the embedding step")
+        else:
+            vectors_path, vectors_manifest = embed_catalog(
+                args.model_dir, build_dir, args.workers, args.threads_per_worker, args.batch_size
+            )
+
+        calibration = None
+        if not args.skip_calibration:
+            calibration = fit_score_calibration(args.model_dir, vectors_path, args.calibration_corpus,
+                                                args.calibration_profiles)
+
+        manifest = pack_bundle(output, args.model_dir, classifier_path, vectors_path, vectors_manifest, calibration)
+
+    if not args.skip_embed:
+        from career_embeddings import SHARD_DIR_NAME, remove_shard_dir
+
+        # The vectors are in the bundle now; the shards were only kept for a resume
+        remove_shard_dir(os.path.join(args.model_dir, SHARD_DIR_NAME))
+
+    # Read it back the way the app will, checksums included
+    bundle = ArtifactBundle(output, verify=True)
+    for name, entry in sorted(manifest["sections"].items(), key=lambda item: item[1]["offset"]):
+        shape = f" {tuple(entry['shape'])}" if entry["kind"] == "array" else ""
+        print(f"  {name:<40} {entry['kind']:<6} {entry['size'] / 1024:9.1f} KB{shape}")
+    print(f"✅ Artifact bundle {bundle.version} written to {output} "
+          f"({os.path.getsize(output) / 1024:.1f} KB, {len(manifest['sections'])} sections)")
+    bundle.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Calibrated match percentages.
+
+A Calibration maps raw scores to smoothed isotonic curves, one per score
+source ("similarity" or "fallback"), kept inside CALIBRATED_RANGE so they
+never reorder a list. Curves are fitted offline by build_artifacts.py (or
+`python calibration.py`) and only used for the catalog they were fitted
+on. The default labels come from the ranker's own field rules
+(profile_corpus.label_profile), so the result is a heuristic estimate, not
+a measured probability. Set CAREER_CALIBRATION=0 to show raw scores.
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from profile_corpus import generate_profile_corpus, label_profile
+
+
+CALIBRATION_FORMAT_VERSION = 2
+SCORE_SOURCES = ("similarity", "fallback")
+DEFAULT_SOURCE = "similarity"
+MIN_CURVE_SAMPLES = 50
+# Calibrated scores stay inside this range: no career is a certain fit or
+# misfit. Fitted curves stay inside KNOT_RANGE and only their tails come closer
+CALIBRATED_RANGE = (0.02, 0.98)
+KNOT_RANGE = (0.05, 0.95)
+RELIABILITY_BINS = 10
+DEFAULT_CALIBRATION_PROFILES = 2000
+
+
+def get_calibration_enabled():
+    return os.environ.get("CAREER_CALIBRATION", "1").strip().lower() not in ("0", "false", "no")
+
+
+def fit_isotonic(scores, labels):
+    """Smoothed non-decreasing curve through (score, label) by pool-adjacent-violators.
+
+    Returns (x, y) knots, one per pooled block at its mean score and mean
+    label. Blocks are pooled until their labels strictly increase and
+    apply_curve interpolates linearly between them, so scores in different
+    blocks do not tie; labels are squeezed into KNOT_RANGE, so no score
+    is calibrated to exactly 0 or 1.
+    """
+    order = np.argsort(scores, kind="stable")
+    scores = np.asarray(scores, dtype=np.float64)[order]
+    labels = np.asarray(labels, dtype=np.float64)[order]
+    # Equal scores start as one block
+    unique, starts, counts = np.unique(scores, return_index=True, return_counts=True)
+    sums = np.add.reduceat(labels, starts)
+
+    # [label sum, score sum, count] per block
+    blocks = []
+    for value, total, count in zip(unique, sums, counts):
+        blocks.append([total, value * count, count])
+        while len(blocks) > 1 and blocks[-2][0] * blocks[-1][2] >= blocks[-1][0] * blocks[-2][2]:
+            last = blocks.pop()
+            blocks[-1] = [a + b for a, b in zip(blocks[-1], last)]
+
+    label_sums, score_sums, counts = np.asarray(blocks, dtype=np.float64).T
+    low, high = KNOT_RANGE
+    return score_sums / counts, low + (high - low) * label_sums / counts
+
+
+def apply_curve(curve, scores):
+    """Calibrated scores from (x, y) knots: linear between knots and, beyond
+    the outermost ones, bending towards the CALIBRATED_RANGE limits without
+    reaching them, so the tails do not flatten into ties."""
+    x, y = curve
+    low, high = CALIBRATED_RANGE
+    scores = np.asarray(scores, dtype=np.float64)
+    calibrated = np.interp(scores, x, y)
+    if len(x) > 1:
+        # Each tail starts with the slope of its end segment
+        slope, gap = (y[1] - y[0]) / (x[1] - x[0]), y[0] - low
+        if gap > 0:
+            tail = low + gap * np.exp(slope * np.minimum(scores - x[0], 0.0) / gap)
+            calibrated = np.where(scores < x[0], tail, calibrated)
+        slope, gap = (y[-1] - y[-2]) / (x[-1] - x[-2]), high - y[-1]
+        if gap > 0:
+            tail = high - gap * np.exp(-slope * np.maximum(scores - x[-1], 0.0) / gap)
+            calibrated = np.where(scores > x[-1], tail, calibrated)
+    return calibrated
+
+
+def expected_calibration_error(probabilities, labels, bins=RELIABILITY_BINS):
+    """Mean |confidence - accuracy| over equal-width bins, weighted by bin size."""
+    probabilities = np.clip(np.asarray(probabilities, dtype=np.float64), 0.0, 1.0)
+    labels = np.asarray(labels, dtype=np.float64)
+    if not len(labels):
+        return 0.0
+    index = np.minimum((probabilities * bins).astype(np.intp), bins - 1)
+    confidence = np.bincount(index, weights=probabilities, minlength=bins)
+    accuracy = np.bincount(index, weights=labels, minlength=bins)
+    return float(np.abs(confidence - accuracy).sum() / len(labels))
+
+
+def brier_score(probabilities, labels):
+    probabilities = np.clip(np.asarray(probabilities, dtype=np.float64), 0.0, 1.0)
+    return float(np.mean((probabilities - np.asarray(labels, dtype=np.float64)) ** 2)) if len(labels) else 0.0
+
+
+class Calibration:
+    """Isotonic curves per score source; scores of a source without a curve
+    (too few samples to fit one) pass through unchanged."""
+
+    def __init__(self, curves, info=None):
+        self.curves = {
+            source: (np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+            for source, (x, y) in curves.items()
+        }
+        self.info = info or {}
+
+    def transform(self, scores, source=DEFAULT_SOURCE):
+        """Calibrated probabilities for an array of raw scores."""
+        curve = self.curves.get(source)
+        scores = np.asarray(scores, dtype=np.float64)
+        if curve is None:
+            return scores
+        return apply_curve(curve, scores)
+
+    def apply(self, recommendations, source=DEFAULT_SOURCE):
+        """[(career, score)] with every score calibrated in one call."""
+        if not recommendations:
+            return recommendations
+        scores = self.transform([score for _, score in recommendations], source)
+        return [(career, float(score)) for (career, _), score in zip(recommendations, scores)]
+
+    def add_to_bundle(self, writer):
+        writer.add_json("calibration/config", {
+            "version": CALIBRATION_FORMAT_VERSION,
+            "method": "isotonic",
+            "sources": sorted(self.curves),
+            "info": self.info,
+        })
+        for source, (x, y) in self.curves.items():
+            writer.add_array(f"calibration/{source}/x", x)
+            writer.add_array(f"calibration/{source}/y", y)
+
+    @classmethod
+    def from_bundle(cls, bundle):
+        config = bundle.json("calibration/config")
+        if config.get("version") != CALIBRATION_FORMAT_VERSION:
+            raise ValueError(f"Unsupported calibration format: {config.get('version')}")
+        curves = {
+            source: (bundle.array(f"calibration/{source}/x"), bundle.array(f"calibration/{source}/y"))
+            for source in config["sources"]
+        }
+        return cls(curves, config.get("info"))
+
+
+def load_calibration(bundle, digest):
+    """Calibration stored in an artifact bundle if it was fitted on the
+    catalog identified by digest (see career_graph.catalog_digest), else
+    None; also None if CAREER_CALIBRATION=0."""
+    if bundle is None or "calibration/config" not in bundle or not get_calibration_enabled():
+        return None
+    try:
+        calibration = Calibration.from_bundle(bundle)
+    except (KeyError, ValueError) as e:
+        print(f"Ignoring calibration in {bundle.path}: {e}")
+        return None
+    if calibration.info.get("catalog") != digest:
+        print(f"Calibration in {bundle.path} was fitted on another catalog, showing raw scores")
+        return None
+    return calibration
+
+
+def load_labeled_corpus(path):
+    """(selections list, set of fitting careers per profile) from a labeled JSONL corpus."""
+    corpus, labels = [], []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                corpus.append(record["selections"])
+                labels.append(set(record["careers"]))
+    return corpus, labels
+
+
+def synthetic_labeled_corpus(size=DEFAULT_CALIBRATION_PROFILES, seed=7):
+    corpus = generate_profile_corpus(size, seed)
+    return corpus, [label_profile(selections) for selections in corpus]
+
+
+def collect_scores(engine, corpus, labels, batch_size=64):
+    """{source: (raw scores, 0/1 labels)} over every recommendation the
+    engine makes for the corpus."""
+    collected = {source: ([], []) for source in SCORE_SOURCES}
+    for start in range(0, len(corpus), batch_size):
+        ranked = engine.rank_batch(corpus[start:start + batch_size])
+        for (recommendations, source), fitting in zip(ranked, labels[start:start + batch_size]):
+            scores, hits = collected[source]
+            for career, score in recommendations:
+                scores.append(score)
+                hits.append(1.0 if career in fitting else 0.0)
+    return {source: (np.asarray(scores), np.asarray(hits)) for source, (scores, hits) in collected.items()}
+
+
+def fit_calibration(engine, corpus, labels):
+    """Fit one curve per score source with enough samples; the others are
+    listed as skipped and keep raw scores. The returned Calibration's info
+    records the engine's catalog digest, sample counts and in-sample ECE /
+    Brier score of raw and calibrated scores."""
+    curves = {}
+    info = {"profiles": len(corpus), "catalog": engine.catalog_digest, "sources": {}, "skipped": {}}
+    for source, (scores, hits) in collect_scores(engine, corpus, labels).items():
+        if len(scores) < MIN_CURVE_SAMPLES:
+            info["skipped"][source] = int(len(scores))
+            continue
+        curves[source] = fit_isotonic(scores, hits)
+        calibrated = apply_curve(curves[source], scores)
+        info["sources"][source] = {
+            "samples": int(len(scores)),
+            "positive_rate": float(hits.mean()),
+            "ece_raw": expected_calibration_error(scores, hits),
+            "ece_calibrated": expected_calibration_error(calibrated, hits),
+            "brier_raw": brier_score(scores, hits),
+            "brier_calibrated": brier_score(calibrated, hits),
+        }
+    return Calibration(curves, info)
+
+
+def print_calibration(calibration):
+    for source, stats in calibration.info.get("sources", {}).items():
+        print(f"  {source}: {stats['samples']} scores, {stats['positive_rate']:.0%} fitting, "
+              f"ECE {stats['ece_raw']:.3f} -> {stats['ece_calibrated']:.3f}, "
+              f"Brier {stats['brier_raw']:.3f} -> {stats['brier_calibrated']:.3f}")
+    for source, samples in calibration.info.get("skipped", {}).items():
+        print(f"  {source}: {samples} scores, fewer than {MIN_CURVE_SAMPLES}; not calibrated (raw scores)")
+
+
+def main():
+    from career_data import MODEL_DIR
+    from recommender import RecommendationEngine
+
+    parser = argparse.ArgumentParser(description="Fit score calibration and print its reliability.")
+    parser.add_argument("--corpus", help="labeled JSONL corpus (default: synthetic profiles)")
+    parser.add_argument("--profiles", type=int, default=DEFAULT_CALIBRATION_PROFILES)
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    args = parser.parse_args()
+
+    corpus, labels = load_labeled_corpus(args.corpus) if args.corpus else synthetic_labeled_corpus(args.profiles)
+    calibration = fit_calibration(RecommendationEngine.load(args.model_dir), corpus, labels)
+    print_calibration(calibration)
+    print("Run build_artifacts.py to store a fitted calibration in the artifact bundle")
+
+
+if __name__ == "__main__":
+    main()
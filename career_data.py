@@ -0,0 +1,932 @@
+import os
+import json
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Generated artifacts (vector caches, the bundle, downloaded models) go to the
+# untracked model dir, never over the files checked in next to the code;
+# CAREER_MODEL_DIR points elsewhere
+MODEL_DIR = os.path.abspath(os.environ.get("CAREER_MODEL_DIR") or os.path.join(BASE_DIR, "model"))
+
+
+def model_file(name, model_dir=MODEL_DIR):
+    """Path of an input file: model_dir's copy if it has one, else the one
+    checked in next to the code."""
+    path = os.path.join(model_dir, name)
+    return path if os.path.exists(path) else os.path.join(BASE_DIR, name)
+
+
+def safe_load_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except:
+        return default
+
+
+# ------------ CAREER DATA ------------
+DOCTOR_SPECIALTIES = {
+    "Cardiologist": "Heart and blood vessel specialist. Treats heart attacks, hypertension, and cardiac diseases.",
+    "Neurologist": "Deals with brain and nervous system disorders like epilepsy, stroke, migraine, etc.",
+    "Dermatologist": "Skin, hair and nail specialist. Handles acne, allergies, skin infections and cosmetic dermatology.",
+    "Pediatrician": "Child specialist doctor, focusing on infants and children's growth, health and vaccination.",
+}
+
+CAREER_MAPPINGS = {
+    "streams": ["Science", "Commerce", "Arts", "Other"],
+    "fields": {
+        "Science": ["Medical & Healthcare", "Engineering & Technology", "Research & Development", "Data Science & Analytics"],
+        "Commerce": [
+            "Finance & Accounting Path",
+            "Business & Management",
+            "Economics & Data",
+            "Banking & Government Services",
+            "Law & Corporate Governance",
+            "Creative + Business Fusion",
+            "Tech + Commerce",
+            "International Career"
+        ],
+        "Arts": ["Law & Legal Services", "Psychology & Counseling", "Media & Journalism", "Design & Creative Arts"],
+        "Other": ["Government Services", "Defense", "Sports", "Other"]
+    },
+    "roles": {
+        "Medical & Healthcare": ["Doctor", "Dentist", "Nurse", "Pharmacist", "Medical Researcher"],
+        "Engineering & Technology": ["Software Engineer", "Data Scientist", "Mechanical Engineer", "Civil Engineer", "Electronics Engineer", "Aerospace Engineer"],
+        "Research & Development": ["Research Scientist", "Biotechnologist", "Lab Technician", "Biomedical Scientist"],
+        "Data Science & Analytics": ["Data Scientist", "Business Analyst", "AI Engineer", "Data Analyst"],
+        "Finance & Accounting Path": [
+            "Chartered Accountant (CA)",
+            "Cost & Management Accountant (CMA)",
+            "Company Secretary (CS)",
+            "CPA / ACCA Professional"
+        ],
+        "Business & Management": [
+            "BBA Graduate (Marketing/HR/Finance/IB)",
+            "MBA Leadership Roles",
+            "Entrepreneur / Startup Founder",
+            "Supply Chain & Logistics Manager",
+            "Hospitality / Hotel Management",
+            "Business Manager / Corporate Strategist"
+        ],
+        "Economics & Data": [
+            "BA/BSc Economics Specialist",
+            "Actuarial Scientist",
+            "Business Analytics Professional",
+            "Data Analyst (Business Intelligence)"
+        ],
+        "Banking & Government Services": [
+            "Banking Officer (IBPS/SBI PO)",
+            "UPSC / SSC / Railways / Defence Accounts",
+            "RBI / SEBI / Finance Officer"
+        ],
+        "Law & Corporate Governance": [
+            "B.Com + LLB Graduate",
+            "Corporate Lawyer",
+            "Company Secretary (CS)"
+        ],
+        "Creative + Business Fusion": [
+            "Advertising / Digital Marketing Manager",
+            "Media Management Professional",
+            "Event Management Specialist",
+            "Fashion Business & Retail Strategist"
+        ],
+        "Tech + Commerce": [
+            "FinTech Product Specialist",
+            "E-Commerce Manager",
+            "Business IT (BCA with Specialization)",
+            "Cyber Finance Compliance Analyst"
+        ],
+        "International Career": [
+            "International Business Manager",
+            "Import & Export Consultant",
+            "Foreign Trade Specialist (IIFT etc.)",
+            "Global CFO / Finance Professional (CPA/ACCA)"
+        ],
+        "Law & Legal Services": ["Lawyer", "Corporate Lawyer", "Judge", "Legal Consultant"],
+        "Psychology & Counseling": ["Psychologist", "Clinical Psychologist", "Therapist", "Counselor"],
+        "Media & Journalism": ["Journalist", "Content Creator", "News Anchor", "Media Strategist"],
+        "Design & Creative Arts": ["Graphic Designer", "UI/UX Designer", "Animator", "Game Designer"],
+        "Government Services": ["IAS Officer", "IPS Officer", "Government Clerk", "Policy Analyst"],
+        "Defense": ["Army Officer", "Navy Officer", "Air Force Officer", "Defense Scientist"],
+        "Sports": ["Athlete", "Sports Coach", "Fitness Trainer", "Sports Scientist"],
+        "Other": ["Entrepreneur", "Consultant", "Freelancer", "Teacher"]
+    }
+}
+
+# Map fields to streams for quick lookup
+FIELD_TO_STREAM = {}
+for stream_name, fields in CAREER_MAPPINGS["fields"].items():
+    for field_name in fields:
+        FIELD_TO_STREAM[field_name] = stream_name
+
+# Build a reverse lookup from role/career to the streams where it appears
+STREAM_ROLE_MAP = {}
+for stream_name, fields in CAREER_MAPPINGS["fields"].items():
+    for field_name in fields:
+        for role_name in CAREER_MAPPINGS["roles"].get(field_name, []):
+            STREAM_ROLE_MAP.setdefault(role_name, set()).add(stream_name)
+
+# Build a reverse lookup from role/career to fields for prioritization
+FIELD_ROLE_MAP = {}
+for field_name, roles in CAREER_MAPPINGS["roles"].items():
+    for role_name in roles:
+        FIELD_ROLE_MAP.setdefault(role_name, set()).add(field_name)
+
+ENHANCED_CAREER_DETAILS = {
+    "Software Engineer": {
+        "description": "Design, develop, and maintain software systems and applications. Work across various domains like web development, mobile apps, AI systems, and enterprise software.",
+        "education": ["Bachelor's in Computer Science", "Bachelor's in Software Engineering", "Master's in Computer Science"],
+        "skills": ["Programming", "Algorithms", "Data Structures", "Software Design", "Testing", "Debugging"],
+        "salary": "₹6-25 LPA (Fresh Graduate: ₹6-12 LPA, Senior: ₹15-25 LPA+)",
+        "market": "High demand with 20%+ growth expected. Opportunities in IT services, product companies, startups.",
+        "pros": ["High salary potential (₹15-25 LPA+ for experienced)", "Remote work flexibility", "Global job opportunities", "Creative problem-solving", "Fast career growth", "Startup equity potential"],
+        "cons": ["Long working hours during project deadlines", "Need to constantly learn new technologies", "High competition for top companies", "Can be mentally exhausting", "Age bias in some companies"],
+        "roadmap": [
+            "Complete 12th with PCM/CS",
+            "Clear JEE/State CET for B.Tech CSE or pursue BCA",
+            "Learn programming languages (Python/Java/C++/JavaScript)",
+            "Build projects and contribute to GitHub",
+            "Intern at IT companies during college",
+            "Prepare for technical interviews (DSA, system design)",
+            "Start as software developer and progress to senior roles"
+        ]
+    },
+    "Data Scientist": {
+        "description": "Extract insights from complex data using statistical analysis, machine learning, and data visualization techniques.",
+        "education": ["Bachelor's in Computer Science/Statistics", "Master's in Data Science", "MBA in Analytics"],
+        "skills": ["Python/R", "Machine Learning", "Statistics", "SQL", "Data Visualization"],
+        "salary": "₹8-30 LPA (Fresh: ₹8-15 LPA, Senior: ₹20-30 LPA+)",
+        "market": "Rapidly growing field with high demand across industries like finance, healthcare, e-commerce.",
+        "pros": ["High demand in AI/ML companies", "Excellent compensation (₹20-30 LPA+ for experienced)", "Work with cutting-edge AI technology", "Make data-driven business decisions", "Diverse industry applications", "Research opportunities"],
+        "cons": ["Requires strong mathematical and statistical background", "Dealing with messy/incomplete data", "Complex problem-solving under pressure", "Need to stay updated with ML frameworks", "High expectations from stakeholders"],
+        "roadmap": [
+            "Complete 12th with PCM/CS",
+            "Pursue B.Tech/B.Sc in CS/Statistics/Mathematics",
+            "Learn Python, SQL, and statistics fundamentals",
+            "Master ML frameworks (TensorFlow, scikit-learn, PyTorch)",
+            "Build data science projects and Kaggle competitions",
+            "Pursue internships and ML certifications",
+            "Start as data analyst and progress to data scientist"
+        ]
+    },
+    "Doctor": {
+        "description": "Medical professional diagnosing and treating illnesses, injuries, and providing healthcare services to patients.",
+        "education": ["MBBS (5.5 years)", "MD/MS for specialization", "Residency Training"],
+        "skills": ["Medical Knowledge", "Diagnosis", "Patient Care", "Communication", "Emergency Handling"],
+        "salary": "₹10-50 LPA (Junior: ₹10-15 LPA, Specialist: ₹25-50 LPA+)",
+        "market": "Always in demand with stable career prospects. Opportunities in hospitals, clinics, research.",
+        "pros": ["Excellent job security and demand", "High respect and prestige in society", "Opportunity to save lives and help people", "Diverse specializations (Cardiology, Neurology, etc.)", "High earning potential (₹25-50 LPA+ for specialists)", "Can start own clinic or practice"],
+        "cons": ["Very long education period (5.5 years MBBS + 3 years MD/MS)", "Extremely high stress and pressure", "Long working hours (often 12+ hours)", "Emotional challenges dealing with patient suffering", "High competition for NEET seats", "Expensive medical education"],
+        "roadmap": [
+            "Class 11-12 with PCB (Physics, Chemistry, Biology)",
+            "Crack NEET-UG to secure MBBS seat",
+            "Complete MBBS (5.5 years including internship)",
+            "Clear NEET-PG or INI CET for specialization",
+            "Complete MD/MS + residency for roles such as Neurosurgeon, Cardiologist, etc."
+        ],
+        "sub_specialty_steps": {
+            "Neurosurgeon": [
+                "MBBS + NEET-PG",
+                "MS in General Surgery",
+                "MCh / DNB Super Specialization in Neurosurgery"
+            ],
+            "Nurse": [
+                "Physics-Chemistry-Biology in 12th",
+                "Qualify entrance for B.Sc. Nursing / GNM",
+                "Clear state nursing council exams + internship"
+            ]
+        }
+    },
+    "Pharmacist": {
+        "description": "Dispense medicines, counsel patients on correct usage, manage drug inventory, and ensure regulatory compliance in retail or clinical settings.",
+        "education": ["Diploma in Pharmacy (D.Pharm)", "Bachelor of Pharmacy (B.Pharm)", "Master of Pharmacy (M.Pharm)", "Pharm.D"],
+        "skills": ["Pharmacology", "Drug Dispensing", "Patient Counseling", "Inventory Management", "Regulatory Compliance", "Attention to Detail"],
+        "salary": "₹3-12 LPA (Retail: ₹3-6 LPA, Hospital: ₹4-8 LPA, Industry/Senior Roles: ₹8-12 LPA)",
+        "market": "Steady demand across hospitals, retail chains, government health centers, and pharmaceutical companies.",
+        "pros": ["Multiple work settings (retail, hospital, industry, government)", "Option to start own medical store/pharmacy", "High trust and respect in healthcare", "Growing healthcare sector with steady demand", "Lower entry barrier than MBBS", "Flexible career paths"],
+        "cons": ["Long hours standing on feet in retail", "Strict regulatory oversight and compliance", "Need to constantly stay updated with new drugs", "Moderate salary in retail (₹3-6 LPA)", "High competition for government jobs", "Initial investment for own shop"],
+        "paths": [
+            {
+                "title": "Retail / Community Pharmacist",
+                "description": "Open your own medical store or manage a chain pharmacy. Handle prescriptions, inventory, and patient guidance."
+            },
+            {
+                "title": "Hospital / Clinical Pharmacist",
+                "description": "Work with doctors inside hospitals to prepare and dispense medications, monitor drug interactions, and support patient recovery."
+            },
+            {
+                "title": "Pharmaceutical Industry Specialist",
+                "description": "Join pharma manufacturing, quality assurance, medical coding, or drug safety teams with opportunities for rapid growth."
+            },
+            {
+                "title": "Government & Regulatory Services",
+                "description": "Clear Drug Inspector or government health department exams to oversee compliance, licensing, and public drug programs."
+            }
+        ],
+        "roadmap": [
+            "Study PCB (or PCM) in Class 11-12",
+            "Appear for state CET/entrance for D.Pharm or B.Pharm",
+            "Complete internship + register with State Pharmacy Council",
+            "Optionally pursue M.Pharm/Pharm.D for advanced roles",
+            "For own shop: obtain drug license + GST + setup approvals",
+            "For government roles: clear Drug Inspector/Pharmacist exams"
+        ]
+    },
+    "Business Manager": {
+        "description": "Oversee business operations, manage teams, and drive organizational growth and strategy.",
+        "education": ["Bachelor's in Business Administration", "MBA", "Industry-specific certifications"],
+        "skills": ["Leadership", "Strategic Planning", "Team Management", "Communication", "Problem-solving"],
+        "salary": "₹8-40 LPA (Junior: ₹8-15 LPA, Senior: ₹25-40 LPA+)",
+        "market": "Consistent demand across all industries. Essential for organizational success.",
+        "pros": ["Leadership and decision-making authority", "Excellent compensation (₹25-40 LPA+ for senior roles)", "Diverse industry exposure", "Fast career progression to C-suite", "Networking opportunities", "Strategic impact on business"],
+        "cons": ["High responsibility and accountability", "Stressful decision-making under pressure", "Work-life balance challenges", "Need to manage difficult stakeholders", "Performance pressure from top management"],
+        "roadmap": [
+            "Complete 12th in Commerce/Science/Arts",
+            "Pursue BBA or relevant bachelor's degree",
+            "Gain work experience (2-3 years recommended)",
+            "Pursue MBA from reputed institute (CAT/XAT/GMAT)",
+            "Start in entry-level management roles",
+            "Progress to senior management positions",
+            "Optionally pursue executive MBA or certifications"
+        ]
+    },
+    "Dentist": {
+        "description": "Diagnose and treat dental issues, perform oral surgeries, and provide preventive dental care to patients.",
+        "education": ["BDS (Bachelor of Dental Surgery)", "MDS for specialization", "Dental Council Registration"],
+        "skills": ["Dental Procedures", "Oral Surgery", "Patient Care", "Manual Dexterity", "Diagnosis"],
+        "salary": "₹6-25 LPA (Fresh: ₹6-10 LPA, Specialist: ₹15-25 LPA+)",
+        "market": "Steady demand in private clinics, hospitals, and government dental facilities.",
+        "pros": ["Flexible work hours compared to doctors", "Can start own dental clinic", "Good income potential (₹15-25 LPA+ for specialists)", "Helping people with oral health", "Less competition than MBBS", "Shorter education than MBBS"],
+        "cons": ["Long education (5 years BDS + 3 years MDS for specialization)", "Physical strain from standing and working with hands", "High equipment costs for own practice (₹10-50 lakhs)", "Need to manage clinic operations if self-employed", "Competition in urban areas"],
+        "roadmap": [
+            "Complete 12th with PCB",
+            "Clear NEET-UG for BDS admission",
+            "Complete BDS (5 years including internship)",
+            "Register with Dental Council of India",
+            "Optionally pursue MDS for specialization (Orthodontics, Oral Surgery, etc.)",
+            "Start practice or join dental clinic/hospital"
+        ]
+    },
+    "Nurse": {
+        "description": "Provide patient care, assist doctors, administer medications, and monitor patient health in hospitals and clinics.",
+        "education": ["B.Sc Nursing", "GNM (General Nursing & Midwifery)", "Post Basic B.Sc Nursing"],
+        "skills": ["Patient Care", "Medical Procedures", "Communication", "Empathy", "Emergency Response"],
+        "salary": "₹3-12 LPA (Staff Nurse: ₹3-6 LPA, Senior Nurse: ₹8-12 LPA)",
+        "market": "High demand in hospitals, clinics, nursing homes, and community health centers.",
+        "pros": ["Job security", "Opportunity to help people", "Diverse work settings", "Career progression"],
+        "cons": ["Physically demanding", "Shift work", "Emotional stress", "Long hours"],
+        "roadmap": [
+            "Complete 12th with PCB",
+            "Qualify for B.Sc Nursing/GNM entrance exams",
+            "Complete nursing degree (4 years for B.Sc, 3.5 years for GNM)",
+            "Register with State Nursing Council",
+            "Clear nursing license exam",
+            "Start as staff nurse and progress to senior roles"
+        ]
+    },
+    "Mechanical Engineer": {
+        "description": "Design, develop, and maintain mechanical systems, machinery, and manufacturing processes across industries.",
+        "education": ["B.Tech in Mechanical Engineering", "M.Tech for specialization", "Industry certifications"],
+        "skills": ["CAD/CAM", "Machine Design", "Thermodynamics", "Manufacturing Processes", "Project Management"],
+        "salary": "₹5-20 LPA (Fresh: ₹5-8 LPA, Senior: ₹12-20 LPA+)",
+        "market": "Stable demand in manufacturing, automotive, energy, and infrastructure sectors.",
+        "pros": ["Diverse industry options", "Hands-on work", "Good job stability", "Technical challenges"],
+        "cons": ["Can be physically demanding", "Manufacturing sector fluctuations", "Need continuous learning"],
+        "roadmap": [
+            "Complete 12th with PCM",
+            "Clear JEE/State CET for B.Tech Mechanical",
+            "Complete B.Tech (4 years)",
+            "Gain internship experience",
+            "Optionally pursue M.Tech in specialized areas",
+            "Start as design engineer or production engineer"
+        ]
+    },
+    "Civil Engineer": {
+        "description": "Design, construct, and maintain infrastructure projects like buildings, roads, bridges, and water systems.",
+        "education": ["B.Tech in Civil Engineering", "M.Tech in Structural/Transportation Engineering"],
+        "skills": ["Structural Design", "Construction Management", "Surveying", "AutoCAD", "Project Planning"],
+        "salary": "₹4-18 LPA (Fresh: ₹4-7 LPA, Senior: ₹10-18 LPA+)",
+        "market": "Consistent demand due to infrastructure development and urbanization projects.",
+        "pros": ["Tangible results", "Job stability", "Government opportunities", "Field work"],
+        "cons": ["Site-based work", "Weather dependent", "Safety risks", "Long hours on sites"],
+        "roadmap": [
+            "Complete 12th with PCM",
+            "Clear JEE/State CET for B.Tech Civil",
+            "Complete B.Tech (4 years)",
+            "Gain site experience through internships",
+            "Optionally pursue M.Tech or get licensed",
+            "Start as site engineer or design engineer"
+        ]
+    },
+    "Electronics Engineer": {
+        "description": "Design and develop electronic circuits, embedded systems, and communication devices for various applications.",
+        "education": ["B.Tech in Electronics/ECE", "M.Tech in VLSI/Embedded Systems"],
+        "skills": ["Circuit Design", "Embedded Systems", "Microcontrollers", "Signal Processing", "PCB Design"],
+        "salary": "₹5-22 LPA (Fresh: ₹5-9 LPA, Senior: ₹12-22 LPA+)",
+        "market": "Growing demand in consumer electronics, IoT, automotive, and telecommunications.",
+        "pros": ["Innovation opportunities", "Diverse applications", "Good salary growth", "Tech-focused"],
+        "cons": ["Rapid technology changes", "Need constant skill updates", "Complex problem-solving"],
+        "roadmap": [
+            "Complete 12th with PCM",
+            "Clear JEE/State CET for B.Tech ECE",
+            "Complete B.Tech (4 years)",
+            "Learn embedded systems and microcontrollers",
+            "Gain internship in electronics companies",
+            "Start as design engineer or embedded systems engineer"
+        ]
+    },
+    "Aerospace Engineer": {
+        "description": "Design aircraft, spacecraft, satellites, and related systems for aviation and space industries.",
+        "education": ["B.Tech in Aerospace/Aeronautical Engineering", "M.Tech for specialization"],
+        "skills": ["Aerodynamics", "Aircraft Design", "Propulsion Systems", "CAD", "Simulation"],
+        "salary": "₹8-30 LPA (Fresh: ₹8-12 LPA, Senior: ₹18-30 LPA+)",
+        "market": "High demand in ISRO, DRDO, HAL, and private aerospace companies.",
+        "pros": ["Cutting-edge technology", "Prestigious field", "Government opportunities", "Innovation"],
+        "cons": ["Limited job openings", "High competition", "Requires advanced education"],
+        "roadmap": [
+            "Complete 12th with PCM",
+            "Clear JEE for B.Tech Aerospace/Aeronautical",
+            "Complete B.Tech (4 years)",
+            "Pursue M.Tech for specialization",
+            "Apply to ISRO, DRDO, HAL, or private aerospace firms",
+            "Start as design engineer or research engineer"
+        ]
+    },
+    "Chartered Accountant (CA)": {
+        "description": "Manage financial records, conduct audits, provide tax consultancy, and ensure regulatory compliance for businesses.",
+        "education": ["CA Foundation", "CA Intermediate", "CA Final", "B.Com/M.Com"],
+        "skills": ["Accounting", "Auditing", "Taxation", "Financial Reporting", "GST", "Tally"],
+        "salary": "₹8-30 LPA (Article: ₹2-4 LPA, Qualified CA: ₹8-15 LPA, Senior: ₹20-30 LPA+)",
+        "market": "Evergreen profession with demand across all industries and businesses.",
+        "pros": ["Highly respected professional certification", "Diverse opportunities (audit, tax, finance, corporate)", "Excellent earning potential (₹20-30 LPA+ for experienced)", "Can start own CA firm", "Evergreen profession with high demand", "Prestigious qualification"],
+        "cons": ["Very difficult exams (low pass rates)", "Long study period (3-5 years with articleship)", "Continuous learning required (tax laws, GST changes)", "Can be repetitive work in audit", "High stress during tax season", "Long working hours in CA firms"],
+        "roadmap": [
+            "Complete 12th in Commerce",
+            "Register for CA Foundation",
+            "Clear CA Foundation exam",
+            "Complete CA Intermediate (with articleship)",
+            "Clear CA Final exam",
+            "Start practice or join CA firm/corporate"
+        ]
+    },
+    "Lawyer": {
+        "description": "Provide legal advice, represent clients in court, draft legal documents, and ensure compliance with laws.",
+        "education": ["LLB (3 years after graduation)", "BA LLB (5 years integrated)", "LLM for specialization"],
+        "skills": ["Legal Research", "Argumentation", "Drafting", "Client Counseling", "Court Procedures"],
+        "salary": "₹5-50 LPA (Junior: ₹5-10 LPA, Senior: ₹20-50 LPA+, Corporate: Higher)",
+        "market": "Steady demand in law firms, corporate legal departments, and government services.",
+        "pros": ["Highly respected profession in society", "Intellectual challenges and analytical work", "Excellent earning potential (₹20-50 LPA+ for corporate lawyers)", "Diverse specializations (corporate, criminal, civil, IP)", "Can start own law practice", "Prestigious career path"],
+        "cons": ["Very long working hours (often 12+ hours)", "Extremely high stress and pressure", "Highly competitive field", "Need continuous learning of new laws", "Irregular work schedule", "High competition for top law firms"],
+        "roadmap": [
+            "Complete 12th in any stream",
+            "Clear CLAT/AILET for BA LLB or complete graduation for LLB",
+            "Complete law degree (3-5 years)",
+            "Clear bar exam and register with Bar Council",
+            "Start as junior associate or join law firm",
+            "Specialize in corporate, criminal, or civil law"
+        ]
+    },
+    "Psychologist": {
+        "description": "Study human behavior, provide counseling, conduct therapy sessions, and help people with mental health issues.",
+        "education": ["BA/B.Sc Psychology", "MA/M.Sc Psychology", "M.Phil/Ph.D for clinical practice"],
+        "skills": ["Counseling", "Assessment", "Empathy", "Communication", "Research Methods"],
+        "salary": "₹4-20 LPA (Fresh: ₹4-8 LPA, Clinical Psychologist: ₹10-20 LPA+)",
+        "market": "Growing awareness of mental health increases demand in hospitals, clinics, and private practice.",
+        "pros": ["Helping people", "Diverse specializations", "Flexible work", "Growing field"],
+        "cons": ["Emotional demands", "Requires advanced degrees for clinical practice", "Licensing requirements"],
+        "roadmap": [
+            "Complete 12th in any stream (Arts preferred)",
+            "Pursue BA/B.Sc in Psychology",
+            "Complete MA/M.Sc in Psychology",
+            "For clinical practice: Complete M.Phil/Ph.D",
+            "Register with Rehabilitation Council of India",
+            "Start practice or join hospital/clinic"
+        ]
+    },
+    "Journalist": {
+        "description": "Research, investigate, and report news stories for print, digital, and broadcast media platforms.",
+        "education": ["BA in Journalism/Mass Communication", "MA in Journalism", "Diploma in Media Studies"],
+        "skills": ["Writing", "Research", "Interviewing", "Communication", "Digital Media", "Video Editing"],
+        "salary": "₹3-15 LPA (Reporter: ₹3-6 LPA, Senior Journalist: ₹10-15 LPA+)",
+        "market": "Evolving field with opportunities in digital media, news channels, and online platforms.",
+        "pros": ["Dynamic work", "Meet diverse people", "Impactful stories", "Creative expression"],
+        "cons": ["Irregular hours", "Field work risks", "Deadline pressure", "Job instability in some sectors"],
+        "roadmap": [
+            "Complete 12th in any stream",
+            "Pursue BA/MA in Journalism or Mass Communication",
+            "Gain experience through internships",
+            "Build portfolio with published work",
+            "Start as reporter or content writer",
+            "Progress to senior journalist or editor"
+        ]
+    },
+    "UI/UX Designer": {
+        "description": "Design user-friendly interfaces and experiences for websites, apps, and digital products.",
+        "education": ["B.Des", "BFA", "UI/UX Design Certifications", "Relevant Bachelor's + Design Course"],
+        "skills": ["Figma", "Wireframing", "Prototyping", "User Research", "Visual Design", "Interaction Design"],
+        "salary": "₹5-25 LPA (Junior: ₹5-10 LPA, Senior: ₹15-25 LPA+)",
+        "market": "High demand in product companies, IT firms, startups, and design agencies.",
+        "pros": ["Creative work", "High demand", "Good compensation", "Remote opportunities"],
+        "cons": ["Subjective feedback", "Need to stay updated", "Tight deadlines", "Competitive field"],
+        "roadmap": [
+            "Complete 12th (any stream)",
+            "Learn design tools (Figma, Adobe XD)",
+            "Study UI/UX principles and user research",
+            "Build portfolio with case studies",
+            "Get certified or pursue design course",
+            "Start as junior designer or intern"
+        ]
+    }
+}
+
+HOBBY_OPTIONS = [
+    "🧠 Logic & Problem Solving (Puzzles / Maths / Debugging)",
+    "🎨 Creativity & Design (Drawing, Branding, Innovation)",
+    "🤝 People Interaction (Guiding, Teaching, Teamwork)",
+    "📊 Business & Money (Entrepreneurship, Finance, Markets)",
+    "🔬 Science & Experiments (Biology/Chemistry/Physics Labs)",
+    "🧩 Technology & Computers (Coding, Hardware, AI, Cybersecurity)",
+    "🏛️ Law, Policy & Governance (Debate, Ethics, Justice)",
+    "🌍 Environment & Nature (Wildlife, Ecology, Sustainability)",
+    "🏋️‍♂️ Sports & Physical Training (Fitness, Coaching)",
+    "🎭 Media & Communication (Content, Writing, Film, PR)",
+    "🚀 Innovation & Future Tech (Space, EVs, Robotics, Metaverse)",
+    "💗 Helping & Community Impact (Mental Health, NGOs, Social Work)"
+]
+FREE_TIME_OPTIONS = ["Coding/Technical Projects", "Online Courses/Learning", "Reading/Books", "Designing/Creative Work"]
+SUBJECT_OPTIONS = [
+    "Computer Science", "Mathematics", "Physics", "Chemistry", "Biology",
+    "Botany", "Zoology", "Human Anatomy", "AI/ML/Data Science",
+    "Economics/Commerce", "Business Management", "Design/Arts",
+    "Law", "Legal Studies", "Political Science", "Civics", "Psychology"
+]
+
+SUBJECT_FIELD_MAP = {
+    "Computer Science": ["Engineering & Technology", "Data Science & Analytics"],
+    "Mathematics": ["Engineering & Technology", "Data Science & Analytics"],
+    "Physics": ["Engineering & Technology"],
+    "Chemistry": ["Medical & Healthcare", "Research & Development"],
+    "Biology": ["Medical & Healthcare", "Research & Development"],
+    "Botany": ["Medical & Healthcare", "Research & Development"],
+    "Zoology": ["Medical & Healthcare", "Research & Development"],
+    "Human Anatomy": ["Medical & Healthcare"],
+    "AI/ML/Data Science": ["Data Science & Analytics"],
+    "Economics/Commerce": ["Finance & Accounting Path", "Business & Management", "Economics & Data"],
+    "Business Management": ["Business & Management", "Tech + Commerce", "Creative + Business Fusion"],
+    "Design/Arts": ["Design & Creative Arts"],
+    "Law": ["Law & Legal Services", "Law & Corporate Governance"],
+    "Legal Studies": ["Law & Legal Services", "Law & Corporate Governance"],
+    "Political Science": ["Law & Legal Services", "Government Services", "Law & Corporate Governance"],
+    "Civics": ["Government Services", "Law & Legal Services", "Law & Corporate Governance"],
+    "Psychology": ["Psychology & Counseling", "Medical & Healthcare"]
+}
+
+INTEREST_FIELD_MAP = {
+    "🧠 Logic & Problem Solving (Puzzles / Maths / Debugging)": [
+        "Engineering & Technology", "Data Science & Analytics", "Economics & Data", "Tech + Commerce"
+    ],
+    "🎨 Creativity & Design (Drawing, Branding, Innovation)": [
+        "Creative + Business Fusion", "Design & Creative Arts", "International Career"
+    ],
+    "🤝 People Interaction (Guiding, Teaching, Teamwork)": [
+        "Business & Management", "Psychology & Counseling", "Law & Corporate Governance", "Banking & Government Services"
+    ],
+    "📊 Business & Money (Entrepreneurship, Finance, Markets)": [
+        "Finance & Accounting Path", "Business & Management", "Economics & Data", "Tech + Commerce", "International Career"
+    ],
+    "🔬 Science & Experiments (Biology/Chemistry/Physics Labs)": [
+        "Medical & Healthcare", "Research & Development", "Biomedical & Life Sciences"
+    ],
+    "🧩 Technology & Computers (Coding, Hardware, AI, Cybersecurity)": [
+        "Engineering & Technology", "Data Science & Analytics", "Tech + Commerce", "Innovation & Future Tech"
+    ],
+    "🏛️ Law, Policy & Governance (Debate, Ethics, Justice)": [
+        "Law & Legal Services", "Law & Corporate Governance", "Government Services", "Banking & Government Services"
+    ],
+    "🌍 Environment & Nature (Wildlife, Ecology, Sustainability)": [
+        "Environmental Science", "Government Services", "International Career"
+    ],
+    "🏋️‍♂️ Sports & Physical Training (Fitness, Coaching)": [
+        "Medical & Healthcare", "Creative + Business Fusion"
+    ],
+    "🎭 Media & Communication (Content, Writing, Film, PR)": [
+        "Creative + Business Fusion", "Media & Journalism", "Business & Management"
+    ],
+    "🚀 Innovation & Future Tech (Space, EVs, Robotics, Metaverse)": [
+        "Engineering & Technology", "Data Science & Analytics", "Innovation & Future Tech", "International Career"
+    ],
+    "💗 Helping & Community Impact (Mental Health, NGOs, Social Work)": [
+        "Psychology & Counseling", "Medical & Healthcare", "Law & Corporate Governance", "Banking & Government Services"
+    ]
+}
+
+SCIENCE_MEDICAL_PATHWAYS = [
+    {
+        "label": "MBBS (Doctor / Surgeon)",
+        "duration": "5.5 years",
+        "entrance": "NEET",
+        "careers": ["Doctor", "Surgeon", "Cardiologist", "Neurologist", "Dermatologist", "General Physician"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "BDS (Dentistry)",
+        "duration": "5 years",
+        "entrance": "NEET",
+        "careers": ["Dentist", "Orthodontist", "Dental Surgeon", "Prosthodontist"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "BAMS / Ayurveda Medicine",
+        "duration": "5.5 years",
+        "entrance": "NEET / State Exams",
+        "careers": ["Ayurvedic Doctor", "Panchakarma Specialist", "Ayurvedic Researcher"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "BHMS / Homeopathy",
+        "duration": "5.5 years",
+        "entrance": "NEET",
+        "careers": ["Homeopathic Physician", "Holistic Health Consultant"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "Veterinary Science (BVSc)",
+        "duration": "5.5 years",
+        "entrance": "NEET / AIPVT",
+        "careers": ["Veterinary Doctor", "Wildlife Vet", "Animal Nutritionist"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "BPT (Physiotherapy)",
+        "duration": "4.5 years",
+        "entrance": "CUET / Institute Exams",
+        "careers": ["Physiotherapist", "Sports Rehab Specialist", "Occupational Therapist"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "Pharmacy (B.Pharm / PharmD)",
+        "duration": "4 years (B.Pharm) / 6 years (PharmD)",
+        "entrance": "CUET / GPAT / State CET",
+        "careers": ["Pharmacist", "Clinical Pharmacologist", "Drug Research Scientist"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "Nursing (BSc Nursing / GNM)",
+        "duration": "4 years",
+        "entrance": "AIIMS / State Exams",
+        "careers": ["Nurse Practitioner", "Critical Care Expert", "Nurse Educator"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "Allied Medical Sciences",
+        "duration": "3-4 years",
+        "entrance": "CUET / State / Institute Exams",
+        "careers": ["Radiology Specialist", "Medical Lab Technologist", "Anesthesia Technologist", "OT Technologist", "Optometrist", "Audiologist"],
+        "field_tags": ["Medical & Healthcare"]
+    },
+    {
+        "label": "Biomedical & Life Sciences (Research Route)",
+        "duration": "3-5 years",
+        "entrance": "CUET / IISER / Private Universities",
+        "careers": ["Biotechnologist", "Genetic Engineer", "Lab Scientist", "Pharma R&D Specialist"],
+        "field_tags": ["Medical & Healthcare", "Research & Development"]
+    },
+    {
+        "label": "Psychology & Mental Health",
+        "duration": "3 years + PG",
+        "entrance": "CUET / Institute Exams",
+        "careers": ["Psychologist", "Clinical Psychologist", "Forensic Psychologist", "Therapist"],
+        "field_tags": ["Psychology & Counseling", "Medical & Healthcare"]
+    }
+]
+
+SCIENCE_NON_MED_PATHWAYS = [
+    {
+        "label": "Engineering (JEE / CET Route)",
+        "duration": "4 years",
+        "entrance": "JEE Main + Adv / State CET / BITSAT / VITEEE",
+        "careers": ["Software Engineer", "Mechanical Engineer", "Civil Engineer", "Chemical Engineer", "Aerospace Engineer", "Automobile Engineer", "Robotics Engineer", "Marine Engineer", "Petroleum Engineer"],
+        "field_tags": ["Engineering & Technology", "Data Science & Analytics"]
+    },
+    {
+        "label": "Architecture (B.Arch)",
+        "duration": "5 years",
+        "entrance": "NATA / JEE Paper 2",
+        "careers": ["Architect", "Urban Planner", "Interior Designer"],
+        "field_tags": ["Design & Creative Arts", "Engineering & Technology"]
+    },
+    {
+        "label": "Computer & Tech (Non-Engineering)",
+        "duration": "3 years",
+        "entrance": "CUET / Institute Exams",
+        "careers": ["Software Developer", "Cybersecurity Analyst", "Game Developer", "UI/UX Designer"],
+        "field_tags": ["Engineering & Technology", "Tech + Commerce"]
+    },
+    {
+        "label": "Pure Sciences & Research",
+        "duration": "3-5 years",
+        "entrance": "CUET / IISER / ISI / TIFR",
+        "careers": ["Research Scientist", "Astrophysicist", "Oceanographer", "Nanotechnologist", "ISRO/DRDO Scientist"],
+        "field_tags": ["Research & Development", "Data Science & Analytics"]
+    },
+    {
+        "label": "Aviation & Space Careers",
+        "duration": "2-4 years",
+        "entrance": "DGCA / NDA / IGRUA",
+        "careers": ["Commercial Pilot", "Aerospace Engineer", "ATC Officer", "Space Scientist"],
+        "field_tags": ["Engineering & Technology", "Defense"]
+    },
+    {
+        "label": "Merchant Navy",
+        "duration": "3-4 years",
+        "entrance": "IMU-CET",
+        "careers": ["Marine Engineer", "Nautical Officer", "Port Operations Manager"],
+        "field_tags": ["Engineering & Technology", "International Career"]
+    },
+    {
+        "label": "Defense Technical Route",
+        "duration": "Varies",
+        "entrance": "NDA / TES / DRDO Exams",
+        "careers": ["Defense Engineer", "Technical Officer", "Weapon Systems Specialist"],
+        "field_tags": ["Defense", "Government Services"]
+    },
+    {
+        "label": "Maths + Finance Fusion",
+        "duration": "3-5 years",
+        "entrance": "CUET / Actuarial Papers",
+        "careers": ["Actuarial Scientist", "Quantitative Analyst", "Financial Engineer"],
+        "field_tags": ["Economics & Data", "Finance & Accounting Path"]
+    },
+    {
+        "label": "Design + Innovation (Science Route)",
+        "duration": "4 years",
+        "entrance": "NID / UCEED / NIFT / CUCET",
+        "careers": ["Product Designer", "Automobile Designer", "Industrial Designer", "VFX Artist"],
+        "field_tags": ["Design & Creative Arts", "Creative + Business Fusion"]
+    },
+    {
+        "label": "Government / Civil Services Route",
+        "duration": "3+ years",
+        "entrance": "UPSC / SSC / State PCS",
+        "careers": ["IAS Officer", "Scientist-B (DRDO)", "Banking Officer"],
+        "field_tags": ["Government Services", "Law & Corporate Governance"]
+    }
+]
+
+# (combo label, focus key) pairs for the science focus selector
+SCIENCE_FOCUS_OPTIONS = [
+    ("Medical (Biology)", "Medical"),
+    ("Non-Medical (Maths)", "Non-Medical")
+]
+
+SCIENCE_TRACK_PATHWAYS = {
+    "Medical": SCIENCE_MEDICAL_PATHWAYS,
+    "Non-Medical": SCIENCE_NON_MED_PATHWAYS
+}
+
+SCIENCE_PATH_LOOKUP = {}
+SCIENCE_PATH_LABELS = {}
+for focus_name, path_list in SCIENCE_TRACK_PATHWAYS.items():
+    SCIENCE_PATH_LABELS[focus_name] = [path["label"] for path in path_list]
+    for path in path_list:
+        SCIENCE_PATH_LOOKUP[path["label"]] = path
+        FIELD_TO_STREAM[path["label"]] = "Science"
+
+
+def get_science_path_labels_for_focus(focus=None):
+    if focus and focus in SCIENCE_TRACK_PATHWAYS:
+        return SCIENCE_PATH_LABELS.get(focus, [])
+    labels = []
+    for value in SCIENCE_PATH_LABELS.values():
+        labels.extend(value)
+    return labels
+
+
+def get_science_field_tags_for_focus(focus=None):
+    tags = set()
+    if focus and focus in SCIENCE_TRACK_PATHWAYS:
+        path_list = SCIENCE_TRACK_PATHWAYS[focus]
+    else:
+        path_list = [path for paths in SCIENCE_TRACK_PATHWAYS.values() for path in paths]
+    for path in path_list:
+        tags.update(path.get("field_tags", []))
+    return tags
+
+
+# Mandatory entrance exam milestone injected into roadmaps per science focus
+FOCUS_EXAM_STEPS = {
+    "Medical": "Mandatory milestone: Crack NEET-UG to secure admission into top medical programs.",
+    "Non-Medical": "Mandatory milestone: Clear JEE Main/Advanced or equivalent engineering entrance (CET/BITSAT/VITEEE).",
+}
+
+
+def get_focus_exam_step(focus=None):
+    """Return the mandatory exam step for a science focus, if any."""
+    return FOCUS_EXAM_STEPS.get(focus) if focus else None
+
+
+def get_enhanced_roadmap_steps(base_steps, exam_step=None):
+    """Roadmap steps with the focus exam milestone inserted after the first step."""
+    steps = list(base_steps) if base_steps else []
+    if exam_step:
+        keyword = "neet" if "NEET" in exam_step.upper() else "jee"
+        has_keyword = any(
+            isinstance(step, str) and keyword in step.lower()
+            for step in steps
+        )
+        if not has_keyword:
+            insert_index = 1 if steps else 0
+            steps.insert(insert_index, exam_step)
+    return steps
+
+
+def build_roadmap_model(details, focus=None):
+    """Everything a roadmap view needs, with the exam step already merged."""
+    return {
+        "steps": get_enhanced_roadmap_steps(details.get("roadmap") or [], get_focus_exam_step(focus)),
+        "specialty_steps": details.get("sub_specialty_steps") or {},
+    }
+
+
+FIELD_CAREER_CLUSTERS = {
+    "Medical & Healthcare": ["Doctor", "Dentist", "Pharmacist", "Nurse", "Physiotherapist", "Ayurvedic Doctor", "Homeopathic Physician", "Veterinary Doctor", "Radiology Specialist"],
+    "Engineering & Technology": ["Software Engineer", "Mechanical Engineer", "Civil Engineer", "Electrical Engineer", "Electronics Engineer", "Aerospace Engineer", "Automobile Engineer", "Robotics Engineer"],
+    "Research & Development": ["Research Scientist", "Biotechnologist", "Lab Scientist", "Biomedical Scientist", "Genetic Engineer"],
+    "Data Science & Analytics": ["Data Scientist", "Business Analyst", "AI Engineer", "Data Analyst", "Statistician"],
+    "Environmental Science": ["Environmental Scientist", "Forestry Officer", "Marine Biologist", "Geologist"],
+    "Finance & Accounting Path": ["Chartered Accountant (CA)", "Cost & Management Accountant (CMA)", "Company Secretary (CS)", "Finance / Investment Analyst"],
+    "Business & Management": ["Business Manager / Corporate Strategist", "Entrepreneur / Startup Founder", "Supply Chain & Logistics Manager", "Hospitality / Hotel Management"],
+    "Economics & Data": ["Economist / Policy Analyst", "Actuarial Scientist", "Business Analytics Professional", "Data Analyst"],
+    "Banking & Government Services": ["Banking Officer (IBPS/SBI PO)", "UPSC / SSC / Railways / Defence Accounts", "RBI / SEBI / Finance Officer"],
+    "Law & Corporate Governance": ["Lawyer", "Corporate Lawyer", "Company Secretary (CS)", "Compliance Officer"],
+    "Creative + Business Fusion": ["Advertising / Digital Marketing Manager", "Media Management Professional", "Event Management Specialist", "Fashion Business & Retail Strategist", "Product Designer"],
+    "Tech + Commerce": ["FinTech Product Specialist", "E-Commerce Manager", "Business IT (BCA with Specialization)", "Cyber Finance Compliance Analyst"],
+    "International Career": ["International Business Manager", "Import & Export Consultant", "Foreign Trade Specialist (IIFT etc.)", "Global CFO / Finance Professional (CPA/ACCA)"],
+    "Law & Legal Services": ["Lawyer", "Corporate Lawyer", "Legal Consultant", "Judge"],
+    "Psychology & Counseling": ["Psychologist", "Clinical Psychologist", "Therapist", "Counselor"],
+    "Media & Journalism": ["Journalist", "Content Creator", "News Anchor", "Media Strategist"],
+    "Design & Creative Arts": ["Graphic Designer", "UI/UX Designer", "Animator", "Game Designer", "Interior Designer"],
+    "Government Services": ["IAS Officer", "IPS Officer", "Government Clerk", "Policy Analyst"],
+    "Defense": ["Army Officer", "Navy Officer", "Air Force Officer", "Defense Scientist"],
+    "Sports": ["Athlete", "Sports Coach", "Fitness Trainer", "Sports Scientist"],
+    "Other": ["Entrepreneur", "Consultant", "Freelancer", "Teacher"],
+    "Biomedical & Life Sciences (Research Route)": ["Biotechnologist", "Genetic Engineer", "Lab Scientist", "Pharma R&D Specialist"],
+    "Psychology & Mental Health": ["Psychologist", "Clinical Psychologist", "Forensic Psychologist", "Therapist"],
+    "Allied Medical Sciences": ["Radiology Specialist", "Medical Lab Technologist", "Anesthesia Technologist", "OT Technologist", "Optometrist", "Audiologist"],
+    "Pharmacy (B.Pharm / PharmD)": ["Pharmacist", "Clinical Pharmacologist", "Drug Research Scientist"],
+    "Nursing (BSc Nursing / GNM)": ["Nurse Practitioner", "Critical Care Expert", "Nurse Educator"],
+    "BPT (Physiotherapy)": ["Physiotherapist", "Sports Rehab Specialist", "Occupational Therapist"],
+    "BDS (Dentistry)": ["Dentist", "Orthodontist", "Dental Surgeon"],
+    "BAMS / Ayurveda Medicine": ["Ayurvedic Doctor", "Panchakarma Specialist"],
+    "BHMS / Homeopathy": ["Homeopathic Physician"],
+    "Veterinary Science (BVSc)": ["Veterinary Doctor", "Wildlife Vet"],
+    "Engineering (JEE / CET Route)": ["Software Engineer", "Mechanical Engineer", "Civil Engineer", "Chemical Engineer", "Aerospace Engineer", "Robotics Engineer", "Marine Engineer"],
+    "Architecture (B.Arch)": ["Architect", "Urban Planner", "Interior Designer"],
+    "Computer & Tech (Non-Engineering)": ["Software Developer", "Cybersecurity Analyst", "Game Developer", "UI/UX Designer"],
+    "Pure Sciences & Research": ["Research Scientist", "Astrophysicist", "Oceanographer", "Nanotechnologist"],
+    "Aviation & Space Careers": ["Commercial Pilot", "Aerospace Engineer", "ATC Officer", "Space Scientist"],
+    "Merchant Navy": ["Marine Engineer", "Nautical Officer"],
+    "Defense Technical Route": ["Defense Engineer", "Technical Officer"],
+    "Maths + Finance Fusion": ["Actuarial Scientist", "Quantitative Analyst", "Financial Engineer"],
+    "Design + Innovation (Science Route)": ["Product Designer", "Automobile Designer", "Industrial Designer", "VFX Artist"],
+    "Government / Civil Services Route": ["IAS Officer", "Scientist-B (DRDO)", "Banking Officer"],
+    "Innovation & Future Tech": ["Aerospace Engineer", "Robotics Engineer", "AI Engineer", "EV Specialist"]
+}
+
+COLLEGE_INFO_BY_FIELD = {
+    "Engineering & Technology": [
+        {"name": "IIT Bombay", "exam": "JEE Advanced", "highlights": "Top engineering campus with world-class labs and 90%+ placements."},
+        {"name": "IIT Madras", "exam": "JEE Advanced", "highlights": "Renowned for research, incubation support, and interdisciplinary programs."},
+        {"name": "BITS Pilani", "exam": "BITSAT", "highlights": "Flexible curriculum, strong alumni network, and excellent global exposure."}
+    ],
+    "Medical & Healthcare": [
+        {"name": "AIIMS New Delhi", "exam": "NEET-UG", "highlights": "Best-in-class MBBS program with extensive clinical exposure."},
+        {"name": "CMC Vellore", "exam": "NEET-UG", "highlights": "Strong community medicine focus and affordable medical education."},
+        {"name": "KMC Manipal", "exam": "NEET-UG", "highlights": "Modern infrastructure, research opportunities, and global recognition."}
+    ],
+    "Business & Management": [
+        {"name": "IIM Ahmedabad (PGP)", "exam": "CAT", "highlights": "Premier management institute with stellar placements."},
+        {"name": "IIM Bangalore (PGP)", "exam": "CAT", "highlights": "Leadership-focused curriculum and strong industry links."},
+        {"name": "NMIMS Mumbai (BBA/MBA)", "exam": "NPAT / NMAT", "highlights": "Urban campus with great corporate exposure and entrepreneurship cell."}
+    ],
+    "Law & Legal Services": [
+        {"name": "NLSIU Bengaluru", "exam": "CLAT", "highlights": "India's top law school with excellent moot court culture."},
+        {"name": "NALSAR Hyderabad", "exam": "CLAT", "highlights": "Strong corporate law placements and international exchange."},
+        {"name": "NLU Delhi", "exam": "AILET", "highlights": "Focus on policy, litigation, and research-driven curriculum."}
+    ],
+    "Design & Creative Arts": [
+        {"name": "NID Ahmedabad", "exam": "NID DAT", "highlights": "Flagship design school known for product & industrial design."},
+        {"name": "IIT Bombay (IDC)", "exam": "CEED / UCEED", "highlights": "Blend of engineering and design with innovative labs."},
+        {"name": "NIFT Delhi", "exam": "NIFT Entrance", "highlights": "Top fashion & lifestyle design institute with strong industry ties."}
+    ],
+    "Data Science & Analytics": [
+        {"name": "ISI Kolkata", "exam": "ISI Entrance", "highlights": "Premier statistics institute with rigorous analytics programs."},
+        {"name": "IISc Bengaluru", "exam": "JEE / KVPY / GATE", "highlights": "Advanced research in AI/ML and interdisciplinary collaborations."},
+        {"name": "IIT Hyderabad", "exam": "JEE Advanced", "highlights": "Dedicated AI programs and partnerships with tech giants."}
+    ],
+    "General": [
+        {"name": "Delhi University (Top Colleges)", "exam": "CUET", "highlights": "Wide range of UG programs with vibrant campus culture."},
+        {"name": "Christ University", "exam": "Institution Entrance", "highlights": "Strong holistic development and diverse course options."},
+        {"name": "Symbiosis International University", "exam": "SET / SNAP", "highlights": "Modern campus, global curriculum, and active clubs."}
+    ]
+}
+
+# Extend field and stream mappings with new clusters
+FIELD_TO_STREAM.setdefault("Environmental Science", "Science")
+FIELD_TO_STREAM.setdefault("Innovation & Future Tech", "Science")
+for field_name, careers in FIELD_CAREER_CLUSTERS.items():
+    FIELD_TO_STREAM.setdefault(field_name, FIELD_TO_STREAM.get(field_name, "Science" if field_name in SCIENCE_PATH_LOOKUP else None))
+    for career in careers:
+        FIELD_ROLE_MAP.setdefault(career, set()).add(field_name)
+        parent_stream = FIELD_TO_STREAM.get(field_name)
+        if parent_stream:
+            STREAM_ROLE_MAP.setdefault(career, set()).add(parent_stream)
+
+
+def get_all_mapped_careers():
+    """Return every role listed in CAREER_MAPPINGS, in mapping order."""
+    all_careers = {}
+    for field_roles in CAREER_MAPPINGS["roles"].values():
+        all_careers.update(dict.fromkeys(field_roles))
+    return list(all_careers)
+
+
+def get_primary_field(career):
+    """First field in CAREER_MAPPINGS that lists the career (stable across runs,
+    unlike picking from the FIELD_ROLE_MAP set)."""
+    for field_name, roles in CAREER_MAPPINGS["roles"].items():
+        if career in roles:
+            return field_name
+    return "General"
+
+
+def get_default_description(career):
+    """Basic description used for careers without a curated profile."""
+    return f"{career} professional working in {get_primary_field(career)} sector."
+
+
+def build_career_details(json_details):
+    """Merge JSON career details with ENHANCED_CAREER_DETAILS and fill defaults"""
+    # JSON should only fill gaps, ENHANCED_CAREER_DETAILS takes priority
+    career_details = {}
+    # Start with ENHANCED_CAREER_DETAILS
+    for career, details in ENHANCED_CAREER_DETAILS.items():
+        career_details[career] = details.copy()
+    # Merge JSON details, but preserve roadmap, pros, cons from ENHANCED if they exist
+    for career, json_data in json_details.items():
+        if career in career_details:
+            # Merge, but keep roadmap, pros, cons from ENHANCED if present
+            merged = career_details[career].copy()
+            for key, value in json_data.items():
+                if key not in ["roadmap", "pros", "cons", "sub_specialty_steps"] or key not in merged:
+                    merged[key] = value
+            career_details[career] = merged
+        else:
+            career_details[career] = json_data
+
+    # Ensure all careers from CAREER_MAPPINGS have at least basic profiles
+    for career in get_all_mapped_careers():
+        if career not in career_details:
+            # Get field info for context
+            field_name = get_primary_field(career)
+
+            career_details[career] = {
+                "description": get_default_description(career),
+                "education": ["Relevant Bachelor's Degree", "Industry Certifications"],
+                "skills": ["Communication", "Problem-solving", "Industry-specific skills"],
+                "salary": "₹5-20 LPA (Varies by experience and location)",
+                "market": "Growing demand in relevant sectors.",
+                "pros": ["Career growth opportunities", "Diverse work environment", "Industry-specific benefits"],
+                "cons": ["Competitive field", "Need continuous learning", "Industry-specific challenges"],
+                "roadmap": [
+                    "Complete 12th in relevant stream",
+                    f"Pursue relevant bachelor's degree in {field_name}",
+                    "Gain industry experience through internships",
+                    "Obtain relevant certifications",
+                    "Start entry-level position",
+                    "Progress to senior roles with experience"
+                ]
+            }
+        else:
+            # Ensure existing careers have roadmap if missing
+            if "roadmap" not in career_details[career] and "sub_specialty_steps" not in career_details[career]:
+                career_details[career]["roadmap"] = [
+                    "Complete 12th in relevant stream",
+                    f"Pursue relevant education for {career}",
+                    "Gain practical experience",
+                    "Obtain necessary certifications/licenses",
+                    "Start career in entry-level position",
+                    "Progress with experience and skills"
+                ]
+
+    return career_details
+
+
+def load_career_details(model_dir=MODEL_DIR):
+    """Load career_details.json and merge it with the curated catalog.
+
+    The loose file is the one source of the catalog (the GUI, the catalog
+    registry and hot reload all read it); the artifact bundle only carries
+    vectors for it, reused where they still match."""
+    json_details = safe_load_json(model_file("career_details.json", model_dir), {})
+    return build_career_details(json_details)
@@ -1,62 +1,281 @@
-from sentence_transformers import SentenceTransformer
-import json
-import numpy as np
-import os
-import sys
-
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-MODEL_DIR = os.path.join(BASE_DIR, "model")
-CACHE_DIR = os.path.join(MODEL_DIR, ".hf_cache")
-
-
-def load_sentence_model(model_name: str = "all-MiniLM-L6-v2") -> SentenceTransformer:
-    """Load the transformer with clearer error reporting for offline runs."""
-    try:
-        return SentenceTransformer(model_name, cache_folder=CACHE_DIR)
-    except Exception as err:
-        print(
-            "⚠️ Unable to download the SentenceTransformer model.\n"
-            "Please ensure you have an active internet connection or preload the model into "
-            f"{CACHE_DIR}.\nDetailed error:"
-        )
-        print(err)
-        sys.exit(1)
-
-
-def load_career_details():
-    details_path = os.path.join(MODEL_DIR, "career_details.json")
-    if not os.path.exists(details_path):
-        raise FileNotFoundError(
-            f"career_details.json not found at {details_path}. Train the model first."
-        )
-    with open(details_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def main():
-    os.makedirs(CACHE_DIR, exist_ok=True)
-
-    model = load_sentence_model()
-    careers = load_career_details()
-
-    names = list(careers.keys())
-    texts = []
-
-    for name, data in careers.items():
-        description = data.get("description", "")
-        skills = ", ".join(data.get("skills", []))
-        text = f"{name}. {description} Required skills: {skills}."
-        texts.append(text)
-
-    print("👉 Generating embeddings...")
-    embeds = model.encode(texts, show_progress_bar=True)
-
-    np.save(os.path.join(MODEL_DIR, "career_vectors.npy"), embeds)
-    with open(os.path.join(MODEL_DIR, "career_names.json"), "w", encoding="utf-8") as f:
-        json.dump(names, f, ensure_ascii=False, indent=2)
-
-    print("✅ Career embeddings saved.")
-
-
-if __name__ == "__main__":
-    main()
+from sentence_transformers import SentenceTransformer
+import argparse
+import hashlib
+import json
+import multiprocessing
+import numpy as np
+import os
+import sys
+import time
+
+from career_data import MODEL_DIR, build_career_details, model_file
+from embedding_store import manifest_path, write_manifest
+from embedding_text import EMBEDDING_TEXT_VERSION, build_career_texts, vector_manifest
+from torch_runtime import RuntimeModel, get_runtime_config
+
+CACHE_DIR = os.path.join(MODEL_DIR, ".hf_cache")
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_SHARD_SIZE = 2048
+DEFAULT_BATCH_SIZE = 64
+SHARD_DIR_NAME = "career_vectors.shards"
+SHARD_MANIFEST = "manifest.json"
+
+# Set once per worker process by init_worker
+_worker_model = None
+_worker_error = None
+
+
+def load_sentence_model(model_name: str = MODEL_NAME) -> SentenceTransformer:
+    """Load the transformer with clearer error reporting for offline runs.
+    Raises RuntimeError if it cannot be loaded."""
+    try:
+        return SentenceTransformer(model_name, cache_folder=CACHE_DIR)
+    except Exception as err:
+        raise RuntimeError(
+            "⚠️ Unable to download the SentenceTransformer model.\n"
+            "Please ensure you have an active internet connection or preload the model into "
+            f"{CACHE_DIR}.\nDetailed error: {err}"
+        ) from err
+
+
+def load_career_details(model_dir: str = MODEL_DIR):
+    details_path = model_file("career_details.json", model_dir)
+    if not os.path.exists(details_path):
+        raise FileNotFoundError(
+            f"career_details.json not found at {details_path}. Train the model first."
+        )
+    with open(details_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_worker_count() -> int:
+    """Embedding processes, from CAREER_EMBED_WORKERS (default: CPUs, at most 4)."""
+    try:
+        return max(1, int(os.environ.get("CAREER_EMBED_WORKERS", min(4, os.cpu_count() or 1))))
+    except ValueError:
+        return 1
+
+
+def texts_digest(model_name: str, texts) -> str:
+    """Identifies one embedding job, so shards are only reused for the same input."""
+    digest = hashlib.sha1(model_name.encode("utf-8"))
+    for text in texts:
+        digest.update(b"\0" + text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def shard_path(shard_dir: str, index: int) -> str:
+    return os.path.join(shard_dir, f"shard_{index:05d}.npy")
+
+
+def prepare_shard_dir(shard_dir: str, digest: str, total: int, shard_size: int) -> None:
+    """Create the shard directory, or clear it if it holds shards of another job."""
+    os.makedirs(shard_dir, exist_ok=True)
+    manifest_path = os.path.join(shard_dir, SHARD_MANIFEST)
+    manifest = {"digest": digest, "total": total, "shard_size": shard_size, "normalized": True}
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            if json.load(f) == manifest:
+                return
+    except (OSError, ValueError):
+        pass
+    for name in os.listdir(shard_dir):
+        if name.startswith("shard_"):
+            os.remove(os.path.join(shard_dir, name))
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
+def init_worker(model_name: str, threads: int) -> None:
+    """Give each worker its own torch thread budget and model instance; the
+    other torch runtime settings come from CAREER_TORCH_* as in the app.
+
+    A pool whose initializer raises respawns the worker forever, so a load
+    failure is kept and raised by the worker's first task instead.
+    """
+    global _worker_model, _worker_error
+    _worker_error = None
+    config = get_runtime_config()
+    config["intra_op_threads"] = max(1, threads)
+    try:
+        _worker_model = RuntimeModel(load_sentence_model(model_name), config)
+    except Exception as e:
+        _worker_error = RuntimeError(str(e))
+
+
+def embed_shard(task):
+    """Encode one shard and write it under a temporary name, renamed when complete."""
+    if _worker_error is not None:
+        raise _worker_error
+    index, texts, path, batch_size = task
+    start = time.perf_counter()
+    embeds = _worker_model.encode(texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True)
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, np.asarray(embeds, dtype=np.float32))
+    os.replace(tmp_path, path)
+    return index, len(texts), time.perf_counter() - start, os.getpid()
+
+
+def merge_shards(shard_dir: str, shard_count: int, total: int, output_path: str) -> np.ndarray:
+    """Concatenate shards into one .npy, written as a memmap so the full
+    matrix never has to fit in memory twice. Returns the matrix memory-mapped."""
+    tmp_path = f"{output_path}.tmp.npy"
+    if not shard_count or not total:
+        # Empty catalog: an empty matrix, there is no shard to take the width from
+        np.save(tmp_path, np.empty((0, 0), dtype=np.float32))
+        os.replace(tmp_path, output_path)
+        return np.load(output_path, mmap_mode="r")
+    first = np.load(shard_path(shard_dir, 0), mmap_mode="r")
+    merged = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(total, first.shape[1]))
+    row = 0
+    for index in range(shard_count):
+        shard = np.load(shard_path(shard_dir, index), mmap_mode="r")
+        merged[row:row + len(shard)] = shard
+        row += len(shard)
+    merged.flush()
+    del merged
+    os.replace(tmp_path, output_path)
+    return np.load(output_path, mmap_mode="r")
+
+
+def embed_texts_sharded(texts, output_path: str, model_name: str = MODEL_NAME, workers: int = 1,
+                        threads_per_worker: int = 0, shard_size: int = DEFAULT_SHARD_SIZE,
+                        batch_size: int = DEFAULT_BATCH_SIZE, shard_dir: str = None) -> dict:
+    """Embed texts in shards across worker processes and merge them into output_path.
+
+    Shards go to shard_dir (default: career_vectors.shards next to
+    output_path) and stay there, also when the run fails or is interrupted,
+    so the next run of the same job only embeds the missing ones. The
+    caller removes them with remove_shard_dir once the merged matrix is in
+    its final place. Returns throughput statistics.
+    """
+    shard_dir = shard_dir or get_shard_dir(output_path)
+    return embed_shards(texts, output_path, shard_dir, model_name, workers, threads_per_worker,
+                        shard_size, batch_size)
+
+
+def get_shard_dir(output_path: str) -> str:
+    return os.path.join(os.path.dirname(output_path), SHARD_DIR_NAME)
+
+
+def remove_shard_dir(shard_dir: str) -> None:
+    if not os.path.isdir(shard_dir):
+        return
+    for name in os.listdir(shard_dir):
+        os.remove(os.path.join(shard_dir, name))
+    os.rmdir(shard_dir)
+
+
+def embed_shards(texts, output_path, shard_dir, model_name, workers, threads_per_worker, shard_size, batch_size):
+    prepare_shard_dir(shard_dir, texts_digest(model_name, texts), len(texts), shard_size)
+
+    shard_count = -(-len(texts) // shard_size)
+    pending = [
+        (index, texts[index * shard_size:(index + 1) * shard_size], shard_path(shard_dir, index), batch_size)
+        for index in range(shard_count)
+        if not os.path.exists(shard_path(shard_dir, index))
+    ]
+    resumed = shard_count - len(pending)
+    if resumed:
+        print(f"👉 Resuming: {resumed}/{shard_count} shards already embedded")
+
+    workers = max(1, min(workers, len(pending) or 1))
+    threads = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+    pending_texts = sum(len(task[1]) for task in pending)
+    print(f"👉 Embedding {pending_texts} texts in {len(pending)} shards with {workers} worker(s) x {threads} thread(s)")
+
+    start = time.perf_counter()
+    done = 0
+    per_worker = {}
+    if not pending:
+        results = []
+    elif workers == 1:
+        init_worker(model_name, threads)
+        results = map(embed_shard, pending)
+    else:
+        # spawn: torch and fork do not mix well
+        pool = multiprocessing.get_context("spawn").Pool(workers, initializer=init_worker, initargs=(model_name, threads))
+        results = pool.imap_unordered(embed_shard, pending)
+    try:
+        for index, count, seconds, pid in results:
+            done += count
+            stats = per_worker.setdefault(pid, {"texts": 0, "seconds": 0.0})
+            stats["texts"] += count
+            stats["seconds"] += seconds
+            elapsed = time.perf_counter() - start
+            print(f"  shard {index + 1}/{shard_count}: {count} texts in {seconds:.1f}s "
+                  f"({done}/{pending_texts}, {done / elapsed:.1f} texts/s overall)")
+    finally:
+        # All shards are written by now, or the run was interrupted
+        if pending and workers > 1:
+            pool.terminate()
+            pool.join()
+    embed_seconds = time.perf_counter() - start
+
+    merged = merge_shards(shard_dir, shard_count, len(texts), output_path)
+    return {
+        "texts": len(texts),
+        "embedded": pending_texts,
+        "shards": shard_count,
+        "resumed_shards": resumed,
+        "workers": workers,
+        "threads_per_worker": threads,
+        "seconds": embed_seconds,
+        "texts_per_s": pending_texts / embed_seconds if embed_seconds > 0 else 0.0,
+        "per_worker_texts_per_s": [
+            stats["texts"] / stats["seconds"] for stats in per_worker.values() if stats["seconds"] > 0
+        ],
+        "shape": list(merged.shape),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Embed the career catalog into career_vectors.npy")
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--workers", type=int, default=get_worker_count())
+    parser.add_argument("--threads-per-worker", type=int, default=0, help="torch threads per worker (0: CPUs / workers)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--keep-shards", action="store_true",
+                        help="keep shard files after a successful run (a failed run always keeps them)")
+    args = parser.parse_args()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    os.makedirs(args.model_dir, exist_ok=True)
+    # Same merged catalog and text template as the app, so it can reuse the vectors
+    careers = build_career_details(load_career_details(args.model_dir))
+    names = list(careers.keys())
+    texts = build_career_texts(careers, names)
+    vectors_path = os.path.join(args.model_dir, "career_vectors.npy")
+    # Embedded next to the current matrix, which stays valid until the merge succeeded
+    staged_path = os.path.join(args.model_dir, "career_vectors.new.npy")
+
+    print("👉 Generating embeddings...")
+    try:
+        stats = embed_texts_sharded(
+            texts, staged_path, workers=args.workers,
+            threads_per_worker=args.threads_per_worker, shard_size=max(1, args.shard_size),
+            batch_size=args.batch_size,
+        )
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
+    # The old manifest would describe the replaced rows, so it goes first
+    if os.path.exists(manifest_path(vectors_path)):
+        os.remove(manifest_path(vectors_path))
+    os.replace(staged_path, vectors_path)
+    with open(os.path.join(args.model_dir, "career_names.json"), "w", encoding="utf-8") as f:
+        json.dump(names, f, ensure_ascii=False, indent=2)
+    write_manifest(vectors_path, vector_manifest(names, texts, MODEL_NAME, "float32"))
+    # Only now is the matrix in place; until then the shards allow a resume
+    if not args.keep_shards:
+        remove_shard_dir(get_shard_dir(staged_path))
+
+    print(f"✅ Career embeddings saved (text template v{EMBEDDING_TEXT_VERSION}): "
+          f"{stats['shape'][0]} x {stats['shape'][1]}, "
+          f"{stats['texts_per_s']:.1f} texts/s with {stats['workers']} worker(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Career similarity graph for related-career expansion.
+
+Each career is linked to its k most similar careers (cosine similarity of
+the career embeddings, at least GRAPH_MIN_SIMILARITY), stored as CSR
+adjacency: the neighbours of row i are indices[indptr[i]:indptr[i + 1]],
+best first, with their similarities in weights. build_artifacts.py builds
+the graph offline from the catalog vectors and stores it in the artifact
+bundle as career_graph/{indptr,indices,weights}; an engine whose catalog
+does not match the bundled graph builds its own once, blockwise, when it
+is created.
+
+At query time expansion is a lookup: the top-scored careers spread their
+score to their neighbours, scaled by the edge similarity (see spread), so
+no career-to-career similarity is computed per request. In ranking only
+the careers related to the selections take the spread score.
+
+Set CAREER_GRAPH_NEIGHBORS to change k; 0 turns the graph off and related
+careers get the related bonus and floor only.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+
+GRAPH_FORMAT_VERSION = 1
+GRAPH_SECTIONS = ("career_graph/indptr", "career_graph/indices", "career_graph/weights")
+DEFAULT_GRAPH_NEIGHBORS = 10
+GRAPH_MIN_SIMILARITY = 0.3
+# Careers scored against the whole catalog at a time while building
+GRAPH_BLOCK_ROWS = 1024
+
+
+def get_graph_neighbors():
+    """Neighbours per career from CAREER_GRAPH_NEIGHBORS (0 disables the graph)."""
+    value = os.environ.get("CAREER_GRAPH_NEIGHBORS", DEFAULT_GRAPH_NEIGHBORS)
+    try:
+        return max(0, int(value))
+    except ValueError:
+        print(f"Invalid graph neighbour count '{value}', falling back to {DEFAULT_GRAPH_NEIGHBORS}")
+        return DEFAULT_GRAPH_NEIGHBORS
+
+
+def catalog_digest(career_names, row_digests, model_name):
+    """Identifies the catalog vectors a graph was built from: career names,
+    the digest of each career's embedded text, and the model."""
+    digest = hashlib.sha256(model_name.encode("utf-8"))
+    for name, row_digest in zip(career_names, row_digests):
+        digest.update(f"\0{name}\0{row_digest}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CareerGraph:
+    """k-nearest-neighbour graph over the catalog rows in CSR form."""
+
+    def __init__(self, indptr, indices, weights, info=None):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.info = info or {}
+        if len(self.indices) != len(self.weights) or self.indptr[-1] != len(self.indices):
+            raise ValueError("Graph arrays do not describe one CSR matrix")
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @property
+    def edges(self):
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    @classmethod
+    def build(cls, matrix, k=DEFAULT_GRAPH_NEIGHBORS, min_similarity=GRAPH_MIN_SIMILARITY,
+              block_rows=GRAPH_BLOCK_ROWS, info=None):
+        """Graph of the k most similar rows of a normalised matrix (a
+        CompactEmbeddings or an array) for every row, excluding itself.
+
+        Similarities are computed a block of rows at a time against the
+        whole catalog, so memory stays at block_rows x catalog size.
+        """
+        vectors = matrix.to_float() if hasattr(matrix, "to_float") else np.asarray(matrix, dtype=np.float32)
+        size = len(vectors)
+        # k is recorded as asked for, so a small catalog's graph still matches
+        neighbors = max(0, min(k, size - 1))
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        indices, weights = [], []
+        for start in range(0, size, block_rows):
+            stop = min(start + block_rows, size)
+            similarity = vectors[start:stop] @ vectors.T
+            similarity[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+            if neighbors == 0:
+                top = np.empty((stop - start, 0), dtype=np.intp)
+            elif neighbors < size - 1:
+                top = np.argpartition(-similarity, neighbors - 1, axis=1)[:, :neighbors]
+            else:
+                top = np.argsort(-similarity, axis=1)[:, :neighbors]
+            top_weights = np.take_along_axis(similarity, top, axis=1)
+            # Best first; ties keep catalog order
+            order = np.lexsort((top, -top_weights), axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_weights = np.take_along_axis(top_weights, order, axis=1)
+            keep = top_weights >= min_similarity
+            indices.append(top[keep])
+            weights.append(top_weights[keep])
+            indptr[start + 1:stop + 1] = keep.sum(axis=1)
+        np.cumsum(indptr, out=indptr)
+        info = {"k": k, "min_similarity": min_similarity, **(info or {})}
+        return cls(indptr, np.concatenate(indices) if indices else [], np.concatenate(weights) if weights else [],
+                   info)
+
+    def neighbors(self, row):
+        """(neighbour rows, similarities) of one career, best first."""
+        start, stop = self.indptr[row], self.indptr[row + 1]
+        return self.indices[start:stop], self.weights[start:stop]
+
+    def spread(self, rows, scores):
+        """Expansion score per catalog row: the best seed score times edge
+        similarity over the seeds (rows with scores) linking to it, 0 for
+        rows no seed links to."""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.zeros(len(self), dtype=np.float32)
+        if not len(rows):
+            return out
+        starts = self.indptr[rows]
+        counts = self.indptr[rows + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return out
+        # Positions of every seed's edges in indices/weights, in one gather
+        positions = np.arange(total) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        values = self.weights[positions] * np.repeat(np.asarray(scores, dtype=np.float32), counts)
+        np.maximum.at(out, self.indices[positions], values)
+        return out
+
+    def matches(self, digest, k):
+        return self.info.get("catalog") == digest and self.info.get("k") == k
+
+    def add_to_bundle(self, writer):
+        writer.add_array("career_graph/indptr", self.indptr)
+        writer.add_array("career_graph/indices", self.indices)
+        writer.add_array("career_graph/weights", self.weights,
+                         meta={"version": GRAPH_FORMAT_VERSION, **self.info})
+
+    @classmethod
+    def from_bundle(cls, bundle):
+        info = bundle.meta("career_graph/weights")
+        if info.get("version") != GRAPH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported career graph format: {info.get('version')}")
+        return cls(bundle.array("career_graph/indptr"), bundle.array("career_graph/indices"),
+                   bundle.array("career_graph/weights"), info)
+
+
+def load_career_graph(bundle, digest, k):
+    """The bundle's career graph if it was built with k neighbours from the
+    catalog identified by digest, else None."""
+    if bundle is None or any(name not in bundle for name in GRAPH_SECTIONS):
+        return None
+    try:
+        graph = CareerGraph.from_bundle(bundle)
+    except (KeyError, ValueError) as e:
+        print(f"Ignoring career graph in {bundle.path}: {e}")
+        return None
+    return graph if graph.matches(digest, k) else None
@@ -0,0 +1,388 @@
+"""Registry of per-school career catalogs served from one process.
+
+Each tenant is a directory under the catalog root with its own
+career_details.json (merged with the curated catalog, like the default one)
+and an optional catalog.json with extra field roles and college overrides:
+
+    {"roles": {"Engineering & Technology": ["Drone Engineer"]},
+     "colleges": {"General": [{"name": "...", "exam": "...", "highlights": "..."}]}}
+
+All tenants share one SentenceTransformer. Career vectors are saved next to
+the catalog (career_vectors.npy with its manifest; the default catalog's go
+to the model dir) and memory-mapped, so a tenant that was evicted for being idle
+comes back without re-encoding.
+
+Edits to a loaded catalog's files are picked up by Catalog.reload_if_changed()
+(polled by the GUI, or by CatalogRegistry.start_watching() in a server): only
+added or changed careers are re-encoded and the new engine replaces the old
+one in a single assignment, so queries already running are unaffected.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from artifact_bundle import load_bundle
+from career_data import MODEL_DIR, COLLEGE_INFO_BY_FIELD, build_career_details, model_file
+from embedding_text import build_career_texts
+from recommender import (
+    EligibilityIndex, RecommendationEngine, encode_catalog, load_catalog_vectors, load_embedding_model,
+    store_catalog_vectors,
+)
+from tracing import span
+
+
+DEFAULT_TENANT = "default"
+DEFAULT_IDLE_SECONDS = 900
+DEFAULT_MAX_CATALOGS = 32
+DEFAULT_RELOAD_INTERVAL = 2.0
+CATALOG_DETAILS_FILE = "career_details.json"
+CATALOG_CONFIG_FILE = "catalog.json"
+
+
+def get_catalog_root():
+    return os.environ.get("CAREER_CATALOG_DIR", os.path.join(MODEL_DIR, "catalogs"))
+
+
+def get_tenant():
+    """Catalog the GUI should serve, from CAREER_TENANT (None means the default one)."""
+    return os.environ.get("CAREER_TENANT", "").strip() or None
+
+
+def get_registry_limits():
+    """(idle seconds, max resident catalogs) from CAREER_CATALOG_IDLE_SECONDS / CAREER_CATALOG_MAX."""
+    try:
+        idle_seconds = float(os.environ.get("CAREER_CATALOG_IDLE_SECONDS", DEFAULT_IDLE_SECONDS))
+        max_catalogs = int(os.environ.get("CAREER_CATALOG_MAX", DEFAULT_MAX_CATALOGS))
+    except ValueError as e:
+        print(f"Invalid catalog registry setting ({e}), using defaults")
+        idle_seconds, max_catalogs = DEFAULT_IDLE_SECONDS, DEFAULT_MAX_CATALOGS
+    return idle_seconds, max(1, max_catalogs)
+
+
+def get_reload_interval():
+    """Seconds between checks for edited catalog files (CAREER_RELOAD_INTERVAL, 0 disables)."""
+    try:
+        return max(0.0, float(os.environ.get("CAREER_RELOAD_INTERVAL", DEFAULT_RELOAD_INTERVAL)))
+    except ValueError:
+        print(f"Invalid CAREER_RELOAD_INTERVAL, using {DEFAULT_RELOAD_INTERVAL}s")
+        return DEFAULT_RELOAD_INTERVAL
+
+
+def read_json_file(path, default):
+    """Like safe_load_json, but a file that exists and does not parse raises
+    ValueError instead of silently becoming the default (e.g. mid-save)."""
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def catalog_files(path, name=None):
+    """(career_details.json, catalog.json) of a catalog directory; the default
+    catalog falls back to the career_details.json checked in with the code."""
+    if name == DEFAULT_TENANT:
+        details = model_file(CATALOG_DETAILS_FILE, path)
+    else:
+        details = os.path.join(path, CATALOG_DETAILS_FILE)
+    return [details, os.path.join(path, CATALOG_CONFIG_FILE)]
+
+
+def file_signature(paths):
+    """(mtime_ns, size) per path, None for missing files."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class Catalog:
+    """One tenant's engine and college lists, plus when it was last used."""
+
+    def __init__(self, name, path, engine, colleges=None, signature=None):
+        self.name = name
+        self.path = path
+        self.engine = engine
+        self.colleges = COLLEGE_INFO_BY_FIELD if colleges is None else colleges
+        self.signature = signature
+        self.loaded_at = self.last_used = time.monotonic()
+        self.reloads = 0
+        self._pending_signature = None
+        self._reload_lock = threading.Lock()
+
+    @staticmethod
+    def read_files(path, name=None):
+        """(career_details, catalog config) from a catalog directory."""
+        details_path, config_path = catalog_files(path, name)
+        json_details = read_json_file(details_path, {})
+        config = read_json_file(config_path, {})
+        return build_career_details(json_details), config
+
+    @staticmethod
+    def build_colleges(config):
+        colleges = dict(COLLEGE_INFO_BY_FIELD)
+        colleges.update(config.get("colleges") or {})
+        return colleges
+
+    @staticmethod
+    def build_eligibility(career_names, config):
+        roles = config.get("roles") or {}
+        return EligibilityIndex.with_roles(career_names, roles) if roles else None
+
+    @classmethod
+    def load(cls, name, path, embed_model, **engine_kwargs):
+        """Build a tenant catalog from its directory."""
+        signature = file_signature(catalog_files(path, name))
+        try:
+            career_details, config = cls.read_files(path, name)
+        except ValueError as e:
+            print(f"Could not parse catalog {name} ({e}), using the curated catalog")
+            career_details, config = build_career_details({}), {}
+        dtype = engine_kwargs.pop("embedding_dtype", None)
+        career_names = list(career_details.keys())
+        texts = build_career_texts(career_details, career_names)
+
+        # The default catalog caches its vectors in the model dir, created on first use
+        if name == DEFAULT_TENANT or os.path.isdir(path):
+            career_matrix = load_catalog_vectors(path, career_names, texts, embed_model, dtype)
+        else:
+            career_matrix = encode_catalog(embed_model, texts, dtype)
+
+        # Calibration and the career graph come from the tenant's own bundle
+        engine = RecommendationEngine(
+            career_details, embed_model, career_matrix=career_matrix,
+            eligibility=cls.build_eligibility(career_names, config), bundle=load_bundle(path), **engine_kwargs
+        )
+        return cls(name, path, engine, cls.build_colleges(config), signature)
+
+    def touch(self):
+        self.last_used = time.monotonic()
+
+    def recommend(self, selections, timings=None):
+        self.touch()
+        return self.engine.recommend(selections, timings=timings)
+
+    def recommend_batch(self, selections_list, timings=None):
+        self.touch()
+        return self.engine.recommend_batch(selections_list, timings=timings)
+
+    def get_college_info(self, career):
+        """Curated college info for a career, with this tenant's overrides."""
+        engine, colleges = self.engine, self.colleges
+        for field in engine.eligibility.fields(career):
+            if field in colleges:
+                return colleges[field]
+        return colleges.get("General", [])
+
+    def reload_if_changed(self):
+        """Reload when the catalog files changed and have been stable for one
+        poll (so a half-saved file is not picked up). Returns the diff of the
+        reload, or None if nothing was reloaded."""
+        signature = file_signature(catalog_files(self.path, self.name))
+        if signature == self.signature:
+            self._pending_signature = None
+            return None
+        if signature != self._pending_signature:
+            self._pending_signature = signature
+            return None
+        return self.reload(signature)
+
+    def reload(self, signature=None):
+        """Re-read the catalog files and swap in a new engine, re-encoding only
+        added or changed careers. Keeps the current engine if a file does not parse."""
+        with self._reload_lock:
+            signature = signature or file_signature(catalog_files(self.path, self.name))
+            try:
+                career_details, config = self.read_files(self.path, self.name)
+            except (OSError, ValueError) as e:
+                # Not retried until the files change again
+                print(f"Catalog {self.name} not reloaded: {e}")
+                self.signature = signature
+                self._pending_signature = None
+                return None
+
+            with span("reload_catalog", tenant=self.name):
+                career_names = list(career_details.keys())
+                texts = build_career_texts(career_details, career_names)
+                career_matrix, diff = self.engine.updated_matrix(career_names, texts)
+                if self.name == DEFAULT_TENANT or os.path.isdir(self.path):
+                    career_matrix = store_catalog_vectors(self.path, career_matrix, career_names, texts)
+                engine = self.engine.with_catalog(
+                    career_details, career_matrix, self.build_eligibility(career_names, config)
+                )
+
+            # Queries read self.engine once, so they see either catalog whole
+            self.colleges = self.build_colleges(config)
+            self.engine = engine
+            self.signature = signature
+            self._pending_signature = None
+            self.reloads += 1
+            print(f"Catalog {self.name} reloaded: {len(diff['added'])} added, "
+                  f"{len(diff['changed'])} changed, {len(diff['removed'])} removed")
+            return diff
+
+
+class CatalogRegistry:
+    """Lazily loaded tenant catalogs sharing one embedding model.
+
+    Catalogs idle for longer than idle_seconds, or beyond max_catalogs in
+    least-recently-used order, are dropped on the next get() or evict_idle().
+    """
+
+    def __init__(self, root=None, embed_model=None, idle_seconds=None, max_catalogs=None,
+                 default_dir=MODEL_DIR, **engine_kwargs):
+        env_idle, env_max = get_registry_limits()
+        self.root = root or get_catalog_root()
+        self.default_dir = default_dir
+        self.idle_seconds = env_idle if idle_seconds is None else idle_seconds
+        self.max_catalogs = env_max if max_catalogs is None else max_catalogs
+        self.engine_kwargs = engine_kwargs
+        self._embed_model = embed_model
+        self._catalogs = OrderedDict()
+        self._load_locks = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+        self._watcher = None
+        self._stop_watching = threading.Event()
+
+    @property
+    def embed_model(self):
+        """The shared sentence transformer, loaded on first use."""
+        if self._embed_model is None:
+            with self._lock:
+                if self._embed_model is None:
+                    with span("load_embedding_model"):
+                        self._embed_model = load_embedding_model()
+        return self._embed_model
+
+    def __len__(self):
+        return len(self._catalogs)
+
+    def __contains__(self, tenant):
+        return tenant in self._catalogs
+
+    def tenant_path(self, tenant):
+        if tenant == DEFAULT_TENANT:
+            return self.default_dir
+        if not tenant or os.path.basename(tenant) != tenant or tenant.startswith("."):
+            raise ValueError(f"Invalid catalog name: {tenant!r}")
+        path = os.path.join(self.root, tenant)
+        if not os.path.isdir(path):
+            raise KeyError(f"Unknown catalog: {tenant}")
+        return path
+
+    def tenants(self):
+        """Tenants available on disk (the default catalog is always available)."""
+        names = [DEFAULT_TENANT]
+        if os.path.isdir(self.root):
+            names.extend(sorted(
+                name for name in os.listdir(self.root)
+                if not name.startswith(".") and os.path.isdir(os.path.join(self.root, name))
+            ))
+        return names
+
+    def get(self, tenant=DEFAULT_TENANT):
+        """Return the tenant's catalog, loading it if it is not resident."""
+        self.evict_idle()
+        with self._lock:
+            catalog = self._catalogs.get(tenant)
+            if catalog is not None:
+                self._catalogs.move_to_end(tenant)
+                catalog.touch()
+                return catalog
+            load_lock = self._load_locks.setdefault(tenant, threading.Lock())
+
+        # Loads of different tenants run in parallel; concurrent requests
+        # for the same tenant wait for the first one
+        with load_lock:
+            with self._lock:
+                catalog = self._catalogs.get(tenant)
+            if catalog is None:
+                path = self.tenant_path(tenant)
+                with span("load_catalog", tenant=tenant):
+                    catalog = Catalog.load(tenant, path, self.embed_model, **self.engine_kwargs)
+                with self._lock:
+                    self._catalogs[tenant] = catalog
+                    self._load_locks.pop(tenant, None)
+                    self.loads += 1
+                    self._evict_over_limit()
+        catalog.touch()
+        return catalog
+
+    def recommend(self, tenant, selections, timings=None):
+        return self.get(tenant).recommend(selections, timings=timings)
+
+    def recommend_batch(self, tenant, selections_list, timings=None):
+        return self.get(tenant).recommend_batch(selections_list, timings=timings)
+
+    def evict(self, tenant):
+        with self._lock:
+            if self._catalogs.pop(tenant, None) is not None:
+                self.evictions += 1
+                return True
+        return False
+
+    def evict_idle(self, now=None):
+        """Drop catalogs unused for idle_seconds. Returns the evicted names."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [name for name, catalog in self._catalogs.items()
+                    if now - catalog.last_used > self.idle_seconds]
+            for name in idle:
+                del self._catalogs[name]
+            self.evictions += len(idle)
+        return idle
+
+    def reload_changed(self):
+        """Reload resident catalogs whose files were edited. Returns {tenant: diff}."""
+        with self._lock:
+            catalogs = list(self._catalogs.values())
+        reloaded = {}
+        for catalog in catalogs:
+            diff = catalog.reload_if_changed()
+            if diff is not None:
+                reloaded[catalog.name] = diff
+        return reloaded
+
+    def start_watching(self, interval=None):
+        """Poll resident catalogs for edits in a daemon thread."""
+        interval = get_reload_interval() if interval is None else interval
+        if interval <= 0 or self._watcher is not None:
+            return
+        self._stop_watching.clear()
+
+        def watch():
+            while not self._stop_watching.wait(interval):
+                try:
+                    self.reload_changed()
+                except Exception as e:
+                    print(f"Catalog reload failed: {e}")
+
+        self._watcher = threading.Thread(target=watch, name="catalog-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._stop_watching.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def _evict_over_limit(self):
+        while len(self._catalogs) > self.max_catalogs:
+            self._catalogs.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "resident": list(self._catalogs),
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "vector_bytes": sum(c.engine.career_matrix.nbytes for c in self._catalogs.values()),
+            }
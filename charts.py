@@ -0,0 +1,159 @@
+"""Headless rendering of the match-score chart shown by display_analytics.
+
+Uses the Agg canvas directly (no pyplot, no Qt), so it can run in the GUI,
+a server or a worker process. Figures are pooled and redrawn rather than
+created per chart, and output bytes are cached by (format, careers, scores
+rounded to the 0.1% the labels show), so showing the same result again
+costs a dictionary lookup.
+
+Environment:
+    CAREER_CHART_CACHE_SIZE   charts kept (default 128, 0 disables the cache)
+    CAREER_CHART_POOL_SIZE    figures that can render at once (default 2)
+"""
+import io
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+from matplotlib import style
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+CHART_COLORS = ['#60a5fa', '#34d399', '#fbbf24', '#a78bfa']
+CHART_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+CHART_SIZE = (10, 5)
+CHART_STYLE = "dark_background"
+DEFAULT_CHART_CACHE_SIZE = 128
+DEFAULT_CHART_POOL_SIZE = 2
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_chart_settings():
+    """(cache size, pool size) from CAREER_CHART_CACHE_SIZE / CAREER_CHART_POOL_SIZE."""
+    try:
+        return (max(0, int(os.environ.get("CAREER_CHART_CACHE_SIZE", DEFAULT_CHART_CACHE_SIZE))),
+                max(1, int(os.environ.get("CAREER_CHART_POOL_SIZE", DEFAULT_CHART_POOL_SIZE))))
+    except ValueError as e:
+        print(f"Invalid chart setting ({e}), using defaults")
+        return DEFAULT_CHART_CACHE_SIZE, DEFAULT_CHART_POOL_SIZE
+
+
+def chart_key(recommendations, fmt):
+    """Cache key: what the chart shows, at the precision it shows it."""
+    return (fmt, tuple(job for job, _ in recommendations),
+            tuple(round(score * 100, 1) for _, score in recommendations))
+
+
+class ChartRenderer:
+    """Renders score charts on pooled figures, with an LRU of output bytes."""
+
+    def __init__(self, cache_size=None, pool_size=None):
+        default_cache_size, default_pool_size = get_chart_settings()
+        self.cache_size = default_cache_size if cache_size is None else cache_size
+        self.pool_size = default_pool_size if pool_size is None else max(1, pool_size)
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.figures = queue.LifoQueue()
+        self.created = 0
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, recommendations, fmt="png"):
+        key = chart_key(recommendations, fmt)
+        with self.lock:
+            data = self.cache.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, recommendations, fmt, data):
+        if self.cache_size <= 0:
+            return
+        with self.lock:
+            self.cache[chart_key(recommendations, fmt)] = data
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def acquire_figure(self):
+        """A free pooled figure; a new one while the pool is below pool_size,
+        otherwise wait for one to be released."""
+        try:
+            return self.figures.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            create = self.created < self.pool_size
+            if create:
+                self.created += 1
+        if not create:
+            return self.figures.get()
+        with style.context(CHART_STYLE):
+            fig = Figure(figsize=CHART_SIZE)
+            FigureCanvasAgg(fig)
+            fig.add_subplot()
+        return fig
+
+    def draw(self, fig, recommendations):
+        names = [job for job, _ in recommendations]
+        scores = [round(score * 100, 1) for _, score in recommendations]
+        ax = fig.axes[0]
+        ax.clear()
+        fig.patch.set_facecolor('#2c2c2c')
+        ax.set_facecolor('#1a1a1a')
+
+        bars = ax.bar(names, scores, color=CHART_COLORS, edgecolor='white', linewidth=1.5)
+        ax.set_ylabel('Match Score (%)', color='white', fontsize=11)
+        ax.set_title('Career Recommendation Scores', color='white', fontsize=14, fontweight='bold')
+        ax.tick_params(axis='x', rotation=45, colors='white', labelsize=10)
+        ax.tick_params(axis='y', colors='white', labelsize=10)
+        ax.set_ylim(0, 100)
+        for bar, score in zip(bars, scores):
+            ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height() + 1,
+                    f'{score:.1f}%', ha='center', va='bottom',
+                    fontweight='bold', fontsize=10, color='white')
+        fig.tight_layout()
+
+    def render(self, recommendations, fmt="png"):
+        """Bar chart of [(career, score)] with scores in 0-1, as image bytes."""
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format: {fmt}")
+        data = self.cached(recommendations, fmt)
+        if data is not None:
+            return data
+
+        fig = self.acquire_figure()
+        try:
+            with style.context(CHART_STYLE):
+                self.draw(fig, recommendations)
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format=fmt, facecolor=fig.get_facecolor())
+        finally:
+            self.figures.put(fig)
+        data = buffer.getvalue()
+        self.put(recommendations, fmt, data)
+        return data
+
+    def stats(self):
+        return {"cached": len(self.cache), "hits": self.hits, "misses": self.misses, "figures": self.created}
+
+
+def get_chart_renderer():
+    """Process-wide renderer, created on first use."""
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = ChartRenderer()
+    return _renderer
+
+
+def render_score_chart(recommendations, fmt="png"):
+    """Chart bytes from the shared renderer (cached)."""
+    return get_chart_renderer().render(recommendations, fmt)
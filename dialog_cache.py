@@ -0,0 +1,81 @@
+"""Bounded cache of built detail dialogs and their content models.
+
+Roadmap and college dialogs depend only on the career and the science focus
+(the focus decides which entrance exam is merged into the roadmap), so a built
+dialog can be re-shown as-is until the focus changes.
+"""
+import os
+from collections import OrderedDict
+
+
+DEFAULT_DIALOG_CACHE_SIZE = 12
+
+
+def get_dialog_cache_size():
+    try:
+        return max(0, int(os.environ.get("CAREER_DIALOG_CACHE_SIZE", DEFAULT_DIALOG_CACHE_SIZE)))
+    except ValueError as e:
+        print(f"Invalid dialog cache size ({e}), using {DEFAULT_DIALOG_CACHE_SIZE}")
+        return DEFAULT_DIALOG_CACHE_SIZE
+
+
+class DialogCache:
+    """LRU of dialogs keyed by (kind, career), scoped to one science focus.
+
+    on_evict is called with each dialog that is dropped, so the GUI can
+    deleteLater() it.
+    """
+
+    def __init__(self, max_size=None, on_evict=None):
+        self.max_size = get_dialog_cache_size() if max_size is None else max_size
+        self.on_evict = on_evict
+        self.focus = None
+        self.dialogs = OrderedDict()
+        self.models = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.dialogs)
+
+    def set_focus(self, focus):
+        """Drop everything if the science focus differs from the cached one."""
+        if focus != self.focus:
+            self.clear()
+            self.focus = focus
+
+    def get(self, key):
+        dialog = self.dialogs.get(key)
+        if dialog is None:
+            self.misses += 1
+            return None
+        self.dialogs.move_to_end(key)
+        self.hits += 1
+        return dialog
+
+    def put(self, key, dialog):
+        if self.max_size <= 0:
+            return
+        self.dialogs[key] = dialog
+        self.dialogs.move_to_end(key)
+        while len(self.dialogs) > self.max_size:
+            _, evicted = self.dialogs.popitem(last=False)
+            self._evict(evicted)
+
+    def get_model(self, key, build):
+        """Memoized content model for the current focus."""
+        model = self.models.get(key)
+        if model is None:
+            model = self.models[key] = build()
+        return model
+
+    def clear(self):
+        dialogs = list(self.dialogs.values())
+        self.dialogs.clear()
+        self.models.clear()
+        for dialog in dialogs:
+            self._evict(dialog)
+
+    def _evict(self, dialog):
+        if self.on_evict:
+            self.on_evict(dialog)
@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+
+import numpy as np
+
+
+EMBEDDING_DTYPES = ("float32", "float16", "int8")
+DEFAULT_EMBEDDING_DTYPE = "float32"
+# Rows widened at a time when scoring compact storage, bounds temporary memory
+SCORE_BLOCK_ROWS = 4096
+# Lowest mean top-k overlap with the float32 ranking each format must keep
+MIN_TOP_K_OVERLAP = {"float32": 1.0, "float16": 0.99, "int8": 0.95}
+
+
+def get_embedding_dtype():
+    """Storage dtype for career embeddings, from CAREER_EMBEDDING_DTYPE."""
+    dtype = os.environ.get("CAREER_EMBEDDING_DTYPE", DEFAULT_EMBEDDING_DTYPE).strip().lower()
+    if dtype not in EMBEDDING_DTYPES:
+        print(f"Unknown embedding dtype '{dtype}', falling back to {DEFAULT_EMBEDDING_DTYPE}")
+        dtype = DEFAULT_EMBEDDING_DTYPE
+    return dtype
+
+
+def quantize_rows(matrix):
+    """Symmetric per-row int8 quantisation. Returns (int8 data, float32 scales)."""
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    data = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+    return data, scales.astype(np.float32)
+
+
+class CompactEmbeddings:
+    """Career embedding matrix stored as float32, float16 or per-row scaled int8.
+
+    Rows are expected to be L2-normalised so scores() returns cosine similarity.
+    """
+
+    def __init__(self, data, scales=None):
+        self.data = data
+        self.dtype = np.dtype(data.dtype).name
+        if self.dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {self.dtype}")
+        if self.dtype == "int8" and scales is None:
+            raise ValueError("int8 embeddings need per-row scales")
+        self.scales = scales
+
+    @classmethod
+    def from_float(cls, matrix, dtype=DEFAULT_EMBEDDING_DTYPE):
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if dtype == "int8":
+            data, scales = quantize_rows(matrix)
+            return cls(data, scales)
+        if dtype == "float16":
+            return cls(matrix.astype(np.float16))
+        if dtype == "float32":
+            return cls(np.ascontiguousarray(matrix))
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    def to_float(self, rows=None):
+        """Dequantised float32 copy of the selected rows."""
+        data = self.data if rows is None else self.data[rows]
+        if self.dtype == "int8":
+            scales = self.scales if rows is None else self.scales[rows]
+            return data.astype(np.float32) * scales[:, None]
+        return data.astype(np.float32)
+
+    def scores(self, query, rows=None):
+        """Dot product of a single query vector with the selected rows.
+
+        float32 is one matrix-vector product. int8 and float16 are widened
+        SCORE_BLOCK_ROWS at a time on every call (NumPy has no fast float16
+        product): float16 costs several times float32 per query (about
+        5.7 ms versus 0.75 ms at 5k careers) in exchange for half the memory;
+        see benchmarks/bench_embedding_precision.py.
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        data = self.data if rows is None else self.data[rows]
+
+        if self.dtype == "float32":
+            return data @ query
+
+        out = np.empty(data.shape[0], dtype=np.float32)
+        if self.dtype == "int8":
+            # Integer dot product, rescaled by row and query scales afterwards
+            query_data, query_scale = quantize_rows(query)
+            query_int = query_data[0].astype(np.int32)
+            scales = (self.scales if rows is None else self.scales[rows]) * query_scale[0]
+            for start in range(0, data.shape[0], SCORE_BLOCK_ROWS):
+                block = slice(start, start + SCORE_BLOCK_ROWS)
+                out[block] = (data[block].astype(np.int32) @ query_int) * scales[block]
+            return out
+
+        for start in range(0, data.shape[0], SCORE_BLOCK_ROWS):
+            block = slice(start, start + SCORE_BLOCK_ROWS)
+            out[block] = data[block].astype(np.float32) @ query
+        return out
+
+    def save(self, path):
+        """Write data to <path> (.npy) and int8 scales to <path stem>.scales.npy."""
+        np.save(path, self.data)
+        if self.scales is not None:
+            np.save(scales_path(path), self.scales)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """Load a matrix written by save() or a plain float32 .npy such as career_vectors.npy."""
+        data = np.load(path, mmap_mode=mmap_mode)
+        scales = None
+        if np.dtype(data.dtype).name == "int8":
+            scales = np.load(scales_path(path), mmap_mode=mmap_mode)
+        elif np.dtype(data.dtype).name not in EMBEDDING_DTYPES:
+            data = data.astype(np.float32)
+        return cls(data, scales)
+
+
+def scales_path(path):
+    root, _ = os.path.splitext(path)
+    return f"{root}.scales.npy"
+
+
+def manifest_path(path):
+    root, _ = os.path.splitext(path)
+    return f"{root}.json"
+
+
+def read_manifest(path):
+    """Manifest saved next to the matrix at path, {} if missing or unreadable."""
+    try:
+        with open(manifest_path(path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(path, manifest):
+    target = manifest_path(path)
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, target)
+
+
+def save_with_manifest(path, matrix, manifest):
+    """Save a matrix and its manifest.
+
+    Files are written under temporary names and renamed into place, so a
+    process still mapping the previous matrix keeps reading valid data, and
+    the manifest goes last, so an interrupted save is never trusted.
+    """
+    if os.path.exists(manifest_path(path)):
+        os.remove(manifest_path(path))
+    tmp_path = os.path.join(os.path.dirname(path), f".tmp.{os.path.basename(path)}")
+    matrix.save(tmp_path)
+    if matrix.scales is not None:
+        os.replace(scales_path(tmp_path), scales_path(path))
+    os.replace(tmp_path, path)
+    write_manifest(path, manifest)
+
+
+def top_k_rows(scores, k):
+    """Indices of the k highest scores, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def ranking_agreement(reference, compact, queries, k=8):
+    """Mean top-k overlap between float32 reference scores and a compact store."""
+    reference = np.asarray(reference, dtype=np.float32)
+    overlaps = []
+    for query in np.atleast_2d(queries):
+        expected = set(top_k_rows(reference @ query, k).tolist())
+        actual = set(top_k_rows(compact.scores(query), k).tolist())
+        overlaps.append(len(expected & actual) / max(len(expected), 1))
+    return float(np.mean(overlaps)) if overlaps else 1.0
+
+
+def check_ranking_agreement(reference, compact, queries, k=8):
+    """Raise AssertionError unless compact keeps a mean top-k overlap of at
+    least MIN_TOP_K_OVERLAP for its dtype with the float32 reference.
+    Returns the overlap."""
+    overlap = ranking_agreement(reference, compact, queries, k)
+    if overlap < MIN_TOP_K_OVERLAP[compact.dtype]:
+        raise AssertionError(f"{compact.dtype} top-{k} overlap {overlap:.4f} is below "
+                             f"{MIN_TOP_K_OVERLAP[compact.dtype]}")
+    return overlap
+
+
+def synthetic_catalog(size, queries, dim=384, seed=7):
+    """Random unit vectors, with queries drawn near catalog rows like real profiles."""
+    rng = np.random.default_rng(seed)
+    catalog = rng.standard_normal((size, dim)).astype(np.float32)
+    catalog /= np.linalg.norm(catalog, axis=1, keepdims=True)
+    anchors = catalog[rng.integers(0, size, queries)]
+    queries = anchors + rng.standard_normal((queries, dim)).astype(np.float32) * 0.05
+    return catalog, queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def main():
+    from career_data import MODEL_DIR, model_file
+
+    parser = argparse.ArgumentParser(description="Check that compact storage keeps the float32 ranking.")
+    parser.add_argument("--vectors", default=model_file("career_vectors.npy", MODEL_DIR),
+                        help="float32 career vectors; each career is a query")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="use N random career vectors and queries near them instead")
+    parser.add_argument("--k", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        reference, queries = synthetic_catalog(args.synthetic, 200)
+    else:
+        reference = CompactEmbeddings.load(args.vectors).to_float()
+        queries = reference
+    for dtype in EMBEDDING_DTYPES:
+        overlap = check_ranking_agreement(reference, CompactEmbeddings.from_float(reference, dtype), queries, args.k)
+        print(f"✅ {dtype:>8}: top-{args.k} overlap {overlap:.4f} on {len(queries)} queries "
+              f"(min {MIN_TOP_K_OVERLAP[dtype]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Text embedded for each career, shared by the app and career_embeddings.py.
+
+Vectors are only interchangeable if they were built from the same text, so
+the template is versioned: bump EMBEDDING_TEXT_VERSION whenever
+build_career_text changes and every saved matrix whose manifest records an
+older version is re-encoded instead of being reused.
+"""
+import hashlib
+
+
+EMBEDDING_TEXT_VERSION = 1
+
+
+def build_career_text(name, details):
+    """Version 1: the career description, or the name if there is none."""
+    return details.get("description") or name
+
+
+def build_career_texts(career_details, career_names=None):
+    """Texts for the catalog, one per career, in career_names order."""
+    names = list(career_details.keys()) if career_names is None else career_names
+    return [build_career_text(name, career_details[name]) for name in names]
+
+
+def text_digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def vector_manifest(career_names, texts, model_name, dtype, normalized=True):
+    """Manifest saved next to a career matrix: what produced each row."""
+    return {
+        "text_version": EMBEDDING_TEXT_VERSION,
+        "model": model_name,
+        "dtype": dtype,
+        "normalized": normalized,
+        "names": list(career_names),
+        "row_digests": [text_digest(text) for text in texts],
+    }
+
+
+def reusable_rows(manifest, career_names, texts, model_name):
+    """Map row -> saved row for careers whose saved vector was built from the
+    same text, template version and model (empty if none can be reused)."""
+    if (manifest.get("text_version") != EMBEDDING_TEXT_VERSION or manifest.get("model") != model_name
+            or not manifest.get("normalized")):
+        return {}
+    saved = {
+        (name, digest): row
+        for row, (name, digest) in enumerate(zip(manifest.get("names", []), manifest.get("row_digests", [])))
+    }
+    rows = {}
+    for row, (name, text) in enumerate(zip(career_names, texts)):
+        saved_row = saved.get((name, text_digest(text)))
+        if saved_row is not None:
+            rows[row] = saved_row
+    return rows
@@ -0,0 +1,110 @@
+import json
+import random
+
+from career_data import (
+    CAREER_MAPPINGS, FIELD_CAREER_CLUSTERS, HOBBY_OPTIONS, FREE_TIME_OPTIONS, SUBJECT_OPTIONS,
+    SCIENCE_FOCUS_OPTIONS, get_science_path_labels_for_focus,
+)
+
+
+CORPUS_VERSION = 1
+
+ASPIRATION_TEXTS = [
+    "",
+    "I enjoy solving complex problems and want a stable, well-paid career.",
+    "I love helping people and want to make a positive impact on my community.",
+    "I like building things with computers and learning new technologies every day.",
+    "I am creative, I draw and design posters for school events.",
+    "I want to start my own business one day and understand how markets work.",
+    "Biology experiments and the human body fascinate me.",
+    "I enjoy debating, reading about law and current affairs.",
+    "I am good at maths and statistics and like finding patterns in data.",
+    "I want a career in government service to serve the country.",
+    "Sports and fitness are my passion and I want to coach others.",
+    "I write stories and short videos and want to work in media.",
+]
+
+
+def get_stream_fields(stream, focus=None):
+    """Fields offered by the input form for a stream (and science focus)."""
+    if stream == "Science":
+        return get_science_path_labels_for_focus(focus) or ["Select science focus above"]
+    return CAREER_MAPPINGS["fields"].get(stream, []) or ["Select a stream first"]
+
+
+def make_selections(stream, focus, field, role, hobby, free_time, subject, free_text):
+    focus_labels = {key: label for label, key in SCIENCE_FOCUS_OPTIONS}
+    return {
+        "stream": stream,
+        "science_focus": focus,
+        "science_focus_label": focus_labels.get(focus, ""),
+        "field": field,
+        "role": role,
+        "hobby": hobby,
+        "free_time": free_time,
+        "interested_subject": subject,
+        "free_text": free_text,
+    }
+
+
+def iter_form_paths():
+    """Every (stream, focus, field) combination the input form can produce."""
+    for stream in CAREER_MAPPINGS["streams"]:
+        focuses = [None]
+        if stream == "Science":
+            focuses += [key for _, key in SCIENCE_FOCUS_OPTIONS]
+        for focus in focuses:
+            for field in get_stream_fields(stream, focus):
+                yield stream, focus, field
+
+
+def generate_profile_corpus(size=500, seed=42):
+    """Reproducible synthetic student profiles.
+
+    The first pass walks every stream/focus/field path and cycles through
+    HOBBY_OPTIONS and SUBJECT_OPTIONS so each option appears at least once;
+    the rest are sampled with a seeded RNG.
+    """
+    rng = random.Random(seed)
+    paths = list(iter_form_paths())
+    coverage = max(len(paths), len(HOBBY_OPTIONS), len(SUBJECT_OPTIONS))
+
+    corpus = []
+    for idx in range(max(size, coverage)):
+        if idx < coverage:
+            stream, focus, field = paths[idx % len(paths)]
+            hobby = HOBBY_OPTIONS[idx % len(HOBBY_OPTIONS)]
+            subject = SUBJECT_OPTIONS[idx % len(SUBJECT_OPTIONS)]
+        else:
+            stream, focus, field = rng.choice(paths)
+            hobby = rng.choice(HOBBY_OPTIONS)
+            subject = rng.choice(SUBJECT_OPTIONS)
+        roles = CAREER_MAPPINGS["roles"].get(field, [])
+        role = rng.choice(roles) if roles else ""
+        corpus.append(make_selections(
+            stream, focus, field, role, hobby,
+            rng.choice(FREE_TIME_OPTIONS), subject, rng.choice(ASPIRATION_TEXTS),
+        ))
+    return corpus
+
+
+def label_profile(selections):
+    """Careers that fit a synthetic profile: the role it picked and the
+    careers of its field, as listed by the form and the field clusters."""
+    field = selections.get("field", "")
+    careers = set(CAREER_MAPPINGS["roles"].get(field, [])) | set(FIELD_CAREER_CLUSTERS.get(field, []))
+    if selections.get("role"):
+        careers.add(selections["role"])
+    return careers
+
+
+def save_corpus(corpus, path):
+    """Write a corpus as JSONL, one selections dict per line."""
+    with open(path, "w", encoding="utf-8") as f:
+        for selections in corpus:
+            f.write(json.dumps(selections, ensure_ascii=False) + "\n")
+
+
+def load_corpus(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,961 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from artifact_bundle import load_bundle
+from calibration import load_calibration
+from career_graph import CareerGraph, catalog_digest, get_graph_neighbors, load_career_graph
+from career_data import (
+    MODEL_DIR, CAREER_MAPPINGS, FIELD_ROLE_MAP, STREAM_ROLE_MAP, FIELD_TO_STREAM, SUBJECT_FIELD_MAP,
+    INTEREST_FIELD_MAP, FIELD_CAREER_CLUSTERS, get_science_path_labels_for_focus,
+    get_science_field_tags_for_focus, load_career_details,
+)
+from embedding_store import CompactEmbeddings, get_embedding_dtype, read_manifest, save_with_manifest
+from embedding_text import build_career_texts, reusable_rows, text_digest, vector_manifest
+from retrieval import HybridRetriever, build_lexical_text, get_retrieval_config
+from text_preprocessing import MIN_CHUNK_TOKENS, SPECIAL_TOKENS, clean_free_text, get_profile_tokenizer
+from torch_runtime import RuntimeModel
+from tracing import span
+
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# Precomputed by career_embeddings.py, or saved by an earlier start
+CAREER_VECTORS_FILE = "career_vectors.npy"
+
+# Placeholder entries shown in the field combo before a real choice exists
+PLACEHOLDER_FIELDS = {"Select science focus above", "Select a stream first"}
+
+# Score boosts for careers that match the selections (see field_boosts)
+FIELD_BONUS = 0.4  # strong preference for matching field
+STREAM_BONUS = 0.1  # mild boost for matching stream
+SCIENCE_FOCUS_BONUS = 0.25
+INTEREST_BONUS = 0.3
+RELATED_BONUS = 0.05
+# Related careers score at least this share of the best similarity
+RELATED_FLOOR = 0.85
+TOP_K = 6
+# Marks a profile whose query vector has not been encoded yet
+NOT_ENCODED = object()
+
+# Keys of a selections dict, as read from the input form
+SELECTION_KEYS = (
+    "stream", "science_focus", "science_focus_label", "field", "role",
+    "hobby", "free_time", "interested_subject", "free_text",
+)
+# The ones a ProfileContext depends on
+PROFILE_KEYS = ("stream", "science_focus", "science_focus_label", "field", "hobby", "interested_subject")
+DEFAULT_PROFILE_CACHE_SIZE = 256
+
+
+def load_embedding_model(model_name=EMBEDDING_MODEL_NAME, runtime_config=None):
+    """Load the sentence transformer used for profiles and careers, with the
+    torch runtime settings (threads, grad mode, compile) applied."""
+    return RuntimeModel(SentenceTransformer(model_name), runtime_config)
+
+
+def normalize_selections(selections):
+    """Selections dict from outside the form (JSON input): every key present,
+    missing or null values as "". Raises ValueError if it is not a profile."""
+    if not isinstance(selections, dict) or not any(key in selections for key in SELECTION_KEYS):
+        raise ValueError("record has no profile selections")
+    for key in SELECTION_KEYS:
+        value = selections.get(key)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"selection {key!r} must be a string, not {type(value).__name__}")
+    return {key: selections.get(key) or "" for key in SELECTION_KEYS}
+
+
+def build_profile_text(selections, free_text=None):
+    """Build the text that is embedded for a student's selections.
+
+    free_text is the profile's free text already cleaned (clean_free_text),
+    when the caller has it; otherwise it is cleaned here."""
+    if free_text is None:
+        free_text = clean_free_text(selections.get("free_text"))
+    profile_parts = [
+        f"Stream: {selections.get('stream', '')}",
+        f"Field: {selections.get('field', '')}",
+        f"Role: {selections.get('role', '')}",
+        f"Hobby: {selections.get('hobby', '')}",
+        f"Free time: {selections.get('free_time', '')}",
+        f"Interest: {selections.get('interested_subject', '')}",
+        free_text,
+    ]
+
+    science_focus_label = selections.get("science_focus_label") if get_science_focus(selections) else ""
+    if science_focus_label:
+        profile_parts.append(f"Science focus: {science_focus_label}")
+
+    return " ".join(filter(None, profile_parts))
+
+
+def build_profile_chunks(selections, tokenizer=None, free_text=None):
+    """Texts to embed for a profile, with a weight for each.
+
+    Usually just [build_profile_text(selections)]. If that is longer than
+    the model's max_seq_length, the free text is chunked and each chunk is
+    embedded with the selections repeated, weighted by its token count.
+    free_text is as for build_profile_text.
+    """
+    if free_text is None:
+        free_text = clean_free_text(selections.get("free_text"))
+    text = build_profile_text(selections, free_text)
+    tokenizer = tokenizer or get_profile_tokenizer()
+    # Every token covers at least one character, so short texts fit untokenized
+    if tokenizer is None or not free_text or len(text) + SPECIAL_TOKENS <= tokenizer.max_seq_length:
+        return [text], [1]
+
+    prefix_tokens = tokenizer.count_tokens(build_profile_text(selections, ""))
+    budget = max(MIN_CHUNK_TOKENS, tokenizer.max_seq_length - SPECIAL_TOKENS - prefix_tokens)
+    # The free text is tokenized once, sentence by sentence, to chunk it;
+    # if it fits in one chunk, the whole profile fits in one sequence
+    chunks, counts, dropped = tokenizer.chunk(free_text, budget)
+    if len(chunks) <= 1 and not dropped:
+        return [text], [1]
+    return [build_profile_text(selections, chunk) for chunk in chunks], counts
+
+
+def get_science_focus(selections):
+    """Return the selected science focus (Medical/Non-Medical) if applicable."""
+    if selections.get("stream") != "Science":
+        return None
+    return selections.get("science_focus")
+
+
+def get_subject_fields(selections):
+    return set(SUBJECT_FIELD_MAP.get(selections.get("interested_subject", ""), []))
+
+
+def get_interest_fields(selections):
+    return set(INTEREST_FIELD_MAP.get(selections.get("hobby", ""), []))
+
+
+def get_science_focus_field_tags(selections):
+    focus = get_science_focus(selections)
+    if not focus:
+        return set()
+    return get_science_field_tags_for_focus(focus)
+
+
+def get_preferred_fields(selections):
+    fields = set()
+    field_value = selections.get("field")
+    if field_value and field_value not in {"Select a stream first"}:
+        fields.add(field_value)
+    fields.update(get_subject_fields(selections))
+    fields.update(get_interest_fields(selections))
+    fields.update(get_science_focus_field_tags(selections))
+    return fields
+
+
+def get_cluster_roles(field_name):
+    if not field_name or field_name in PLACEHOLDER_FIELDS:
+        return []
+    if field_name in FIELD_CAREER_CLUSTERS:
+        return FIELD_CAREER_CLUSTERS[field_name]
+    return CAREER_MAPPINGS["roles"].get(field_name, [])
+
+
+def get_related_career_targets(selections):
+    """Careers clustered under the selected field, subject, hobby and science
+    path, in that order, without repeats."""
+    fields = [selections.get("field", "")]
+    fields.extend(sorted(get_subject_fields(selections)))
+    fields.extend(sorted(get_interest_fields(selections)))
+    if selections.get("stream") == "Science":
+        fields.extend(get_science_path_labels_for_focus(get_science_focus(selections)))
+
+    targets = {}
+    for field_name in fields:
+        for role in get_cluster_roles(field_name):
+            targets.setdefault(role, None)
+    return tuple(targets)
+
+
+class ProfileContext:
+    """Everything the engine derives from one set of selections, resolved once.
+
+    Field sets are frozensets so a context can be shared between predictions
+    (see resolve_profile). The free text is not part of it.
+    """
+
+    def __init__(self, selections):
+        self.stream = selections.get("stream")
+        self.field = selections.get("field")
+        self.science_focus = get_science_focus(selections)
+        self.science_focus_label = selections.get("science_focus_label") if self.science_focus else None
+        self.subject_fields = frozenset(get_subject_fields(selections))
+        self.interest_fields = frozenset(get_interest_fields(selections))
+        self.science_focus_tags = frozenset(get_science_focus_field_tags(selections))
+        self.preferred_fields = frozenset(get_preferred_fields(selections))
+        self.related_targets = get_related_career_targets(selections)
+        self.science_path_labels = (
+            tuple(get_science_path_labels_for_focus(self.science_focus)) if self.stream == "Science" else ()
+        )
+
+
+def profile_key(selections):
+    """Selections that determine a ProfileContext, as a hashable tuple."""
+    return tuple(selections.get(key) for key in PROFILE_KEYS)
+
+
+class ProfileContextCache:
+    """LRU of ProfileContext by selection tuple; the form has few combinations,
+    so repeated predictions skip rebuilding the field sets."""
+
+    def __init__(self, max_size=None):
+        self.max_size = get_profile_cache_size() if max_size is None else max_size
+        self.contexts = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, selections):
+        key = profile_key(selections)
+        with self.lock:
+            profile = self.contexts.get(key)
+            if profile is not None:
+                self.contexts.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+        profile = ProfileContext(selections)
+        if self.max_size > 0:
+            with self.lock:
+                self.contexts[key] = profile
+                while len(self.contexts) > self.max_size:
+                    self.contexts.popitem(last=False)
+        return profile
+
+    def clear(self):
+        with self.lock:
+            self.contexts.clear()
+
+    def stats(self):
+        return {"size": len(self.contexts), "hits": self.hits, "misses": self.misses}
+
+
+def get_profile_cache_size():
+    try:
+        return max(0, int(os.environ.get("CAREER_PROFILE_CACHE_SIZE", DEFAULT_PROFILE_CACHE_SIZE)))
+    except ValueError:
+        return DEFAULT_PROFILE_CACHE_SIZE
+
+
+_profile_cache = ProfileContextCache()
+
+
+def resolve_profile(selections):
+    """ProfileContext for selections (a dict, or an already resolved context)."""
+    if isinstance(selections, ProfileContext):
+        return selections
+    return _profile_cache.resolve(selections)
+
+
+def profile_cache_stats():
+    return _profile_cache.stats()
+
+
+def is_career_valid_for_stream(career, stream):
+    """Determine whether a career is mapped to the given stream."""
+    allowed_streams = STREAM_ROLE_MAP.get(career)
+    if not allowed_streams:
+        return True
+    return stream in allowed_streams
+
+
+def is_career_valid_for_science_focus(career, focus):
+    """Ensure science recommendations align with the Medical/Non-Medical choice."""
+    if not focus:
+        return True
+    allowed_fields = get_science_field_tags_for_focus(focus)
+    if not allowed_fields:
+        return True
+    return bool(FIELD_ROLE_MAP.get(career, set()) & allowed_fields)
+
+
+def assemble_matrix(embed_model, texts, source=None, rows=None, dtype=None):
+    """Compact, normalised matrix for texts: rows listed in {row: source_row}
+    are copied from source, the rest are encoded in one batch."""
+    rows = rows or {}
+    encode_rows = [row for row in range(len(texts)) if row not in rows]
+    encoded = None
+    if encode_rows or source is None:
+        with span("encode_catalog", careers=len(encode_rows)):
+            encoded = embed_model.encode(
+                [texts[row] for row in encode_rows], convert_to_numpy=True, normalize_embeddings=True
+            )
+    matrix = np.empty((len(texts), source.shape[1] if encoded is None else encoded.shape[1]), dtype=np.float32)
+    if rows:
+        matrix[list(rows)] = source.to_float(list(rows.values()))
+    if encode_rows:
+        matrix[encode_rows] = encoded
+    return CompactEmbeddings.from_float(matrix, dtype=dtype or get_embedding_dtype())
+
+
+def encode_catalog(embed_model, texts, dtype=None):
+    """Encode catalog texts in one batch into compact, normalised storage."""
+    return assemble_matrix(embed_model, texts, dtype=dtype)
+
+
+def store_catalog_vectors(model_dir, matrix, career_names, texts):
+    """Save a catalog matrix with its manifest and return it memory-mapped
+    (or as-is if model_dir is not writable)."""
+    path = os.path.join(model_dir, CAREER_VECTORS_FILE)
+    try:
+        os.makedirs(model_dir, exist_ok=True)
+        save_with_manifest(path, matrix, vector_manifest(career_names, texts, EMBEDDING_MODEL_NAME, matrix.dtype))
+    except OSError as e:
+        print(f"Could not save career vectors in {model_dir}: {e}")
+        return matrix
+    return CompactEmbeddings.load(path, mmap_mode="r")
+
+
+def catalog_vector_sources(model_dir):
+    """[(manifest, loader)] for the saved career matrices of model_dir: the
+    artifact bundle's, then a career_vectors.npy written since."""
+    sources = []
+    bundle = load_bundle(model_dir)
+    if bundle is not None and "career_vectors" in bundle:
+        sources.append((bundle.meta("career_vectors"), lambda: CompactEmbeddings(bundle.array("career_vectors"))))
+    path = os.path.join(model_dir, CAREER_VECTORS_FILE)
+    if os.path.exists(path):
+        sources.append((read_manifest(path), lambda: CompactEmbeddings.load(path, mmap_mode="r")))
+    return sources
+
+
+def load_catalog_vectors(model_dir, career_names, texts, embed_model, dtype=None):
+    """Career matrix for a catalog directory.
+
+    Rows of the saved matrices (artifact bundle or career_vectors.npy) are
+    reused where their manifest shows they came from the same text template,
+    text and model; only the other careers are encoded, and the result is
+    saved to career_vectors.npy. An exact match is memory-mapped without
+    copying.
+    """
+    dtype = dtype or get_embedding_dtype()
+    best_rows, best_source = {}, None
+    for manifest, load in catalog_vector_sources(model_dir):
+        rows = reusable_rows(manifest, career_names, texts, EMBEDDING_MODEL_NAME)
+        exact = len(manifest.get("names", [])) == len(career_names) and all(
+            rows.get(row) == row for row in range(len(career_names))
+        )
+        if exact and manifest.get("dtype") == dtype:
+            with span("mmap_catalog", careers=len(career_names)):
+                return load()
+        if len(rows) > len(best_rows):
+            best_rows, best_source = rows, load
+
+    source = best_source() if best_rows else None
+    matrix = assemble_matrix(embed_model, texts, source, best_rows, dtype)
+    return store_catalog_vectors(model_dir, matrix, career_names, texts)
+
+
+def diff_catalog(old_names, old_texts, new_names, new_texts):
+    """Compare two catalogs by embedded text: {"added", "changed", "removed"} career names."""
+    old = dict(zip(old_names, old_texts))
+    new_set = set(new_names)
+    return {
+        "added": [name for name in new_names if name not in old],
+        "changed": [name for name, text in zip(new_names, new_texts) if name in old and old[name] != text],
+        "removed": [name for name in old_names if name not in new_set],
+    }
+
+
+def pool_embeddings(embeddings, weights=None):
+    """Weighted mean of normalised chunk embeddings, renormalised."""
+    if len(embeddings) == 1:
+        return embeddings[0]
+    pooled = np.average(embeddings, axis=0, weights=weights).astype(np.float32)
+    norm = np.linalg.norm(pooled)
+    return pooled / norm if norm > 0 else pooled
+
+
+class EligibilityIndex:
+    """Stream and field lookups for one catalog, with candidate lists
+    memoized per (stream, science focus)."""
+
+    def __init__(self, career_names, stream_role_map=None, field_role_map=None):
+        self.career_names = list(career_names)
+        self.stream_role_map = STREAM_ROLE_MAP if stream_role_map is None else stream_role_map
+        self.field_role_map = FIELD_ROLE_MAP if field_role_map is None else field_role_map
+        self._candidates = {}
+        self._rows = {name: row for row, name in enumerate(self.career_names)}
+        self._field_columns = None
+        self._stream_columns = None
+
+    @classmethod
+    def with_roles(cls, career_names, extra_roles):
+        """Index over the curated maps extended with {field: [careers]}."""
+        stream_role_map = {career: set(streams) for career, streams in STREAM_ROLE_MAP.items()}
+        field_role_map = {career: set(fields) for career, fields in FIELD_ROLE_MAP.items()}
+        for field_name, roles in extra_roles.items():
+            for role_name in roles:
+                field_role_map.setdefault(role_name, set()).add(field_name)
+                if field_name in FIELD_TO_STREAM:
+                    stream_role_map.setdefault(role_name, set()).add(FIELD_TO_STREAM[field_name])
+        return cls(career_names, stream_role_map, field_role_map)
+
+    def streams(self, career):
+        return self.stream_role_map.get(career, set())
+
+    def fields(self, career):
+        return self.field_role_map.get(career, set())
+
+    def is_valid_for_stream(self, career, stream):
+        allowed_streams = self.stream_role_map.get(career)
+        if not allowed_streams:
+            return True
+        return stream in allowed_streams
+
+    def is_valid_for_science_focus(self, career, focus):
+        if not focus:
+            return True
+        allowed_fields = get_science_field_tags_for_focus(focus)
+        if not allowed_fields:
+            return True
+        return bool(self.fields(career) & allowed_fields)
+
+    def _columns(self, role_map):
+        """Boolean column per field (or stream) over the careers, built once."""
+        columns = {}
+        for row, career in enumerate(self.career_names):
+            for key in role_map.get(career, ()):
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = np.zeros(len(self.career_names), dtype=bool)
+                column[row] = True
+        return columns
+
+    def field_mask(self, fields):
+        """Careers tagged with any of the fields, as a boolean vector."""
+        if self._field_columns is None:
+            self._field_columns = self._columns(self.field_role_map)
+        mask = np.zeros(len(self.career_names), dtype=bool)
+        for field_name in fields:
+            column = self._field_columns.get(field_name)
+            if column is not None:
+                mask |= column
+        return mask
+
+    def stream_mask(self, stream):
+        if self._stream_columns is None:
+            self._stream_columns = self._columns(self.stream_role_map)
+        column = self._stream_columns.get(stream)
+        return column.copy() if column is not None else np.zeros(len(self.career_names), dtype=bool)
+
+    def science_focus_mask(self, focus):
+        allowed_fields = get_science_field_tags_for_focus(focus) if focus else None
+        if not allowed_fields:
+            return np.ones(len(self.career_names), dtype=bool)
+        return self.field_mask(allowed_fields)
+
+    def name_mask(self, career_names):
+        mask = np.zeros(len(self.career_names), dtype=bool)
+        rows = [self._rows[name] for name in career_names if name in self._rows]
+        mask[rows] = True
+        return mask
+
+    def candidates(self, stream, focus):
+        """Careers eligible for the stream ("Other" or empty means any) and focus."""
+        if stream == "Other":
+            stream = None
+        key = (stream or None, focus or None)
+        cached = self._candidates.get(key)
+        if cached is None:
+            cached = self._candidates[key] = tuple(
+                job for job in self.career_names
+                if (not stream or self.is_valid_for_stream(job, stream))
+                and self.is_valid_for_science_focus(job, focus)
+            )
+        return cached
+
+
+class StageTimer:
+    """Accumulates wall time per pipeline stage into a dict, if one is given,
+    and opens a tracing span for the stage."""
+
+    def __init__(self, timings=None):
+        self.timings = timings
+        self.stage = None
+        self.span = None
+        self.start = 0.0
+
+    def __call__(self, stage):
+        self.stage = stage
+        return self
+
+    def __enter__(self):
+        self.span = span(self.stage)
+        self.span.__enter__()
+        if self.timings is not None:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.timings is not None:
+            elapsed = (time.perf_counter() - self.start) * 1000.0
+            self.timings[self.stage] = self.timings.get(self.stage, 0.0) + elapsed
+        self.span.__exit__(*exc)
+        return False
+
+
+class RecommendationEngine:
+    """Headless recommendation pipeline shared by the GUI and offline tools."""
+
+    def __init__(self, career_details, embed_model, embedding_dtype=None, retrieval_config=None,
+                 career_matrix=None, eligibility=None, calibration=None, graph=None, bundle=None):
+        self.career_details = career_details
+        self.embed_model = embed_model
+        self.retrieval_config = retrieval_config or get_retrieval_config()
+        # Artifact bundle of this catalog's own model dir, if any
+        self.bundle = bundle
+
+        # Precompute embeddings for all careers in one batch, stored compactly,
+        # unless the caller already has them (e.g. a memory-mapped catalog)
+        self.career_names = list(self.career_details.keys())
+        texts = build_career_texts(self.career_details, self.career_names)
+        self.catalog_digest = catalog_digest(
+            self.career_names, [text_digest(text) for text in texts], EMBEDDING_MODEL_NAME
+        )
+        if career_matrix is None:
+            career_matrix = encode_catalog(self.embed_model, texts, embedding_dtype)
+        self.career_matrix = career_matrix
+        self.eligibility = eligibility or EligibilityIndex(self.career_names)
+        # Score calibration fitted on this catalog; raw scores without one
+        self.calibration = calibration or load_calibration(bundle, self.catalog_digest)
+        self.graph = graph if graph is not None else self.load_graph()
+
+        # Two-stage retriever: TF-IDF shortlist, then MiniLM re-rank
+        with span("build_retriever"):
+            self.retriever = HybridRetriever(
+                self.career_names,
+                [build_lexical_text(job, self.career_details[job]) for job in self.career_names],
+                self.career_matrix,
+                lexical_weight=self.retrieval_config["lexical_weight"],
+                semantic_weight=self.retrieval_config["semantic_weight"],
+                shortlist_size=self.retrieval_config["shortlist_size"],
+            )
+
+    def load_graph(self, k=None):
+        """Career similarity graph for this catalog: the engine's artifact
+        bundle's if it was built from the same vectors, else built here.
+        None if CAREER_GRAPH_NEIGHBORS=0."""
+        k = get_graph_neighbors() if k is None else k
+        if k == 0:
+            return None
+        graph = load_career_graph(self.bundle, self.catalog_digest, k)
+        if graph is None:
+            with span("build_graph", careers=len(self.career_names), k=k):
+                graph = CareerGraph.build(self.career_matrix, k, info={"catalog": self.catalog_digest})
+        return graph
+
+    @classmethod
+    def load(cls, model_dir=MODEL_DIR, embed_model=None, **kwargs):
+        """Build an engine from the catalog in model_dir, reusing its saved
+        career vectors where they are still valid."""
+        career_details = load_career_details(model_dir)
+        embed_model = embed_model or load_embedding_model()
+        kwargs.setdefault("bundle", load_bundle(model_dir))
+        if "career_matrix" not in kwargs:
+            career_names = list(career_details.keys())
+            kwargs["career_matrix"] = load_catalog_vectors(
+                model_dir, career_names, build_career_texts(career_details, career_names), embed_model,
+                kwargs.pop("embedding_dtype", None),
+            )
+        return cls(career_details, embed_model, **kwargs)
+
+    def updated_matrix(self, career_names, texts):
+        """Career matrix for an edited catalog: vectors of unchanged careers are
+        reused and only added or changed texts are encoded.
+
+        Returns (CompactEmbeddings, diff_catalog result).
+        """
+        old_texts = build_career_texts(self.career_details, self.career_names)
+        diff = diff_catalog(self.career_names, old_texts, career_names, texts)
+        stale = set(diff["added"]) | set(diff["changed"])
+        old_rows = {name: row for row, name in enumerate(self.career_names)}
+        rows = {row: old_rows[name] for row, name in enumerate(career_names) if name not in stale}
+        matrix = assemble_matrix(self.embed_model, texts, self.career_matrix, rows, self.career_matrix.dtype)
+        return matrix, diff
+
+    def with_catalog(self, career_details, career_matrix=None, eligibility=None):
+        """New engine over an edited catalog, sharing the model and settings.
+
+        The caller swaps it in with a single assignment; queries already
+        running finish on this engine.
+        """
+        if career_matrix is None:
+            names = list(career_details.keys())
+            career_matrix, _ = self.updated_matrix(names, build_career_texts(career_details, names))
+        return RecommendationEngine(
+            career_details, self.embed_model, retrieval_config=self.retrieval_config,
+            career_matrix=career_matrix, eligibility=eligibility, bundle=self.bundle,
+        )
+
+    def encode_query(self, text, weights=None):
+        """Encode a profile text into a normalised query vector.
+
+        text may also be a list of chunks, which are encoded in one batch and
+        mean-pooled (weighted by weights) into one vector.
+        """
+        if isinstance(text, str) or len(text) == 1:
+            text = text if isinstance(text, str) else text[0]
+            return self.embed_model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+        embeddings = self.embed_model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+        return pool_embeddings(embeddings, weights)
+
+    def recommend(self, selections, timings=None):
+        """Full pipeline for one set of selections.
+
+        If timings is a dict, wall time in ms is accumulated per stage.
+        """
+        with span("recommend", stream=selections.get("stream"), field=selections.get("field")):
+            return self._recommend(selections, StageTimer(timings))
+
+    def recommend_batch(self, selections_list, timings=None):
+        """Recommendations for several profiles, with the texts of all of them
+        encoded in one batch. Same results as recommend() for each."""
+        with span("recommend_batch", size=len(selections_list)):
+            return [self.calibrate(final, source) for final, source in self.rank_batch(selections_list, timings)]
+
+    def rank_batch(self, selections_list, timings=None):
+        """Uncalibrated (recommendations, score source) per profile, encoded
+        in one batch; what calibration is fitted on."""
+        stage = StageTimer(timings)
+        with stage("encode"):
+            texts, spans = [], []
+            user_texts = []
+            for selections in selections_list:
+                free_text = clean_free_text(selections.get("free_text"))
+                chunks, weights = build_profile_chunks(selections, free_text=free_text)
+                user_texts.append(build_profile_text(selections, free_text))
+                needed = bool(user_texts[-1].strip()) and bool(self.get_candidates(selections))
+                spans.append((len(texts), len(chunks), weights) if needed else None)
+                if needed:
+                    texts.extend(chunks)
+            embeddings = (
+                self.embed_model.encode(texts, convert_to_numpy=True, normalize_embeddings=True) if texts else None
+            )
+        results = []
+        for selections, user_text, chunk_span in zip(selections_list, user_texts, spans):
+            query_embedding = None
+            if chunk_span is not None:
+                start, count, weights = chunk_span
+                query_embedding = pool_embeddings(embeddings[start:start + count], weights)
+            results.append(self._rank(selections, stage, query_embedding, user_text))
+        return results
+
+    def score_note(self):
+        """One line telling users what the match percentage measures."""
+        if self.calibration is not None:
+            return "Match % is a heuristic estimate calibrated on sample profiles, not a measured probability."
+        if self.retrieval_config["mode"] == "hybrid":
+            return (f"Match % = {self.retrieval_config['semantic_weight']:g} × meaning similarity + "
+                    f"{self.retrieval_config['lexical_weight']:g} × keyword overlap, plus bonuses for your selections.")
+        return "Match % is the meaning similarity to your profile, plus bonuses for your selections."
+
+    def calibrate(self, recommendations, source="similarity"):
+        """Recommendations with calibrated match probabilities (as-is without a calibration)."""
+        if self.calibration is None:
+            return recommendations
+        return self.calibration.apply(recommendations, source)
+
+    def _recommend(self, selections, stage, query_embedding=NOT_ENCODED):
+        final, source = self._rank(selections, stage, query_embedding)
+        with stage("calibrate"):
+            return self.calibrate(final, source)
+
+    def _rank(self, selections, stage, query_embedding=NOT_ENCODED, user_text=None):
+        """(top recommendations with raw scores, "similarity" or "fallback").
+
+        query_embedding is given (possibly None), with user_text, when
+        rank_batch already encoded the profile."""
+        with stage("profile_text"):
+            profile = resolve_profile(selections)
+            free_text = None
+            if user_text is None:
+                # The free text is cleaned once for the text and its chunks
+                free_text = clean_free_text(selections.get("free_text"))
+                user_text = build_profile_text(selections, free_text)
+            if query_embedding is NOT_ENCODED:
+                chunks, weights = build_profile_chunks(selections, free_text=free_text)
+        with stage("filter"):
+            candidates = self.get_candidates(profile)
+        if query_embedding is NOT_ENCODED:
+            with stage("encode"):
+                query_embedding = self.encode_query(chunks, weights) if user_text.strip() and candidates else None
+        with stage("similarity"):
+            rows, scores = self.score_rows(user_text, query_embedding, candidates, profile)
+
+        if not len(rows) or not np.any(scores):
+            # Nothing scored: curated fallbacks, boosted the same way
+            source = "fallback"
+            with stage("fallback"):
+                final = self.get_field_fallbacks(profile)
+                final = self.expand_related_careers(final, profile)
+                final = self.prioritize_recommendations_by_field(final, profile)
+        else:
+            # Boost every scored or related career, then one top-k
+            source = "similarity"
+            with stage("fuse"):
+                final = self.fuse_scores(rows, scores, profile, candidates)
+
+        # Final stream filter (redundant but ensures correctness)
+        with stage("final_filter"):
+            final, fell_back = self.filter_recommendations_by_stream(final, profile)
+            if fell_back:
+                source = "fallback"
+
+        # Return top 4-6 most relevant
+        return (final[:TOP_K] if len(final) > TOP_K else final), source
+
+    def get_candidates(self, profile):
+        """Careers eligible for the selected stream and science focus."""
+        profile = resolve_profile(profile)
+        return list(self.eligibility.candidates(profile.stream, profile.science_focus))
+
+    def score_rows(self, user_text, query_embedding, candidates, profile=None):
+        """Similarity scores for the eligible careers, as (catalog rows, scores).
+
+        In hybrid mode, eligible careers that get a field, science focus,
+        interest or related-career boost for profile are scored even outside
+        the lexical shortlist, so the boost can still lift them into the top-k.
+        """
+        if query_embedding is None:
+            rows = self.retriever.candidate_rows(candidates)
+            return rows, np.zeros(len(rows), dtype=np.float32)
+        if self.retrieval_config["mode"] == "hybrid":
+            include_rows = self.boosted_rows(profile, candidates) if profile is not None else None
+            return self.retriever.search_rows(user_text, lambda _text: query_embedding, candidates, include_rows)
+        return self.retriever.dense_search_rows(query_embedding, candidates)
+
+    def boosted_rows(self, profile, candidates):
+        """Eligible rows with more than the stream bonus or related to the
+        selections; these must have a similarity score before fusion."""
+        profile = resolve_profile(profile)
+        boosted = self.field_boosts(profile) > STREAM_BONUS
+        if profile.related_targets:
+            boosted |= self.eligibility.name_mask(profile.related_targets)
+        return np.flatnonzero(boosted & self.eligibility.name_mask(candidates))
+
+    def score_candidates(self, user_text, query_embedding, candidates):
+        """Similarity scores for the eligible careers."""
+        return self.retriever.as_dict(*self.score_rows(user_text, query_embedding, candidates))
+
+    def field_boosts(self, profile):
+        """Bonus per catalog career for matching the selected field, stream,
+        science focus or interest (the largest that applies)."""
+        profile = resolve_profile(profile)
+        boosts = np.zeros(len(self.career_names), dtype=np.float32)
+        if not profile.preferred_fields and not profile.science_focus:
+            return boosts
+
+        field_match = self.eligibility.field_mask(profile.preferred_fields)
+        boosts[field_match] = FIELD_BONUS
+        boosts[~field_match & self.eligibility.stream_mask(profile.stream)] = STREAM_BONUS
+        if profile.science_focus:
+            focus_match = self.eligibility.science_focus_mask(profile.science_focus)
+            boosts[focus_match] = np.maximum(boosts[focus_match], SCIENCE_FOCUS_BONUS)
+        if profile.interest_fields:
+            interest_match = self.eligibility.field_mask(profile.interest_fields)
+            boosts[interest_match] = np.maximum(boosts[interest_match], INTEREST_BONUS)
+        return boosts
+
+    def fuse_scores(self, rows, scores, profile, candidates):
+        """Similarity plus related-career and field boosts over the whole
+        catalog, then a single top-k.
+
+        Careers clustered under the selections score at least RELATED_FLOOR
+        of the best score, plus RELATED_BONUS. With a career graph they first
+        take the score the best-scored careers spread to them, scaled by
+        similarity, if that beats their own; other careers keep their
+        similarity score. Returns [(career, score)] best first.
+        """
+        profile = resolve_profile(profile)
+        fused = np.full(len(self.career_names), -np.inf, dtype=np.float32)
+        fused[rows] = scores
+
+        related = self.eligibility.name_mask(profile.related_targets)
+        if related.any():
+            related &= self.eligibility.name_mask(candidates)
+            if self.graph is not None:
+                seeds = np.argpartition(-scores, TOP_K - 1)[:TOP_K] if len(scores) > TOP_K else np.arange(len(scores))
+                seeds = seeds[scores[seeds] > 0]
+                expansion = self.graph.spread(rows[seeds], scores[seeds])
+                reached = related & (expansion > 0)
+                fused[reached] = np.maximum(fused[reached], expansion[reached])
+            max_score = float(np.max(scores)) if len(scores) else 0.0
+            floor = max_score * RELATED_FLOOR if max_score > 0 else 0.6
+            fused[related] = np.maximum(fused[related], floor) + RELATED_BONUS
+
+        fused = np.minimum(fused + self.field_boosts(profile), 1.0)
+        eligible = np.flatnonzero(np.isfinite(fused))
+        if len(eligible) > TOP_K:
+            eligible = eligible[np.argpartition(-fused[eligible], TOP_K - 1)[:TOP_K]]
+        # Best first; ties keep catalog order
+        top = eligible[np.lexsort((eligible, -fused[eligible]))]
+        return [(self.career_names[row], float(fused[row])) for row in top]
+
+    def prioritize_recommendations_by_field(self, recommendations, profile):
+        """Boost and reorder a short list of careers (the fallbacks) that align
+        with the selected field; scored careers go through fuse_scores."""
+        profile = resolve_profile(profile)
+        preferred_fields = profile.preferred_fields
+        science_focus = profile.science_focus
+        if not preferred_fields and not science_focus:
+            return recommendations
+
+        interest_fields = profile.interest_fields
+
+        prioritized = []
+        for career, score in recommendations:
+            bonus = 0.0
+            career_fields = self.eligibility.fields(career)
+            if preferred_fields and career_fields & preferred_fields:
+                bonus = FIELD_BONUS
+            elif profile.stream in self.eligibility.streams(career):
+                bonus = STREAM_BONUS
+            if science_focus and self.eligibility.is_valid_for_science_focus(career, science_focus):
+                bonus = max(bonus, SCIENCE_FOCUS_BONUS)
+            if interest_fields and career_fields & interest_fields:
+                bonus = max(bonus, INTEREST_BONUS)
+
+            prioritized.append((career, min(score + bonus, 1.0)))
+
+        prioritized.sort(key=lambda x: x[1], reverse=True)
+        return prioritized
+
+    def get_related_career_targets(self, profile):
+        return resolve_profile(profile).related_targets
+
+    def expand_related_careers(self, recommendations, profile):
+        """Add careers related to a short list (the fallbacks): graph
+        neighbours of the listed careers, or without a graph the careers
+        clustered under the selections."""
+        if self.graph is not None:
+            return self.expand_graph_neighbors(recommendations, profile)
+        related = self.get_related_career_targets(profile)
+        if not related:
+            return recommendations
+
+        rec_dict = {career: score for career, score in recommendations}
+        max_score = max(rec_dict.values(), default=0.7)
+        base_score = max_score * RELATED_FLOOR if max_score > 0 else 0.6
+
+        for career in related:
+            if career in rec_dict:
+                rec_dict[career] = min(rec_dict[career] + RELATED_BONUS, 1.0)
+            else:
+                rec_dict[career] = base_score
+
+        expanded = sorted(rec_dict.items(), key=lambda x: x[1], reverse=True)
+        return expanded[: max(6, len(recommendations))]
+
+    def expand_graph_neighbors(self, recommendations, profile):
+        """expand_related_careers over the career graph: each listed career
+        lends its score, scaled by similarity, to its neighbours."""
+        rows = self.retriever.positions
+        seeds = [(rows[career], score) for career, score in recommendations if career in rows]
+        if not seeds:
+            return recommendations
+        expansion = self.graph.spread([row for row, _ in seeds], [score for _, score in seeds])
+        related = set(self.get_related_career_targets(profile))
+
+        rec_dict = {career: score for career, score in recommendations}
+        for row in np.flatnonzero(expansion):
+            career = self.career_names[row]
+            rec_dict[career] = max(rec_dict.get(career, 0.0), float(expansion[row]))
+        for career in related & rec_dict.keys():
+            rec_dict[career] = min(rec_dict[career] + RELATED_BONUS, 1.0)
+
+        expanded = sorted(rec_dict.items(), key=lambda x: x[1], reverse=True)
+        return expanded[: max(6, len(recommendations))]
+
+    def filter_recommendations_by_stream(self, recommendations, profile):
+        """Keep careers that belong to the user's selected stream.
+
+        Returns (recommendations, fell_back); fell_back is True when none
+        belonged and the stream's fallback roles were returned instead."""
+        profile = resolve_profile(profile)
+        selected_stream = profile.stream
+        if not selected_stream or selected_stream == "Other":
+            return recommendations, False
+
+        focus = profile.science_focus
+        filtered = []
+        for career, score in recommendations:
+            if not self.eligibility.is_valid_for_stream(career, selected_stream):
+                continue
+            if focus and not self.eligibility.is_valid_for_science_focus(career, focus):
+                continue
+            filtered.append((career, score))
+
+        if filtered:
+            return filtered, False
+
+        return self.get_stream_fallbacks(selected_stream, profile), True
+
+    def get_stream_fallbacks(self, stream, profile):
+        """Return fallback roles that align with the current stream."""
+        roles = []
+        if stream == "Science":
+            field_list = get_science_path_labels_for_focus(resolve_profile(profile).science_focus)
+            if not field_list:
+                field_list = CAREER_MAPPINGS["fields"]["Science"]
+        else:
+            field_list = CAREER_MAPPINGS["fields"].get(stream, [])
+
+        for field in field_list:
+            cluster_roles = FIELD_CAREER_CLUSTERS.get(field)
+            if cluster_roles:
+                for role in cluster_roles:
+                    if role not in roles:
+                        roles.append(role)
+                continue
+            for role in CAREER_MAPPINGS["roles"].get(field, []):
+                if role not in roles:
+                    roles.append(role)
+
+        if not roles:
+            roles = ["Software Engineer", "Data Scientist", "Doctor", "Business Manager"]
+
+        return [(role, 0.6) for role in roles[:4]]
+
+    def get_field_fallbacks(self, profile):
+        """Fallback careers derived from the currently selected field."""
+        profile = resolve_profile(profile)
+        cluster_roles = get_cluster_roles(profile.field or "")
+        if cluster_roles:
+            return [(role, 0.65) for role in cluster_roles[:4]]
+
+        if profile.stream == "Science":
+            roles = []
+            for label in profile.science_path_labels:
+                roles.extend(get_cluster_roles(label))
+            if roles:
+                return [(role, 0.65) for role in roles[:4]]
+
+        subject_fields = profile.subject_fields
+        if subject_fields:
+            roles = []
+            for field in sorted(subject_fields):
+                roles.extend(get_cluster_roles(field))
+            if roles:
+                return [(role, 0.65) for role in roles[:4]]
+
+        interest_fields = profile.interest_fields
+        if interest_fields:
+            roles = []
+            for field in sorted(interest_fields):
+                roles.extend(get_cluster_roles(field))
+            if roles:
+                return [(role, 0.65) for role in roles[:4]]
+
+        # default mix if no field selected
+        return [("Software Engineer", 0.8), ("Data Scientist", 0.7),
+                ("Doctor", 0.6), ("Business Manager", 0.5)]
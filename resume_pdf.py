@@ -0,0 +1,484 @@
+"""Resume PDF rendering.
+
+ResumeTemplate pre-builds the parts of a resume that never change between
+students (paragraph styles, section headers, table styles, spacers and the
+achievements list); ResumeBuilder fills in only the personalised paragraphs
+and tables, and can render to a filename or any binary file-like object.
+"""
+import argparse
+import contextlib
+import io
+import json
+import re
+import threading
+import zipfile
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+
+
+PAGE_MARGIN = 0.5 * inch
+
+# Page streams are already Flate-compressed binary; the ASCII85 text wrapper
+# only makes every PDF ~12% larger and costs time to encode. reportlab reads
+# this from its process-wide rl_config, so it is only set while a resume is
+# built (see pdf_settings).
+RESUME_RL_SETTINGS = {"useA85": 0}
+
+SECTION_TITLES = {
+    "objective": "CAREER OBJECTIVE",
+    "education": "EDUCATION",
+    "skills": "SKILLS & COMPETENCIES",
+    "experience": "PROJECTS & EXPERIENCE",
+    "achievements": "ACHIEVEMENTS & CERTIFICATIONS",
+}
+
+ACHIEVEMENTS = [
+    "Academic Excellence Scholarship 2022",
+    "1st Prize in Inter-College Technical Fest",
+    "Certified in Python Programming",
+    "Volunteer of the Year - Social Service Club"
+]
+
+EDUCATION_COL_WIDTHS = [1.2*inch, 2.5*inch, 2*inch, 1.5*inch]
+SKILLS_COL_WIDTHS = [2.5*inch, 2.5*inch]
+
+RESUME_FILENAME_SUFFIX = "_Career_Resume.pdf"
+DEFAULT_RESUME_NAME = "Resume"
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+EDUCATION_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LINEBELOW', (0, 0), (-1, -1), 1, colors.grey),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
+])
+
+SKILLS_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+])
+
+_styles = None
+_styles_lock = threading.Lock()
+_rl_config_lock = threading.Lock()
+
+
+def get_resume_styles():
+    """Sample stylesheet plus the resume styles, built once per process."""
+    global _styles
+    with _styles_lock:
+        if _styles is None:
+            _styles = getSampleStyleSheet()
+            add_custom_styles(_styles)
+        return _styles
+
+
+@contextlib.contextmanager
+def pdf_settings(settings=None):
+    """Apply reportlab rl_config settings for one build and restore the
+    previous values afterwards. Builds using it run one at a time."""
+    settings = RESUME_RL_SETTINGS if settings is None else settings
+    with _rl_config_lock:
+        previous = {name: getattr(rl_config, name) for name in settings}
+        for name, value in settings.items():
+            setattr(rl_config, name, value)
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                setattr(rl_config, name, value)
+
+
+def add_custom_styles(styles):
+    """Setup custom styles for the resume"""
+    # Title Style
+    styles.add(ParagraphStyle(
+        name='ResumeTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1e3a8a'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    ))
+
+    # Section Header Style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#1e40af'),
+        spaceAfter=12,
+        spaceBefore=20,
+        leftIndent=0
+    ))
+
+    # Normal Text Style
+    styles.add(ParagraphStyle(
+        name='ResumeText',
+        parent=styles['Normal'],
+        fontSize=10,
+        leading=12,
+        spaceAfter=6
+    ))
+
+    # Skill Style
+    styles.add(ParagraphStyle(
+        name='SkillText',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=11,
+        spaceAfter=3
+    ))
+
+
+def resume_filename(user_data):
+    """Download name for a resume, e.g. Asha_Rao_Career_Resume.pdf.
+
+    The typed name is reduced to letters, digits, "_" and "-", so it is
+    always a plain basename (never a path or nested ZIP member).
+    """
+    name = UNSAFE_FILENAME_CHARS.sub("", (user_data.get('name') or '').strip().replace(' ', '_'))
+    return f"{name or DEFAULT_RESUME_NAME}{RESUME_FILENAME_SUFFIX}"
+
+
+class ResumeTemplate:
+    """Static resume flowables, parsed once and reused for every resume.
+
+    The cached flowables are shared between builds, so a template (and the
+    ResumeBuilder that owns it) must not render from two threads at once.
+    """
+
+    def __init__(self, styles=None):
+        self.styles = styles or get_resume_styles()
+        self.section_headers = {
+            key: Paragraph(f"<b>{title}</b>", self.styles['SectionHeader'])
+            for key, title in SECTION_TITLES.items()
+        }
+        self.section_gap = Spacer(1, 0.1*inch)
+        self.project_gap = Spacer(1, 0.05*inch)
+        self.achievements = [Paragraph(f"• {achievement}", self.styles['ResumeText']) for achievement in ACHIEVEMENTS]
+
+    def render(self, story, output):
+        """Lay out story into output (a filename or a binary file-like object)."""
+        doc = SimpleDocTemplate(output, pagesize=A4,
+                                topMargin=PAGE_MARGIN, bottomMargin=PAGE_MARGIN,
+                                leftMargin=PAGE_MARGIN, rightMargin=PAGE_MARGIN)
+        with pdf_settings():
+            doc.build(story)
+        return output
+
+
+class ResumeBuilder:
+    def __init__(self, template=None):
+        self.template = template or ResumeTemplate()
+        self.styles = self.template.styles
+
+    def create_resume(self, user_data, career_data, output=None):
+        """Create a professional resume PDF.
+
+        output may be a filename or a binary file-like object; without one
+        the PDF is rendered in memory and returned as bytes.
+        """
+        if output is None:
+            buffer = io.BytesIO()
+            self.create_resume(user_data, career_data, buffer)
+            return buffer.getvalue()
+
+        story = []
+        
+        # Header Section
+        story.extend(self.create_header_section(user_data))
+        
+        # Career Objective
+        story.extend(self.create_objective_section(user_data, career_data))
+        
+        # Education
+        story.extend(self.create_education_section(user_data, career_data))
+        
+        # Skills
+        story.extend(self.create_skills_section(user_data, career_data))
+        
+        # Projects/Experience
+        story.extend(self.create_experience_section(user_data, career_data))
+        
+        # Achievements
+        story.extend(self.create_achievements_section(user_data))
+        
+        # Build PDF
+        return self.template.render(story, output)
+
+    def create_header_section(self, user_data):
+        """Create resume header section"""
+        elements = []
+        
+        # Name
+        name = user_data.get('name', 'Your Name')
+        title = Paragraph(f"<b>{name}</b>", self.styles['ResumeTitle'])
+        elements.append(title)
+        
+        # Contact Information
+        contact_info = [
+            user_data.get('email', 'your.email@example.com'),
+            user_data.get('phone', '+91 XXXXXXXXXX'),
+            user_data.get('location', 'Your City, State'),
+            user_data.get('linkedin', 'linkedin.com/in/yourprofile')
+        ]
+        
+        contact_text = " | ".join(filter(None, contact_info))
+        contact_para = Paragraph(contact_text, self.styles['ResumeText'])
+        elements.append(contact_para)
+        elements.append(self.template.section_gap)
+        
+        return elements
+
+    def create_objective_section(self, user_data, career_data):
+        """Create career objective section"""
+        objective_text = self.generate_career_objective(user_data, career_data)
+        objective_para = Paragraph(objective_text, self.styles['ResumeText'])
+        
+        return [self.template.section_headers["objective"], objective_para, self.template.section_gap]
+
+    def create_education_section(self, user_data, career_data):
+        """Create education section"""
+        elements = [self.template.section_headers["education"]]
+        
+        # Current stream/education
+        stream = user_data.get('stream', '')
+        field = user_data.get('field', '')
+        
+        education_data = [
+            ["2020-2024", f"Bachelor's in {field if field else 'Relevant Field'}", "University Name", "CGPA: 8.5/10"],
+            ["2018-2020", f"12th Grade - {stream} Stream", "School Name", "Percentage: 85%"],
+            ["2018", "10th Grade", "School Name", "Percentage: 90%"]
+        ]
+        
+        # Adjust based on career recommendations
+        recommended_career = career_data[0][0] if career_data else "Professional"
+        if "Engineer" in recommended_career or "Data" in recommended_career:
+            education_data[0][1] = "Bachelor's in Computer Science/Engineering"
+        elif "Doctor" in recommended_career or "Medical" in recommended_career:
+            education_data[0][1] = "MBBS/Bachelor's in Medical Sciences"
+        elif "Business" in recommended_career or "Manager" in recommended_career:
+            education_data[0][1] = "Bachelor's in Business Administration"
+        
+        table = Table(education_data, colWidths=EDUCATION_COL_WIDTHS)
+        table.setStyle(EDUCATION_TABLE_STYLE)
+        
+        elements.append(table)
+        elements.append(self.template.section_gap)
+        
+        return elements
+
+    def create_skills_section(self, user_data, career_data):
+        """Create skills section"""
+        elements = [self.template.section_headers["skills"]]
+        
+        # Get skills from user interests and career data
+        skills = self.generate_skills(user_data, career_data)
+        
+        # Create two-column layout for skills
+        skill_table_data = []
+        mid_point = len(skills) // 2 + len(skills) % 2
+        
+        for i in range(mid_point):
+            row = []
+            if i < len(skills):
+                row.append(f"• {skills[i]}")
+            if i + mid_point < len(skills):
+                row.append(f"• {skills[i + mid_point]}")
+            else:
+                row.append("")
+            skill_table_data.append(row)
+        
+        if skill_table_data:
+            table = Table(skill_table_data, colWidths=SKILLS_COL_WIDTHS)
+            table.setStyle(SKILLS_TABLE_STYLE)
+            elements.append(table)
+        
+        elements.append(self.template.section_gap)
+        return elements
+
+    def create_experience_section(self, user_data, career_data):
+        """Create projects/experience section"""
+        elements = [self.template.section_headers["experience"]]
+        
+        projects = self.generate_projects(user_data, career_data)
+        
+        for project in projects:
+            project_text = f"<b>{project['title']}</b> - {project['duration']}<br/>{project['description']}"
+            project_para = Paragraph(project_text, self.styles['ResumeText'])
+            elements.append(project_para)
+            elements.append(self.template.project_gap)
+        
+        elements.append(self.template.section_gap)
+        return elements
+
+    def create_achievements_section(self, user_data):
+        """Create achievements section"""
+        return [self.template.section_headers["achievements"]] + self.template.achievements
+
+    def generate_career_objective(self, user_data, career_data):
+        """Generate personalized career objective"""
+        stream = user_data.get('stream', '')
+        interests = user_data.get('interests', '')
+        role = user_data.get('role', '')
+        career = career_data[0][0] if career_data else "professional"
+        
+        objectives = {
+            "Software Engineer": f"A motivated {stream} student with strong interest in {interests}. Seeking a Software Engineer position to apply programming skills and contribute to innovative software solutions.",
+            "Data Scientist": f"Analytical-minded {stream} graduate passionate about {interests}. Looking for a Data Scientist role to leverage statistical analysis and machine learning for data-driven insights.",
+            "Doctor": f"Dedicated {stream} student with deep interest in healthcare. Aspiring to become a {role} to provide quality medical care and contribute to patient well-being.",
+            "Business Manager": f"Dynamic {stream} graduate with leadership qualities and interest in {interests}. Seeking Business Manager position to drive organizational growth and operational excellence."
+        }
+        
+        return objectives.get(career, f"Enthusiastic {stream} student seeking a {career} position to apply academic knowledge and grow professionally.")
+
+    def generate_skills(self, user_data, career_data):
+        """Generate relevant skills based on user profile"""
+        base_skills = ["Communication", "Problem Solving", "Teamwork", "Time Management"]
+        
+        # Add skills based on interests
+        hobby = user_data.get('hobby', '')
+        free_time = user_data.get('free_time', '')
+        subject = user_data.get('interested_subject', '')
+        
+        interest_skills = []
+        if "Coding" in hobby or "Programming" in hobby:
+            interest_skills.extend(["Python", "Java", "Algorithms", "Debugging"])
+        if "Design" in hobby:
+            interest_skills.extend(["UI/UX Design", "Creative Thinking", "Adobe Suite"])
+        if "Finance" in hobby:
+            interest_skills.extend(["Financial Analysis", "Excel", "Market Research"])
+        if "Research" in hobby:
+            interest_skills.extend(["Data Analysis", "Research Methodology", "Report Writing"])
+        
+        # Add career-specific skills
+        career = career_data[0][0] if career_data else ""
+        career_skills = {
+            "Software Engineer": ["Python/Java/C++", "Data Structures", "OOP", "Git", "SQL", "Agile Methodology"],
+            "Data Scientist": ["Machine Learning", "Statistics", "Data Visualization", "SQL", "Python/R", "Pandas"],
+            "Doctor": ["Patient Care", "Medical Knowledge", "Diagnosis", "Emergency Handling", "Communication"],
+            "Business Manager": ["Leadership", "Strategic Planning", "Project Management", "Budgeting", "Team Management"]
+        }
+        
+        return base_skills + interest_skills + career_skills.get(career, [])
+
+    def generate_projects(self, user_data, career_data):
+        """Generate relevant projects based on interests and career"""
+        career = career_data[0][0] if career_data else ""
+        hobby = user_data.get('hobby', '')
+        
+        projects = {
+            "Software Engineer": [
+                {
+                    "title": "E-commerce Website Development",
+                    "duration": "Jan 2023 - Mar 2023",
+                    "description": "Developed a full-stack e-commerce platform using React and Node.js with user authentication and payment integration."
+                },
+                {
+                    "title": "Mobile App for Task Management",
+                    "duration": "Sep 2022 - Dec 2022", 
+                    "description": "Created a cross-platform mobile application using Flutter for personal task management with cloud synchronization."
+                }
+            ],
+            "Data Scientist": [
+                {
+                    "title": "Customer Segmentation Analysis",
+                    "duration": "Feb 2023 - Apr 2023",
+                    "description": "Implemented K-means clustering for customer segmentation using Python and scikit-learn, improving marketing strategy."
+                },
+                {
+                    "title": "Sales Prediction Model",
+                    "duration": "Oct 2022 - Jan 2023",
+                    "description": "Built a machine learning model to predict sales using historical data, achieving 85% accuracy."
+                }
+            ],
+            "Doctor": [
+                {
+                    "title": "Medical Internship",
+                    "duration": "Jun 2023 - Aug 2023", 
+                    "description": "Completed 200+ hours of clinical observation, assisted in patient care and medical procedures."
+                },
+                {
+                    "title": "Health Awareness Campaign",
+                    "duration": "Mar 2023 - May 2023",
+                    "description": "Organized community health awareness program reaching 500+ people on preventive healthcare."
+                }
+            ],
+            "Business Manager": [
+                {
+                    "title": "Business Plan Development",
+                    "duration": "Jan 2023 - Mar 2023",
+                    "description": "Created comprehensive business plan for startup including market analysis, financial projections, and operational strategy."
+                },
+                {
+                    "title": "Team Leadership Project", 
+                    "duration": "Sep 2022 - Dec 2022",
+                    "description": "Led a team of 5 members in organizing college fest, managing budget of ₹2 lakhs and coordinating 20+ events."
+                }
+            ]
+        }
+        
+        return projects.get(career, [
+            {
+                "title": "Academic Project",
+                "duration": "2022-2023", 
+                "description": "Completed comprehensive project demonstrating skills and knowledge in chosen field of study."
+            }
+        ])
+
+
+def write_resume_zip(jobs, output, builder=None):
+    """Stream resumes for (user_data, career_data) pairs into a ZIP archive.
+
+    output is a path or a binary file-like object (a response body, a
+    BytesIO, ...). Each PDF is rendered straight into its archive member,
+    nothing is written to disk per resume. PDFs are already compressed, so
+    members are stored rather than deflated. Returns the member names.
+    """
+    builder = builder or ResumeBuilder()
+    names = []
+    seen = {}
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for user_data, career_data in jobs:
+            name = resume_filename(user_data)
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = name.replace(RESUME_FILENAME_SUFFIX, f"_{count + 1}{RESUME_FILENAME_SUFFIX}")
+            with archive.open(name, "w") as member:
+                builder.create_resume(user_data, career_data, member)
+            names.append(name)
+    return names
+
+
+def iter_resume_jobs(path):
+    """Read (user_data, career_data) pairs from a JSONL file.
+
+    Each line is {"user_data": {...}, "recommendations": [[career, score], ...]}.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                career_data = [tuple(item) for item in record.get("recommendations", [])]
+                yield record.get("user_data", {}), career_data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a cohort of resumes into one ZIP archive.")
+    parser.add_argument("jobs", help="JSONL file with user_data and recommendations per line")
+    parser.add_argument("output", help="ZIP archive to write")
+    args = parser.parse_args()
+
+    names = write_resume_zip(iter_resume_jobs(args.jobs), args.output)
+    print(f"✅ {len(names)} resumes written to {args.output}")
@@ -0,0 +1,159 @@
+import os
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from embedding_store import CompactEmbeddings
+
+
+# Fusion defaults, overridable through the environment
+LEXICAL_WEIGHT = 0.3
+SEMANTIC_WEIGHT = 0.7
+SHORTLIST_SIZE = 40
+RETRIEVAL_MODES = ("hybrid", "dense")
+
+
+def get_retrieval_config():
+    """Read retrieval mode and fusion weights from CAREER_* environment variables."""
+    mode = os.environ.get("CAREER_RETRIEVAL_MODE", "hybrid").strip().lower()
+    if mode not in RETRIEVAL_MODES:
+        print(f"Unknown retrieval mode '{mode}', falling back to hybrid")
+        mode = "hybrid"
+    try:
+        lexical_weight = float(os.environ.get("CAREER_LEXICAL_WEIGHT", LEXICAL_WEIGHT))
+        semantic_weight = float(os.environ.get("CAREER_SEMANTIC_WEIGHT", SEMANTIC_WEIGHT))
+        shortlist_size = int(os.environ.get("CAREER_SHORTLIST_SIZE", SHORTLIST_SIZE))
+    except ValueError as e:
+        print(f"Invalid retrieval setting ({e}), using defaults")
+        lexical_weight, semantic_weight, shortlist_size = LEXICAL_WEIGHT, SEMANTIC_WEIGHT, SHORTLIST_SIZE
+    return {
+        "mode": mode,
+        "lexical_weight": lexical_weight,
+        "semantic_weight": semantic_weight,
+        "shortlist_size": max(1, shortlist_size),
+    }
+
+
+def build_lexical_text(name, details):
+    """Text indexed by the lexical stage: career name, skills and description."""
+    skills = details.get("skills", [])
+    if isinstance(skills, str):
+        skills = [skills]
+    return " ".join([name, " ".join(skills), details.get("description", "")])
+
+
+class LexicalIndex:
+    """Sparse TF-IDF inverted index over career texts."""
+
+    def __init__(self, texts):
+        # Same vectorizer setup as the classifier in train_model.py
+        self.vectorizer = TfidfVectorizer()
+        doc_term = self.vectorizer.fit_transform(texts).tocsc()
+        doc_term.sort_indices()
+
+        self.size = doc_term.shape[0]
+        self.vocabulary = self.vectorizer.vocabulary_
+        self.idf = self.vectorizer.idf_
+        self.analyzer = self.vectorizer.build_analyzer()
+
+        # Postings: for term t, docs are indices[indptr[t]:indptr[t + 1]]
+        self.indptr = doc_term.indptr
+        self.indices = doc_term.indices
+        self.weights = doc_term.data
+
+    def query_weights(self, text):
+        """Return l2-normalised (term_ids, weights) for a query string."""
+        counts = {}
+        for token in self.analyzer(text):
+            term = self.vocabulary.get(token)
+            if term is not None:
+                counts[term] = counts.get(term, 0) + 1
+        if not counts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        terms = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts)) * self.idf[terms]
+        weights /= np.linalg.norm(weights)
+        return terms, weights
+
+    def scores(self, text):
+        """Cosine similarity between the query and every indexed text."""
+        scores = np.zeros(self.size, dtype=np.float64)
+        terms, weights = self.query_weights(text)
+        for term, weight in zip(terms, weights):
+            start, end = self.indptr[term], self.indptr[term + 1]
+            scores[self.indices[start:end]] += weight * self.weights[start:end]
+        return scores
+
+
+class HybridRetriever:
+    """Two-stage retriever: lexical shortlist followed by embedding re-rank."""
+
+    def __init__(self, names, lexical_texts, embeddings,
+                 lexical_weight=LEXICAL_WEIGHT, semantic_weight=SEMANTIC_WEIGHT,
+                 shortlist_size=SHORTLIST_SIZE):
+        if len(names) != len(lexical_texts) or len(names) != len(embeddings):
+            raise ValueError("names, lexical_texts and embeddings must have the same length")
+
+        self.names = list(names)
+        self.positions = {name: idx for idx, name in enumerate(self.names)}
+        if not isinstance(embeddings, CompactEmbeddings):
+            embeddings = CompactEmbeddings.from_float(embeddings)
+        self.embeddings = embeddings
+        self.lexical_index = LexicalIndex(lexical_texts)
+        self.lexical_weight = lexical_weight
+        self.semantic_weight = semantic_weight
+        self.shortlist_size = shortlist_size
+
+    def candidate_rows(self, candidates=None):
+        if candidates is None:
+            return np.arange(len(self.names))
+        rows = [self.positions[name] for name in candidates if name in self.positions]
+        return np.asarray(sorted(rows), dtype=np.int64)
+
+    def shortlist(self, query_text, candidates=None, lexical=None):
+        """Stage 1: rows of the best lexical matches among the candidates."""
+        rows = self.candidate_rows(candidates)
+        if len(rows) <= self.shortlist_size:
+            return rows
+        if lexical is None:
+            lexical = self.lexical_index.scores(query_text)
+        top = np.argpartition(-lexical[rows], self.shortlist_size - 1)[:self.shortlist_size]
+        return rows[np.sort(top)]
+
+    def semantic_scores(self, query_embedding, rows):
+        return self.embeddings.scores(query_embedding, rows)
+
+    def dense_search_rows(self, query_embedding, candidates=None):
+        """Current path: score every candidate with the embedding model.
+        Returns (rows, scores) arrays."""
+        rows = self.candidate_rows(candidates)
+        return rows, self.semantic_scores(query_embedding, rows)
+
+    def search_rows(self, query_text, encode_query, candidates=None, include_rows=None):
+        """Stage 2: re-rank the shortlist with fused lexical + semantic scores.
+        Returns (rows, scores) arrays.
+
+        Rows in include_rows (eligible rows the caller boosts) are scored the
+        same way even if the lexical stage did not shortlist them.
+        encode_query is called lazily with query_text and must return a
+        normalised embedding; it is skipped when there is nothing to rank.
+        """
+        lexical = self.lexical_index.scores(query_text)
+        rows = self.shortlist(query_text, candidates, lexical)
+        if include_rows is not None and len(include_rows):
+            rows = np.union1d(rows, include_rows)
+        if not len(rows):
+            return rows, np.zeros(0, dtype=np.float32)
+
+        semantic = self.semantic_scores(encode_query(query_text), rows)
+        return rows, self.semantic_weight * semantic + self.lexical_weight * lexical[rows]
+
+    def as_dict(self, rows, scores):
+        return {self.names[row]: float(score) for row, score in zip(rows, scores)}
+
+    def dense_search(self, query_embedding, candidates=None):
+        return self.as_dict(*self.dense_search_rows(query_embedding, candidates))
+
+    def search(self, query_text, encode_query, candidates=None):
+        return self.as_dict(*self.search_rows(query_text, encode_query, candidates))
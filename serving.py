@@ -0,0 +1,457 @@
+"""Asyncio HTTP front for recommendations, resume PDFs and score charts.
+
+Cheap requests (health, metrics, recommendations already in the result
+cache) are answered on the event loop. Everything CPU-heavy goes to its own
+bounded queue with its own executor, so a burst of one kind of job cannot
+starve the others:
+
+    encode  engine.recommend on a cache miss    threads (torch releases the GIL)
+    pdf     ResumeBuilder.create_resume         processes
+    chart   charts.render_score_chart           processes (cached charts are served inline)
+
+A queue holding `depth` jobs (running + waiting) rejects more with 429 and a
+Retry-After estimate. Per-queue counters and wait/run latencies are served
+at GET /metrics.
+
+    POST /recommend  {"selections": {...}, "tenant": "..."}       -> JSON
+    POST /resume     {"user_data": {...}, "recommendations": [...]} -> application/pdf
+    POST /chart      {"recommendations": [...], "format": "png"}   -> image/png (or "svg")
+    GET  /metrics, GET /health
+
+Environment (per queue NAME = ENCODE, PDF, CHART):
+    CAREER_SERVE_<NAME>_WORKERS     executor size
+    CAREER_SERVE_<NAME>_DEPTH       jobs admitted before 429
+    CAREER_SERVE_CACHE_SIZE         cached recommendation results (default 1024)
+    CAREER_SERVE_CACHE_SECONDS      how long a cached result is served (default 300)
+
+    python serving.py --port 8080
+"""
+import argparse
+import asyncio
+import io
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+
+QUEUE_DEFAULTS = {
+    "encode": {"kind": "thread", "workers": 1, "depth": 64},
+    "pdf": {"kind": "process", "workers": 2, "depth": 8},
+    "chart": {"kind": "process", "workers": 1, "depth": 16},
+}
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_SECONDS = 300.0
+MAX_BODY_BYTES = 1 << 20
+LATENCY_WINDOW = 1000
+STATUS_TEXT = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 429: "Too Many Requests", 500: "Internal Server Error",
+}
+
+# Set once per worker process
+_resume_builder = None
+
+
+def get_queue_config():
+    """Queue settings with CAREER_SERVE_<NAME>_WORKERS / _DEPTH overrides."""
+    config = {}
+    for name, defaults in QUEUE_DEFAULTS.items():
+        settings = dict(defaults)
+        for key in ("workers", "depth"):
+            env_name = f"CAREER_SERVE_{name.upper()}_{key.upper()}"
+            try:
+                settings[key] = max(1, int(os.environ.get(env_name, settings[key])))
+            except ValueError:
+                print(f"Invalid {env_name}, using {settings[key]}")
+        config[name] = settings
+    return config
+
+
+def get_cache_settings():
+    try:
+        return (max(0, int(os.environ.get("CAREER_SERVE_CACHE_SIZE", DEFAULT_CACHE_SIZE))),
+                float(os.environ.get("CAREER_SERVE_CACHE_SECONDS", DEFAULT_CACHE_SECONDS)))
+    except ValueError as e:
+        print(f"Invalid result cache setting ({e}), using defaults")
+        return DEFAULT_CACHE_SIZE, DEFAULT_CACHE_SECONDS
+
+
+def timed_call(fn, *args):
+    """Run fn in the executor and report its own run time, so queue wait and
+    run time can be told apart even across processes."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def build_resume(user_data, career_data):
+    """Resume PDF bytes; one ResumeBuilder (and its cached template) per worker."""
+    global _resume_builder
+    if _resume_builder is None:
+        from resume_pdf import ResumeBuilder
+
+        _resume_builder = ResumeBuilder()
+    return _resume_builder.create_resume(user_data, career_data)
+
+
+def render_chart(recommendations, fmt):
+    from charts import render_score_chart
+
+    return render_score_chart(recommendations, fmt)
+
+
+def get_chart_stats():
+    from charts import get_chart_renderer
+
+    return get_chart_renderer().stats()
+
+
+def parse_recommendations(recommendations):
+    """[(career, score)] from a JSON list of [career, score] pairs."""
+    try:
+        return [(str(career), float(score)) for career, score in recommendations]
+    except (TypeError, ValueError):
+        raise HttpError(400, "recommendations must be a list of [career, score]")
+
+
+class QueueFull(Exception):
+    def __init__(self, queue, retry_after):
+        super().__init__(f"{queue} queue is full")
+        self.queue = queue
+        self.retry_after = retry_after
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class JobQueue:
+    """Bounded admission in front of one executor, with latency metrics."""
+
+    def __init__(self, name, kind="thread", workers=1, depth=8):
+        self.name = name
+        self.kind = kind
+        self.workers = workers
+        self.depth = depth
+        if kind == "process":
+            # spawn: the parent holds torch threads, which fork does not copy safely
+            self.executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            self.executor = ThreadPoolExecutor(workers, thread_name_prefix=f"serve-{name}")
+        self.outstanding = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_ms = deque(maxlen=LATENCY_WINDOW)
+        self.run_ms = deque(maxlen=LATENCY_WINDOW)
+
+    def retry_after(self):
+        """Seconds until a slot is likely free, from recent run times."""
+        run_seconds = (sum(self.run_ms) / len(self.run_ms) / 1000.0) if self.run_ms else 1.0
+        return max(1, math.ceil(run_seconds * self.outstanding / self.workers))
+
+    async def submit(self, fn, *args):
+        """Run fn(*args) in the executor, or raise QueueFull if depth jobs are already admitted."""
+        if self.outstanding >= self.depth:
+            self.rejected += 1
+            raise QueueFull(self.name, self.retry_after())
+        self.outstanding += 1
+        self.submitted += 1
+        start = time.perf_counter()
+        try:
+            result, run_seconds = await asyncio.get_running_loop().run_in_executor(
+                self.executor, timed_call, fn, *args
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.outstanding -= 1
+        total_ms = (time.perf_counter() - start) * 1000.0
+        self.completed += 1
+        self.run_ms.append(run_seconds * 1000.0)
+        self.wait_ms.append(max(0.0, total_ms - run_seconds * 1000.0))
+        return result
+
+    def metrics(self):
+        def percentiles(samples):
+            if not samples:
+                return {"p50_ms": None, "p95_ms": None}
+            values = np.fromiter(samples, dtype=float)
+            return {"p50_ms": float(np.percentile(values, 50)), "p95_ms": float(np.percentile(values, 95))}
+
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "depth": self.depth,
+            "outstanding": self.outstanding,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "wait": percentiles(self.wait_ms),
+            "run": percentiles(self.run_ms),
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ResultCache:
+    """LRU of recommendation results with a time limit, so catalog reloads show up."""
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE, max_age=DEFAULT_CACHE_SECONDS):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.max_age:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, value):
+        if self.max_size <= 0:
+            return
+        self.entries[key] = (time.monotonic(), value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+class RecommendationServer:
+    """Routes requests to the inline path or the job queues.
+
+    recommend(tenant, selections) is the engine call run on the encode
+    queue; it raises ValueError/KeyError for bad input or unknown tenants.
+    """
+
+    def __init__(self, recommend, queue_config=None, cache=None):
+        self.recommend = recommend
+        self.queues = {name: JobQueue(name, **settings) for name, settings in (queue_config or get_queue_config()).items()}
+        self.cache = cache or ResultCache(*get_cache_settings())
+        self.inline = 0
+        self.started = time.monotonic()
+        self.server = None
+
+    async def recommend_cached(self, tenant, selections):
+        """(recommendations, served from cache)."""
+        key = (tenant, json.dumps(selections, sort_keys=True))
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.inline += 1
+            return cached, True
+        try:
+            result = await self.queues["encode"].submit(self.recommend, tenant, selections)
+        except (KeyError, ValueError) as e:
+            raise HttpError(400, str(e))
+        result = [[career, round(float(score), 6)] for career, score in result]
+        self.cache.put(key, result)
+        return result, False
+
+    async def handle_recommend(self, body):
+        result, cached = await self.recommend_cached(body.get("tenant"), body.get("selections", body))
+        return 200, "application/json", {"recommendations": result, "cached": cached}
+
+    async def handle_resume(self, body):
+        user_data = body.get("user_data")
+        if not isinstance(user_data, dict):
+            raise HttpError(400, "user_data must be an object")
+        recommendations = body.get("recommendations")
+        if recommendations is None:
+            recommendations, _ = await self.recommend_cached(body.get("tenant"), user_data)
+        career_data = parse_recommendations(recommendations)
+        pdf = await self.queues["pdf"].submit(build_resume, user_data, career_data)
+        return 200, "application/pdf", pdf
+
+    async def handle_chart(self, body):
+        from charts import CHART_FORMATS, get_chart_renderer
+
+        fmt = body.get("format", "png")
+        if fmt not in CHART_FORMATS:
+            raise HttpError(400, f"format must be one of {sorted(CHART_FORMATS)}")
+        career_data = parse_recommendations(body.get("recommendations"))
+        # Charts already rendered are served inline; workers only draw new ones
+        renderer = get_chart_renderer()
+        image = renderer.cached(career_data, fmt)
+        if image is not None:
+            self.inline += 1
+        else:
+            image = await self.queues["chart"].submit(render_chart, career_data, fmt)
+            renderer.put(career_data, fmt, image)
+        return 200, CHART_FORMATS[fmt], image
+
+    def metrics(self):
+        return {
+            "uptime_s": time.monotonic() - self.started,
+            "inline": self.inline,
+            "result_cache": {"size": len(self.cache.entries), "hits": self.cache.hits, "misses": self.cache.misses},
+            "chart_cache": get_chart_stats(),
+            "queues": {name: queue.metrics() for name, queue in self.queues.items()},
+        }
+
+    async def dispatch(self, method, path, body):
+        """(status, content type, payload, extra headers) for one request."""
+        routes = {
+            "/recommend": self.handle_recommend,
+            "/resume": self.handle_resume,
+            "/chart": self.handle_chart,
+        }
+        try:
+            if path == "/health":
+                return 200, "application/json", {"status": "ok"}, {}
+            if path == "/metrics":
+                self.inline += 1
+                return 200, "application/json", self.metrics(), {}
+            if path not in routes:
+                raise HttpError(404, f"no route for {path}")
+            if method != "POST":
+                raise HttpError(405, "use POST")
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError as e:
+                raise HttpError(400, f"invalid JSON: {e}")
+            if not isinstance(data, dict):
+                raise HttpError(400, "body must be a JSON object")
+            status, content_type, payload = await routes[path](data)
+            return status, content_type, payload, {}
+        except QueueFull as e:
+            return 429, "application/json", {"error": str(e)}, {"Retry-After": str(e.retry_after)}
+        except HttpError as e:
+            return e.status, "application/json", {"error": str(e)}, {}
+        except Exception as e:
+            print(f"⚠️ {method} {path} failed: {e}")
+            return 500, "application/json", {"error": "internal error"}, {}
+
+    async def handle_connection(self, reader, writer):
+        """HTTP/1.1 with keep-alive; one request at a time per connection."""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    await write_response(writer, e.status, "application/json", {"error": str(e)}, {}, False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, content_type, payload, extra = await self.dispatch(method, path, body)
+                await write_response(writer, status, content_type, payload, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8080):
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        for queue in self.queues.values():
+            queue.shutdown()
+
+
+async def read_request(reader):
+    """(method, path, headers, body) of the next request, or None at end of stream."""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, f"body over {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], headers, body
+
+
+async def write_response(writer, status, content_type, payload, extra_headers, keep_alive):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    head = io.StringIO()
+    head.write(f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n")
+    head.write(f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n")
+    head.write(f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+    for name, value in extra_headers.items():
+        head.write(f"{name}: {value}\r\n")
+    head.write("\r\n")
+    writer.write(head.getvalue().encode("latin-1") + body)
+    await writer.drain()
+
+
+def build_recommend(tenants=False):
+    """The engine call for the encode queue: the default catalog, or the
+    catalog registry when requests name tenants."""
+    from recommender import RecommendationEngine, normalize_selections
+
+    if tenants:
+        from catalog_registry import DEFAULT_TENANT, CatalogRegistry
+
+        registry = CatalogRegistry()
+
+        def recommend(tenant, selections):
+            return registry.recommend(tenant or DEFAULT_TENANT, normalize_selections(selections))
+    else:
+        engine = RecommendationEngine.load()
+
+        def recommend(tenant, selections):
+            return engine.recommend(normalize_selections(selections))
+    return recommend
+
+
+async def serve(host, port, tenants=False):
+    server = RecommendationServer(build_recommend(tenants))
+    await server.start(host, port)
+    print(f"✅ Serving on http://{host}:{port} "
+          f"({', '.join(f'{name}: {q.workers} {q.kind}(s), depth {q.depth}' for name, q in server.queues.items())})")
+    try:
+        await server.server.serve_forever()
+    finally:
+        server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recommendations, resumes and charts over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--tenants", action="store_true", help="route requests' \"tenant\" through the catalog registry")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.tenants))
+    except KeyboardInterrupt:
+        print("Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Style registry compiled into the application stylesheet.
+
+Widget builders tag widgets with an object name or a ``styleClass`` dynamic
+property instead of calling setStyleSheet per instance, so Qt parses one
+sheet for the whole window.
+
+Cards whose old inline sheet used a bare ``QFrame { ... }`` selector also
+styled their QFrame descendants (QLabel is a QFrame); those rules keep a
+descendant selector so the rendering stays the same.
+"""
+STYLE_PROPERTY = "styleClass"
+
+WIDGET_STYLES = {}
+
+
+def register_style(selector, declarations):
+    """Add a rule to the registry; selectors must be unique."""
+    if selector in WIDGET_STYLES:
+        raise ValueError(f"Style already registered for {selector!r}")
+    WIDGET_STYLES[selector] = declarations.strip()
+
+
+def style_class(widget_type, name, pseudo=""):
+    """Selector for widgets of widget_type tagged with set_style_class(name)."""
+    return f'{widget_type}[{STYLE_PROPERTY}="{name}"]{pseudo}'
+
+
+def set_style_class(widget, name, **properties):
+    """Tag a widget with a registry class (plus optional extra properties)."""
+    widget.setProperty(STYLE_PROPERTY, name)
+    for key, value in properties.items():
+        widget.setProperty(key, value)
+    return widget
+
+
+def compile_stylesheet(base, rules=None):
+    """Append the registered rules to a base stylesheet, in registration order."""
+    rules = WIDGET_STYLES if rules is None else rules
+    compiled = [base.rstrip(), "", "/* Registered widget styles */"]
+    for selector, declarations in rules.items():
+        body = "\n".join(f"    {line.strip()}" for line in declarations.splitlines() if line.strip())
+        compiled.append(f"{selector} {{\n{body}\n}}\n")
+    return "\n".join(compiled)
+
+
+# ---------------- RESULTS PAGE ----------------
+register_style(style_class("QLabel", "pageHeader"), """
+    font-size: clamp(20px, 3vw, 24px);
+    font-weight: bold;
+    color: #60a5fa;
+    padding: 15px;
+    text-align: center;
+""")
+
+register_style(style_class("QLabel", "scoreNote"), "font-size: 12px; color: #94a3b8; padding: 0 15px;")
+
+# create_career_card / create_stat_badge
+register_style(f'{style_class("QFrame", "rankBadge")}, {style_class("QFrame", "rankBadge")} QFrame', """
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #f59e0b, stop:1 #fbbf24);
+    border-radius: 30px;
+""")
+register_style(style_class("QLabel", "rankLabel"), """
+    font-size: 14px;
+    font-weight: bold;
+    color: white;
+    text-align: center;
+""")
+register_style(style_class("QLabel", "rankScore"), """
+    font-size: 11px;
+    color: white;
+    text-align: center;
+""")
+register_style(style_class("QLabel", "cardDescription"), """
+    font-size: 12px; color: #cbd5e1; line-height: 1.3;
+""")
+register_style(style_class("QLabel", "statBadge"), """
+    background: rgba(59, 130, 246, 0.3);
+    border-radius: 6px;
+    padding: 6px 10px;
+    font-size: 10px;
+    color: #bfdbfe;
+""")
+
+# display_details and its helpers
+register_style(style_class("QLabel", "detailsHeader"), """
+    font-size: clamp(16px, 2.5vw, 18px); font-weight: bold; color: #fbbf24;
+""")
+register_style(style_class("QPushButton", "roadmapButton"), """
+    background-color: #3b82f6;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: bold;
+""")
+register_style(style_class("QPushButton", "roadmapButton", ":hover"), "background-color: #2563eb;")
+register_style(style_class("QPushButton", "roadmapButton", ":pressed"), "background-color: #1d4ed8;")
+register_style(style_class("QPushButton", "collegeButton"), """
+    background-color: #2c2c2c;
+    color: #f5f5f5;
+    border: 1px solid rgba(255, 255, 255, 0.15);
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: bold;
+""")
+register_style(style_class("QPushButton", "collegeButton", ":hover"), "background-color: #3a3a3a;")
+register_style(style_class("QLabel", "detailIcon"), "font-size: 12px;")
+register_style(style_class("QLabel", "detailContent"), "font-size: 12px; color: #e5e7eb;")
+
+PROS_CONS_TONES = {"positive": "#10b981", "negative": "#ef4444"}
+for tone, color in PROS_CONS_TONES.items():
+    frame = f'{style_class("QFrame", "prosCons")}[tone="{tone}"]'
+    register_style(f"{frame}, {frame} QFrame", f"""
+        border: 1px solid {color};
+        border-radius: 10px;
+        padding: 12px;
+    """)
+    register_style(f'{style_class("QLabel", "prosConsTitle")}[tone="{tone}"]', f"""
+        font-size: 13px; font-weight: bold; color: {color};
+    """)
+register_style(f'{style_class("QFrame", "prosCons")} {style_class("QLabel", "prosConsItem")}', """
+    font-size: 11px; color: #e5e7eb; padding: 2px 0;
+""")
+
+register_style("QFrame#pathsFrame", """
+    background-color: #2a2a2a;
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 16px;
+    padding: 18px;
+""")
+register_style(style_class("QLabel", "pathsTitle"), "font-size: 14px; font-weight: bold; color: #fdfdfd;")
+register_style(f'{style_class("QFrame", "pathCard")}, {style_class("QFrame", "pathCard")} QFrame', """
+    background-color: #1f1f1f;
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 12px;
+    padding: 12px;
+""")
+register_style(style_class("QLabel", "pathName"), "font-size: 13px; font-weight: bold; color: #f0f0f0;")
+register_style(style_class("QLabel", "pathDescription"), "font-size: 12px; color: #d4d4d4;")
+
+# display_resume_builder
+register_style(style_class("QLabel", "resumeHeader"), """
+    font-size: clamp(20px, 3vw, 24px);
+    font-weight: bold;
+    color: #60a5fa;
+    text-align: center;
+    padding: 10px;
+""")
+register_style(style_class("QLabel", "resumeDescription"), """
+    font-size: 14px; color: #cbd5e1; line-height: 1.5; text-align: center;
+""")
+register_style(style_class("QLabel", "featuresTitle"), "font-size: 18px; font-weight: bold; color: #fbbf24;")
+register_style(style_class("QLabel", "featureItem"), "font-size: 14px; color: #e5e7eb; padding: 5px 0;")
+register_style(style_class("QPushButton", "generateResume"), """
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #10b981, stop:1 #34d399);
+    color: white;
+    font-weight: bold;
+    font-size: 16px;
+    border-radius: 12px;
+""")
+register_style(style_class("QPushButton", "generateResume", ":hover"), """
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #059669, stop:1 #10b981);
+""")
+
+
+# ---------------- ROADMAP DIALOG ----------------
+register_style("QDialog#roadmapDialog", "background-color: #0a0e1a;")
+register_style(style_class("QLabel", "roadmapDialogTitle"), """
+    font-size: 20px; font-weight: bold; color: #fbbf24; padding: 10px;
+""")
+register_style("QDialog#roadmapDialog QFrame#roadmapFrame", """
+    background-color: #0d1526;
+    border: 1px solid #1d2a3f;
+    border-radius: 12px;
+    padding: 20px;
+""")
+register_style("QDialog#roadmapDialog QFrame#specialtyFrame", """
+    background-color: #101a2f;
+    border: 1px solid #243453;
+    border-radius: 12px;
+    padding: 20px;
+""")
+register_style(style_class("QLabel", "roadmapSectionTitle"), """
+    font-size: 16px; font-weight: bold; color: #4ade80; margin-bottom: 10px;
+""")
+register_style(style_class("QLabel", "specialtySectionTitle"), """
+    font-size: 16px; font-weight: bold; color: #93c5fd; margin-bottom: 10px;
+""")
+register_style(style_class("QLabel", "roadmapStepNumber"), """
+    font-size: 14px; font-weight: bold; color: #60a5fa; min-width: 30px;
+""")
+register_style(style_class("QLabel", "roadmapStepText"), "font-size: 13px; color: #e2e8f0;")
+register_style(f'{style_class("QFrame", "specialtyCard")}, {style_class("QFrame", "specialtyCard")} QFrame', """
+    background-color: #111f36;
+    border-radius: 10px;
+    border: 1px solid #1e293b;
+    padding: 15px;
+""")
+register_style(style_class("QLabel", "specialtyName"), """
+    font-size: 14px; font-weight: bold; color: #fcd34d; margin-bottom: 5px;
+""")
+register_style(style_class("QLabel", "specialtyStepNumber"), """
+    font-size: 12px; font-weight: bold; color: #60a5fa; min-width: 25px;
+""")
+register_style(style_class("QLabel", "specialtyStepText"), "font-size: 12px; color: #cbd5f5;")
+register_style(style_class("QPushButton", "roadmapCloseButton"), """
+    background-color: #3b82f6;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 30px;
+    font-size: 14px;
+    font-weight: bold;
+""")
+register_style(style_class("QPushButton", "roadmapCloseButton", ":hover"), "background-color: #2563eb;")
+
+
+# ---------------- COLLEGES DIALOG ----------------
+register_style("QDialog#collegesDialog", "background-color: #1f1f1f;")
+register_style(style_class("QLabel", "collegesDialogTitle"), "font-size: 18px; font-weight: bold; color: #f5f5f5;")
+register_style(f'{style_class("QFrame", "collegeCard")}, {style_class("QFrame", "collegeCard")} QFrame', """
+    background-color: #2a2a2a;
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 12px;
+    padding: 14px;
+""")
+register_style(style_class("QLabel", "collegeName"), "font-size: 15px; font-weight: bold; color: #f5f5f5;")
+register_style(style_class("QLabel", "collegeExam"), "font-size: 13px; color: #d4d4d4;")
+register_style(style_class("QLabel", "collegeHighlights"), "font-size: 12px; color: #c9c9c9;")
+register_style(style_class("QPushButton", "collegesCloseButton"), """
+    background-color: #2c2c2c;
+    color: #f5f5f5;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 30px;
+    font-weight: bold;
+""")
+register_style(style_class("QPushButton", "collegesCloseButton", ":hover"), "background-color: #3a3a3a;")
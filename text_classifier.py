@@ -0,0 +1,286 @@
+"""TF-IDF + linear classifier inference from plain arrays, without sklearn.
+
+train_model.py fits Pipeline([("tfidf", TfidfVectorizer()), ("clf", LinearSVC())]).
+export_pipeline() turns the fitted pipeline into JSON (vectorizer settings,
+vocabulary in column order, classes) and NumPy arrays (idf, coef,
+intercept), which build_artifacts.py stores in the artifact bundle.
+TextClassifier scores from those arrays directly, so the app never
+unpickles a model and never imports sklearn to classify text.
+
+A batch is scored with one vocabulary dict lookup per token, then
+vectorised NumPy: the term counts of the whole batch come from one sort of
+(row, column) keys into a CSR matrix (SparseRows), tf/idf weighting and
+normalisation work on its data array, and the decision function gathers
+and sums coefficient rows per text.
+
+Only the vectorizer settings the word analyzer needs are supported; export
+fails with ValueError for anything else (custom tokenizers, char n-grams,
+accent stripping) rather than producing a model that scores differently.
+check_parity asserts that an export scores like its pipeline; run it with
+
+    python text_classifier.py
+    python text_classifier.py --model career_model.pkl
+"""
+import argparse
+import re
+
+import numpy as np
+
+
+CLASSIFIER_FORMAT_VERSION = 1
+CLASSIFIER_SECTIONS = ("classifier/config", "classifier/idf", "classifier/coef", "classifier/intercept")
+DEFAULT_TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+DOT_BLOCK_ROWS = 1024
+# Largest decision_function difference check_parity accepts
+PARITY_TOLERANCE = 1e-9
+# Rows at least this dense are multiplied as dense blocks (BLAS) rather than
+# by gathering a coefficient row per term
+DENSE_DOT_MIN_DENSITY = 1 / 32
+# TfidfVectorizer settings that must have these values to be exported
+UNSUPPORTED_DEFAULTS = {
+    "analyzer": "word", "preprocessor": None, "tokenizer": None, "strip_accents": None,
+    "input": "content", "encoding": "utf-8", "decode_error": "strict",
+}
+
+
+def export_pipeline(model):
+    """(config, arrays) for a fitted TF-IDF + linear classifier pipeline."""
+    steps = list(model.named_steps.values()) if hasattr(model, "named_steps") else list(model)
+    if len(steps) != 2:
+        raise ValueError("Expected a (TfidfVectorizer, linear classifier) pipeline")
+    vectorizer, classifier = steps
+    params = vectorizer.get_params()
+    for name, expected in UNSUPPORTED_DEFAULTS.items():
+        if params.get(name) != expected:
+            raise ValueError(f"Cannot export TfidfVectorizer with {name}={params.get(name)!r}")
+
+    vocabulary = [None] * len(vectorizer.vocabulary_)
+    for term, column in vectorizer.vocabulary_.items():
+        vocabulary[column] = term
+    stop_words = vectorizer.get_stop_words()
+    config = {
+        "version": CLASSIFIER_FORMAT_VERSION,
+        "classes": [str(label) for label in classifier.classes_],
+        "vocabulary": vocabulary,
+        "lowercase": bool(params["lowercase"]),
+        "token_pattern": params["token_pattern"],
+        "ngram_range": list(params["ngram_range"]),
+        "stop_words": sorted(stop_words) if stop_words else [],
+        "binary": bool(params["binary"]),
+        "sublinear_tf": bool(params["sublinear_tf"]),
+        "use_idf": bool(params["use_idf"]),
+        "norm": params["norm"],
+    }
+    arrays = {
+        "idf": np.asarray(vectorizer.idf_ if params["use_idf"] else np.ones(len(vocabulary)), dtype=np.float64),
+        "coef": np.ascontiguousarray(classifier.coef_, dtype=np.float64),
+        "intercept": np.atleast_1d(np.asarray(classifier.intercept_, dtype=np.float64)),
+    }
+    return config, arrays
+
+
+def add_to_bundle(writer, model):
+    """Export model into a BundleWriter as classifier/* sections."""
+    config, arrays = export_pipeline(model)
+    writer.add_json("classifier/config", config)
+    for name, array in arrays.items():
+        writer.add_array(f"classifier/{name}", array)
+
+
+class SparseRows:
+    """Minimal CSR matrix: row i holds data[indptr[i]:indptr[i + 1]] at
+    columns indices[indptr[i]:indptr[i + 1]]."""
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def dot(self, dense, block_rows=DOT_BLOCK_ROWS):
+        """self @ dense for a dense (columns x k) matrix, a block of texts at a
+        time so the intermediates stay bounded. Dense enough rows (a small
+        vocabulary) are scattered into a dense block and multiplied in one
+        matmul; otherwise each term's row of dense is scaled and summed per
+        text."""
+        out = np.zeros((self.shape[0], dense.shape[1]), dtype=np.result_type(self.data, dense))
+        if self.nnz >= self.shape[0] * self.shape[1] * DENSE_DOT_MIN_DENSITY:
+            for start in range(0, self.shape[0], block_rows):
+                stop = min(start + block_rows, self.shape[0])
+                out[start:stop] = self.dense_block(start, stop) @ dense
+            return out
+        for start in range(0, self.shape[0], block_rows):
+            stop = min(start + block_rows, self.shape[0])
+            begin, end = self.indptr[start], self.indptr[stop]
+            if begin == end:
+                continue
+            contributions = dense[self.indices[begin:end]] * self.data[begin:end, None]
+            starts = self.indptr[start:stop] - begin
+            filled = np.flatnonzero(self.indptr[start + 1:stop + 1] > self.indptr[start:stop])
+            out[start + filled] = np.add.reduceat(contributions, starts[filled], axis=0)
+        return out
+
+    def dense_block(self, start, stop):
+        """Rows start:stop as a dense array."""
+        begin, end = self.indptr[start], self.indptr[stop]
+        rows = np.repeat(np.arange(stop - start), np.diff(self.indptr[start:stop + 1]))
+        width = self.shape[1]
+        return np.bincount(rows * width + self.indices[begin:end], weights=self.data[begin:end],
+                           minlength=(stop - start) * width).reshape(stop - start, width)
+
+    def toarray(self):
+        matrix = np.zeros(self.shape, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        matrix[rows, self.indices] = self.data
+        return matrix
+
+
+class TextClassifier:
+    """Sparse TF-IDF transform and linear decision function over a batch."""
+
+    def __init__(self, config, idf, coef, intercept):
+        if config.get("version") != CLASSIFIER_FORMAT_VERSION:
+            raise ValueError(f"Unsupported classifier format: {config.get('version')}")
+        self.classes = np.asarray(config["classes"])
+        self.vocabulary = {term: column for column, term in enumerate(config["vocabulary"])}
+        self.lowercase = config.get("lowercase", True)
+        self.token_pattern = re.compile(config.get("token_pattern") or DEFAULT_TOKEN_PATTERN)
+        self.ngram_range = tuple(config.get("ngram_range", (1, 1)))
+        self.stop_words = frozenset(config.get("stop_words", ()))
+        self.unigrams_only = self.ngram_range == (1, 1) and not self.stop_words
+        self.binary = config.get("binary", False)
+        self.sublinear_tf = config.get("sublinear_tf", False)
+        self.norm = config.get("norm", "l2")
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.coef = np.asarray(coef, dtype=np.float64)
+        # Rows gathered per term in the sparse product
+        self.coef_t = np.ascontiguousarray(self.coef.T)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        if self.coef.shape[1] != len(self.vocabulary) or self.idf.shape[0] != len(self.vocabulary):
+            raise ValueError("Classifier arrays do not match the vocabulary")
+
+    @classmethod
+    def from_bundle(cls, bundle):
+        return cls(bundle.json("classifier/config"), bundle.array("classifier/idf"),
+                   bundle.array("classifier/coef"), bundle.array("classifier/intercept"))
+
+    @classmethod
+    def from_pipeline(cls, model):
+        config, arrays = export_pipeline(model)
+        return cls(config, arrays["idf"], arrays["coef"], arrays["intercept"])
+
+    def analyze(self, text):
+        """Terms of text as the word analyzer produces them."""
+        tokens = self.token_pattern.findall(text.lower() if self.lowercase else text)
+        if self.unigrams_only:
+            return tokens
+        if self.stop_words:
+            tokens = [token for token in tokens if token not in self.stop_words]
+        low, high = self.ngram_range
+        if high == 1:
+            return tokens
+        terms = list(tokens) if low == 1 else []
+        for n in range(max(2, low), high + 1):
+            terms.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return terms
+
+    def columns(self, texts):
+        """(vocabulary column per known term, terms kept per text) for a batch."""
+        lookup = self.vocabulary.get
+        columns = []
+        lengths = np.empty(len(texts), dtype=np.intp)
+        for row, text in enumerate(texts):
+            found = [column for column in map(lookup, self.analyze(text)) if column is not None]
+            columns.extend(found)
+            lengths[row] = len(found)
+        return np.asarray(columns, dtype=np.int64), lengths
+
+    def transform(self, texts):
+        """TF-IDF rows of texts as a SparseRows matrix, normalised as the
+        vectorizer does."""
+        columns, lengths = self.columns(texts)
+        width = len(self.vocabulary)
+        # One sort of (row, column) keys counts every term of the batch
+        keys, counts = np.unique(np.repeat(np.arange(len(texts), dtype=np.int64), lengths) * width + columns,
+                                 return_counts=True)
+        rows, indices = np.divmod(keys, width)
+        data = counts.astype(np.float64)
+        if self.binary:
+            data[:] = 1.0
+        elif self.sublinear_tf:
+            data = np.log(data) + 1.0
+        data *= self.idf[indices]
+        if self.norm in ("l1", "l2"):
+            weights = np.abs(data) if self.norm == "l1" else data * data
+            lengths = np.bincount(rows, weights=weights, minlength=len(texts))
+            if self.norm == "l2":
+                lengths = np.sqrt(lengths)
+            lengths[lengths == 0] = 1.0
+            data /= lengths[rows]
+        indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(texts)), out=indptr[1:])
+        return SparseRows(indptr, indices, data, (len(texts), width))
+
+    def decision_function(self, texts):
+        """Class scores like LinearSVC.decision_function (1-D for two classes)."""
+        scores = self.transform(texts).dot(self.coef_t)
+        scores += self.intercept
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def predict(self, texts):
+        scores = self.decision_function(texts)
+        if scores.ndim == 1:
+            return self.classes[(scores > 0).astype(np.intp)]
+        return self.classes[scores.argmax(axis=1)]
+
+
+def load_text_classifier(bundle):
+    """TextClassifier from an artifact bundle, or None if it has none."""
+    if bundle is None or any(name not in bundle for name in CLASSIFIER_SECTIONS):
+        return None
+    return TextClassifier.from_bundle(bundle)
+
+
+def check_parity(model, texts, tolerance=PARITY_TOLERANCE):
+    """Raise AssertionError unless the arrays exported from a fitted pipeline
+    score texts like model.decision_function (to tolerance) and predict the
+    same classes. Returns the largest score difference."""
+    classifier = TextClassifier.from_pipeline(model)
+    error = float(np.abs(model.decision_function(texts) - classifier.decision_function(texts)).max())
+    if error > tolerance:
+        raise AssertionError(f"Exported classifier differs from the pipeline by {error:.3g}")
+    if not (model.predict(texts) == classifier.predict(texts)).all():
+        raise AssertionError("Exported classifier predicts other classes than the pipeline")
+    return error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the exported classifier against its sklearn pipeline.")
+    parser.add_argument("--model", help="pickled pipeline (default: fit train_model.py's pipeline)")
+    args = parser.parse_args()
+
+    from train_model import build_dataset
+
+    texts, labels = build_dataset()
+    if args.model:
+        import joblib
+
+        model = joblib.load(args.model)
+    else:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.pipeline import Pipeline
+        from sklearn.svm import LinearSVC
+
+        model = Pipeline([("tfidf", TfidfVectorizer()), ("clf", LinearSVC())]).fit(texts, labels)
+    # Repeated terms, unknown words and an empty text on top of the training texts
+    texts = list(texts) + [f"{a} {b} {a}" for a, b in zip(texts, texts[1:])] + ["", "zzz unknown words"]
+    error = check_parity(model, texts)
+    print(f"✅ Exported classifier matches the pipeline on {len(texts)} texts (max score difference {error:.1e})")
+
+
+if __name__ == "__main__":
+    main()
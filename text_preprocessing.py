@@ -0,0 +1,164 @@
+"""Free-text preprocessing before a profile is embedded.
+
+The free text is Unicode-normalised, whitespace-collapsed and stripped of
+repeated sentences. If the profile then no longer fits the model's
+max_seq_length, the free text is split on sentence boundaries into chunks
+that each fit alongside the selections; the chunks are encoded in one batch
+and pooled (see RecommendationEngine.encode_query) instead of everything
+past the limit being silently truncated.
+
+Token counts come from the fast (Rust) tokenizer in the bundled
+tokenizer.json (from the artifact bundle when there is one), so they match
+what the model sees.
+"""
+import json
+import os
+import re
+import threading
+import unicodedata
+
+from artifact_bundle import load_bundle
+from career_data import BASE_DIR, MODEL_DIR
+
+
+DEFAULT_MAX_SEQ_LENGTH = 256
+DEFAULT_MAX_CHUNKS = 8
+SPECIAL_TOKENS = 2  # [CLS] and [SEP]
+MIN_CHUNK_TOKENS = 32
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+_tokenizer = None
+_tokenizer_lock = threading.Lock()
+
+
+def get_max_chunks():
+    """Most chunks embedded per profile (CAREER_MAX_TEXT_CHUNKS); the rest is dropped."""
+    try:
+        return max(1, int(os.environ.get("CAREER_MAX_TEXT_CHUNKS", DEFAULT_MAX_CHUNKS)))
+    except ValueError:
+        return DEFAULT_MAX_CHUNKS
+
+
+def normalize_text(text):
+    """NFKC, no control characters, single spaces; line breaks are kept as
+    sentence boundaries."""
+    text = CONTROL_CHARS.sub(" ", unicodedata.normalize("NFKC", text or ""))
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def split_sentences(text):
+    return [sentence.strip() for sentence in SENTENCE_SPLIT.split(text) if sentence.strip()]
+
+
+def dedupe_sentences(sentences):
+    """Drop repeated sentences (case and punctuation-insensitive), keeping the first."""
+    seen = set()
+    unique = []
+    for sentence in sentences:
+        key = re.sub(r"\W+", " ", sentence.lower()).strip()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(sentence)
+    return unique
+
+
+def clean_free_text(text):
+    """Normalised free text without repeated sentences, on one line."""
+    return " ".join(dedupe_sentences(split_sentences(normalize_text(text))))
+
+
+class ProfileTokenizer:
+    """Token counting and chunking with the bundled fast tokenizer."""
+
+    def __init__(self, tokenizer, max_seq_length=DEFAULT_MAX_SEQ_LENGTH):
+        tokenizer.no_truncation()
+        tokenizer.no_padding()
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+
+    @classmethod
+    def from_dir(cls, model_dir=BASE_DIR):
+        from tokenizers import Tokenizer
+
+        tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        max_seq_length = DEFAULT_MAX_SEQ_LENGTH
+        try:
+            with open(os.path.join(model_dir, "sentence_bert_config.json"), "r", encoding="utf-8") as f:
+                max_seq_length = int(json.load(f).get("max_seq_length", max_seq_length))
+        except (OSError, ValueError):
+            pass
+        return cls(tokenizer, max_seq_length)
+
+    @classmethod
+    def from_bundle(cls, bundle):
+        from tokenizers import Tokenizer
+
+        tokenizer = Tokenizer.from_str(bundle.bytes("tokenizer/tokenizer.json").decode("utf-8"))
+        max_seq_length = DEFAULT_MAX_SEQ_LENGTH
+        if "tokenizer/sentence_bert_config.json" in bundle:
+            config = json.loads(bundle.bytes("tokenizer/sentence_bert_config.json").decode("utf-8"))
+            max_seq_length = int(config.get("max_seq_length", max_seq_length))
+        return cls(tokenizer, max_seq_length)
+
+    def count_tokens(self, text):
+        return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def chunk(self, text, budget, max_chunks=None):
+        """Split text into pieces of at most budget tokens, packing whole
+        sentences and cutting a sentence only if it is longer than budget.
+
+        Returns (chunks, token counts, tokens dropped beyond max_chunks).
+        """
+        max_chunks = max_chunks or get_max_chunks()
+        sentences = split_sentences(text)
+        if not sentences:
+            return [], [], 0
+        encodings = self.tokenizer.encode_batch(sentences, add_special_tokens=False)
+
+        pieces = []
+        for sentence, encoding in zip(sentences, encodings):
+            offsets = encoding.offsets
+            if len(offsets) <= budget:
+                pieces.append((sentence, len(offsets)))
+                continue
+            for start in range(0, len(offsets), budget):
+                window = offsets[start:start + budget]
+                pieces.append((sentence[window[0][0]:window[-1][1]], len(window)))
+
+        chunks, counts = [], []
+        current, current_tokens = [], 0
+        for piece, tokens in pieces:
+            if current and current_tokens + tokens > budget:
+                chunks.append(" ".join(current))
+                counts.append(current_tokens)
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+        if current:
+            chunks.append(" ".join(current))
+            counts.append(current_tokens)
+
+        dropped = sum(counts[max_chunks:])
+        return chunks[:max_chunks], counts[:max_chunks], dropped
+
+
+def get_profile_tokenizer():
+    """Shared ProfileTokenizer, or None if the tokenizers package or the
+    bundled tokenizer.json is unavailable (profiles are then not chunked)."""
+    global _tokenizer
+    if _tokenizer is None:
+        with _tokenizer_lock:
+            if _tokenizer is None:
+                try:
+                    bundle = load_bundle(MODEL_DIR)
+                    if bundle is not None and "tokenizer/tokenizer.json" in bundle:
+                        _tokenizer = ProfileTokenizer.from_bundle(bundle)
+                    else:
+                        _tokenizer = ProfileTokenizer.from_dir()
+                except Exception as e:
+                    print(f"Fast tokenizer unavailable ({e}), long free text will not be chunked")
+                    _tokenizer = False
+    return _tokenizer or None
@@ -0,0 +1,189 @@
+"""Torch runtime settings for CPU inference of the sentence transformer.
+
+Settings come from a JSON file named by CAREER_TORCH_CONFIG, overridden by
+CAREER_TORCH_* environment variables:
+
+    {"intra_op_threads": 2, "inter_op_threads": 1, "inference_mode": true, "compile": "none"}
+
+    CAREER_TORCH_THREADS           intra-op threads (0 = torch default, "auto" = CPUs - 1)
+    CAREER_TORCH_INTEROP_THREADS   inter-op threads (0 = torch default)
+    CAREER_TORCH_INFERENCE_MODE    1: torch.inference_mode(), 0: torch.no_grad()
+    CAREER_TORCH_COMPILE           none | compile (torch.compile) | trace (torch.jit.trace)
+
+"auto" leaves a core for the Qt thread. Compiled or traced models are
+checked against the eager model on a probe batch and dropped if they fail
+or disagree.
+"""
+import json
+import os
+from contextlib import contextmanager
+
+import numpy as np
+
+
+COMPILE_MODES = ("none", "compile", "trace")
+RUNTIME_DEFAULTS = {
+    "intra_op_threads": 0,
+    "inter_op_threads": 0,
+    "inference_mode": True,
+    "compile": "none",
+}
+RUNTIME_ENV = {
+    "intra_op_threads": "CAREER_TORCH_THREADS",
+    "inter_op_threads": "CAREER_TORCH_INTEROP_THREADS",
+    "inference_mode": "CAREER_TORCH_INFERENCE_MODE",
+    "compile": "CAREER_TORCH_COMPILE",
+}
+# Probe texts of different lengths, so padding and sequence length vary
+PROBE_TEXTS = [
+    "Stream: Science Field: Engineering & Technology",
+    "Stream: Commerce Field: Finance Role: Chartered Accountant Hobby: Reading Free time: Puzzles "
+    "Interest: Mathematics I enjoy working with numbers and explaining budgets to friends.",
+]
+PARITY_TOLERANCE = 1e-3
+
+
+def parse_threads(value):
+    if str(value).strip().lower() == "auto":
+        return max(1, (os.cpu_count() or 1) - 1)
+    return max(0, int(value))
+
+
+def parse_flag(value):
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_runtime_config(path=None):
+    """Runtime settings from the config file (path or CAREER_TORCH_CONFIG) and the environment."""
+    config = dict(RUNTIME_DEFAULTS)
+    path = path or os.environ.get("CAREER_TORCH_CONFIG")
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                config.update({key: value for key, value in json.load(f).items() if key in RUNTIME_DEFAULTS})
+        except (OSError, ValueError) as e:
+            print(f"Could not read torch config {path} ({e}), using defaults")
+
+    for key, env_name in RUNTIME_ENV.items():
+        if env_name in os.environ:
+            config[key] = os.environ[env_name]
+
+    try:
+        config["intra_op_threads"] = parse_threads(config["intra_op_threads"])
+        config["inter_op_threads"] = parse_threads(config["inter_op_threads"])
+    except ValueError as e:
+        print(f"Invalid torch thread setting ({e}), using torch defaults")
+        config["intra_op_threads"] = config["inter_op_threads"] = 0
+    if not isinstance(config["inference_mode"], bool):
+        config["inference_mode"] = parse_flag(config["inference_mode"])
+    config["compile"] = str(config["compile"]).strip().lower()
+    if config["compile"] not in COMPILE_MODES:
+        print(f"Unknown torch compile mode '{config['compile']}', falling back to none")
+        config["compile"] = "none"
+    return config
+
+
+def apply_threads(config):
+    """Set torch's thread pools. Inter-op threads can only be set before torch
+    runs any parallel work, so a late call keeps the current value."""
+    import torch
+
+    if config["intra_op_threads"]:
+        torch.set_num_threads(config["intra_op_threads"])
+    if config["inter_op_threads"] and torch.get_num_interop_threads() != config["inter_op_threads"]:
+        try:
+            torch.set_num_interop_threads(config["inter_op_threads"])
+        except RuntimeError as e:
+            print(f"Inter-op threads left at {torch.get_num_interop_threads()}: {e}")
+
+
+@contextmanager
+def grad_context(inference_mode=True):
+    import torch
+
+    with (torch.inference_mode() if inference_mode else torch.no_grad()):
+        yield
+
+
+def find_transformer(model):
+    """(module, attribute) holding the Hugging Face model inside a SentenceTransformer."""
+    import torch
+
+    module = model[0]
+    for attribute in ("model", "auto_model"):
+        if isinstance(module.__dict__.get("_modules", {}).get(attribute), torch.nn.Module):
+            return module, attribute
+    raise AttributeError("No transformer module found in the sentence transformer")
+
+
+def build_traced_transformer(transformer, tokenizer):
+    """torch.jit.trace of the Hugging Face model on (input_ids, attention_mask,
+    token_type_ids), wrapped to accept the keyword call the sentence
+    transformer makes and to return last_hidden_state the same way."""
+    import torch
+    from transformers.modeling_outputs import BaseModelOutput
+
+    example = tokenizer(PROBE_TEXTS, padding=True, return_tensors="pt")
+    inputs = (example["input_ids"], example["attention_mask"], example["token_type_ids"])
+    with torch.no_grad():
+        traced = torch.jit.trace(transformer, inputs, strict=False, check_trace=False)
+
+    class TracedTransformer(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.traced = traced
+            self.config = transformer.config
+
+        def forward(self, input_ids, attention_mask=None, token_type_ids=None, **kwargs):
+            if attention_mask is None:
+                attention_mask = torch.ones_like(input_ids)
+            if token_type_ids is None:
+                token_type_ids = torch.zeros_like(input_ids)
+            output = self.traced(input_ids, attention_mask, token_type_ids)
+            hidden = output["last_hidden_state"] if isinstance(output, dict) else output[0]
+            return BaseModelOutput(last_hidden_state=hidden)
+
+    return TracedTransformer()
+
+
+def optimize_model(model, mode):
+    """Compile or trace the transformer in place. Returns the mode in effect."""
+    if mode == "none":
+        return mode
+    import torch
+
+    reference = model.encode(PROBE_TEXTS, convert_to_numpy=True)
+    module, attribute = find_transformer(model)
+    eager = getattr(module, attribute)
+    try:
+        if mode == "compile":
+            optimized = torch.compile(eager, dynamic=True)
+        else:
+            optimized = build_traced_transformer(eager, model.tokenizer)
+        setattr(module, attribute, optimized)
+        candidate = model.encode(PROBE_TEXTS + PROBE_TEXTS[:1], convert_to_numpy=True)[:len(PROBE_TEXTS)]
+        if not np.allclose(candidate, reference, atol=PARITY_TOLERANCE):
+            raise ValueError("optimized embeddings differ from eager ones")
+    except Exception as e:
+        setattr(module, attribute, eager)
+        print(f"Torch {mode} unavailable ({e}), using the eager model")
+        return "none"
+    return mode
+
+
+class RuntimeModel:
+    """Sentence transformer whose encode() runs under the configured grad mode;
+    everything else is delegated to the wrapped model."""
+
+    def __init__(self, model, config=None):
+        self.model = model
+        self.config = config or get_runtime_config()
+        apply_threads(self.config)
+        self.compile_mode = optimize_model(model, self.config["compile"])
+
+    def encode(self, *args, **kwargs):
+        with grad_context(self.config["inference_mode"]):
+            return self.model.encode(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
@@ -0,0 +1,228 @@
+"""Lightweight span tracing for startup and the prediction pipeline.
+
+Disabled by default; when off, span() hands back a shared no-op object so the
+instrumented code pays one attribute check per span.
+
+Environment:
+    CAREER_TRACE=1              enable tracing
+    CAREER_TRACE_FILE=path      append every finished trace to this file
+    CAREER_TRACE_FORMAT=chrome  "chrome" (chrome://tracing / Perfetto) or "json"
+                                (one root trace per line)
+    CAREER_TRACE_BUFFER=100     number of recent traces kept in memory
+
+    with span("prediction", stream="Science"):
+        with span("encode"):
+            ...
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+DEFAULT_TRACE_BUFFER = 100
+TRACE_FORMATS = ("chrome", "json")
+
+
+class _NullSpan:
+    """Shared stand-in returned while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.children = []
+        self.start_ns = 0
+        self.end_ns = 0
+        self.thread_id = 0
+
+    @property
+    def duration_ms(self):
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set(self, **args):
+        """Attach extra key/values, e.g. result counts known only at the end."""
+        self.args.update(args)
+
+    def __enter__(self):
+        self.thread_id = threading.get_ident()
+        self.tracer._push(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._pop(self)
+        return False
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "start_ms": self.start_ns / 1e6,
+            "duration_ms": self.duration_ms,
+            "args": self.args,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class Tracer:
+    """Collects nested spans per thread and keeps the most recent root traces."""
+
+    def __init__(self, enabled=False, buffer_size=DEFAULT_TRACE_BUFFER, export_path=None, export_format="chrome"):
+        if export_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format {export_format!r}; expected one of {TRACE_FORMATS}")
+        self.enabled = enabled
+        self.export_path = export_path
+        self.export_format = export_format
+        self.traces = deque(maxlen=buffer_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Tracer configured from CAREER_TRACE_*; invalid values fall back to
+        the defaults rather than failing at import."""
+        buffer_size = os.environ.get("CAREER_TRACE_BUFFER", DEFAULT_TRACE_BUFFER)
+        try:
+            buffer_size = max(1, int(buffer_size))
+        except ValueError:
+            print(f"Invalid trace buffer size '{buffer_size}', falling back to {DEFAULT_TRACE_BUFFER}")
+            buffer_size = DEFAULT_TRACE_BUFFER
+        export_format = os.environ.get("CAREER_TRACE_FORMAT", "chrome").strip().lower()
+        if export_format not in TRACE_FORMATS:
+            print(f"Unknown trace format '{export_format}', falling back to chrome")
+            export_format = "chrome"
+        return cls(
+            enabled=os.environ.get("CAREER_TRACE", "").lower() in {"1", "true", "yes", "on"},
+            buffer_size=buffer_size,
+            export_path=os.environ.get("CAREER_TRACE_FILE") or None,
+            export_format=export_format,
+        )
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, args)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, span):
+        stack = self._stack()
+        if stack:
+            stack[-1].children.append(span)
+        stack.append(span)
+
+    def _pop(self, span):
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        if not stack:
+            with self._lock:
+                self.traces.append(span)
+                if self.export_path:
+                    self.append(span, self.export_path)
+
+    def recent(self, name=None):
+        """Finished root traces, oldest first, optionally filtered by name."""
+        with self._lock:
+            traces = list(self.traces)
+        return [trace for trace in traces if name is None or trace.name == name]
+
+    def clear(self):
+        with self._lock:
+            self.traces.clear()
+
+    def chrome_events(self, traces=None):
+        """Complete ("X") events in the Chrome trace event format, for the
+        given root traces or all recent ones."""
+        pid = os.getpid()
+        events = []
+
+        def visit(span):
+            events.append({
+                "name": span.name,
+                "ph": "X",
+                "ts": span.start_ns / 1000.0,
+                "dur": (span.end_ns - span.start_ns) / 1000.0,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.args,
+            })
+            for child in span.children:
+                visit(child)
+
+        for trace in self.recent() if traces is None else traces:
+            visit(trace)
+        return events
+
+    def append(self, trace, path):
+        """Append one finished root trace to path instead of rewriting the
+        file: Chrome's JSON array format (its closing bracket is optional),
+        or one JSON trace per line."""
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                if self.export_format == "chrome":
+                    if f.tell() == 0:
+                        f.write("[\n")
+                    for event in self.chrome_events([trace]):
+                        f.write(json.dumps(event, default=str) + ",\n")
+                else:
+                    f.write(json.dumps(trace.to_dict(), default=str) + "\n")
+        except OSError as e:
+            print(f"Could not write trace to {path}: {e}")
+
+    def export(self, path, export_format=None):
+        export_format = export_format or self.export_format
+        if export_format == "chrome":
+            payload = {"traceEvents": self.chrome_events(), "displayTimeUnit": "ms"}
+        else:
+            payload = [trace.to_dict() for trace in self.recent()]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, default=str)
+        os.replace(tmp_path, path)
+
+
+tracer = Tracer.from_env()
+
+
+def span(name, **args):
+    """Open a span on the global tracer (no-op unless CAREER_TRACE is set)."""
+    return tracer.span(name, **args)
+
+
+def traced(name=None):
+    """Decorator wrapping each call of a function in a span."""
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,5 +1,7 @@
 # train_model.py
 
+import os
+
 import joblib
 from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -147,7 +149,9 @@ def build_dataset():
     return X, y
 
 
-def train_and_save_model():
+def train_and_save_model(output_dir="."):
+    """Train the classifier and save career_model.pkl and career_details.pkl
+    into output_dir. Returns (model, career_details)."""
     X, y = build_dataset()
 
     # Pipeline: TF-IDF text features + Linear SVM classifier
@@ -159,8 +163,9 @@ def train_and_save_model():
     model.fit(X, y)
 
     # Save the model
-    joblib.dump(model, "career_model.pkl")
-    print("✅ Saved trained model to career_model.pkl")
+    model_path = os.path.join(output_dir, "career_model.pkl")
+    joblib.dump(model, model_path)
+    print(f"✅ Saved trained model to {model_path}")
 
     # Optional: extra details for each career label
     career_details = {
@@ -418,8 +423,10 @@ def train_and_save_model():
         },
     }
 
-    joblib.dump(career_details, "career_details.pkl")
-    print("✅ Saved career details to career_details.pkl")
+    details_path = os.path.join(output_dir, "career_details.pkl")
+    joblib.dump(career_details, details_path)
+    print(f"✅ Saved career details to {details_path}")
+    return model, career_details
 
 
 if __name__ == "__main__":